@@ -2,6 +2,7 @@
 
 from typing import Dict, Any
 from krivisio_tools.github.utils.llm_client import chat_with_llm
+from krivisio_tools.report_generation.app.services.agent_integration.prompt_engineering import compact_json, finalize_prompt
 import json
 
 
@@ -38,36 +39,28 @@ def classify_features_and_tech_stack(repos_data: Dict[str, Dict[str, list]]) ->
         }
     """
     prompt = f"""
-    You are an AI that classifies GitHub repository features and tech stacks
-    into three categories: Basic, Intermediate, and Advanced.
+You are an AI that classifies GitHub repository features and tech stacks
+into three categories: Basic, Intermediate, and Advanced.
 
-    Rules:
-    - Basic: Beginner-friendly, minimal setup, simple functionality.
-    - Intermediate: More complex, requires some programming knowledge, involves
-      multiple components or moderate setup.
-    - Advanced: High complexity, cutting-edge, scalable, heavy infrastructure or
-      advanced algorithms.
+Rules:
+- Basic: Beginner-friendly, minimal setup, simple functionality.
+- Intermediate: More complex, requires some programming knowledge, involves
+  multiple components or moderate setup.
+- Advanced: High complexity, cutting-edge, scalable, heavy infrastructure or
+  advanced algorithms.
 
-    Input data (from multiple repositories):
-    {repos_data}
+Input data (from multiple repositories):
+{compact_json(repos_data)}
 
-    Output must be strictly valid JSON with the following structure:
-    {{
-        "Basic": {{
-            "features": ["feature1", "feature2", ...],
-            "tech_stack": ["tech1", "tech2", ...]
-        }},
-        "Intermediate": {{
-            "features": ["feature1", "feature2", ...],
-            "tech_stack": ["tech1", "tech2", ...]
-        }},
-        "Advanced": {{
-            "features": ["feature1", "feature2", ...],
-            "tech_stack": ["tech1", "tech2", ...]
-        }}
-    }}
-    Do not include any explanations — output JSON only.
-    """
+Output must be strictly valid JSON with the following structure:
+{{
+  "Basic": {{"features": ["feature1", ...], "tech_stack": ["tech1", ...]}},
+  "Intermediate": {{"features": ["feature1", ...], "tech_stack": ["tech1", ...]}},
+  "Advanced": {{"features": ["feature1", ...], "tech_stack": ["tech1", ...]}}
+}}
+Do not include any explanations — output JSON only.
+"""
+    prompt = finalize_prompt("classify_repo_features", prompt)
 
     raw_response = chat_with_llm(prompt)
 
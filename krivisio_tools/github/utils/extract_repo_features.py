@@ -3,6 +3,7 @@
 from typing import List, Dict
 from github import Github
 from krivisio_tools.github.utils.llm_client import chat_with_llm
+from krivisio_tools.report_generation.app.services.agent_integration.prompt_engineering import finalize_prompt
 import json
 from concurrent.futures import ThreadPoolExecutor
 
@@ -38,22 +39,23 @@ def analyze_repo_with_llm(readme_content: str) -> Dict[str, List[str]]:
         dict: Contains 'features' and 'tech_stack' lists.
     """
     prompt = f"""
-    You are a system that extracts key project details from a GitHub README file.
-    From the following README content, extract:
-    1. Features: A concise bullet list of main features.
-    2. Tech Stack: A bullet list of programming languages, frameworks, and tools used.
-
-    Output must be valid JSON with the structure:
-    {{
-        "features": ["feature1", "feature2", ...],
-        "tech_stack": ["tech1", "tech2", ...]
-    }}
-
-    README content:
-    ---
-    {readme_content}
-    ---
-    """
+You are a system that extracts key project details from a GitHub README file.
+From the following README content, extract:
+1. Features: A concise bullet list of main features.
+2. Tech Stack: A bullet list of programming languages, frameworks, and tools used.
+
+Output must be valid JSON with the structure:
+{{
+    "features": ["feature1", "feature2", ...],
+    "tech_stack": ["tech1", "tech2", ...]
+}}
+
+README content:
+---
+{readme_content}
+---
+"""
+    prompt = finalize_prompt("extract_repo_features", prompt)
 
     raw_response = chat_with_llm(prompt)
 
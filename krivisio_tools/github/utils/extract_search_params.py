@@ -1,5 +1,6 @@
 from typing import Dict, Any
 from krivisio_tools.github.utils.llm_client import chat_with_llm
+from krivisio_tools.report_generation.app.services.agent_integration.prompt_engineering import finalize_prompt
 import json
 
 def extract_search_params_from_text(
@@ -12,33 +13,33 @@ def extract_search_params_from_text(
     """
 
     prompt = f"""
-    You are a system that extracts ONLY:
-    - query (string) — the search keywords
-    - category (string) — the programming language or topic
-
-    The extracted text may describe what kind of GitHub project a user wants.
-    Your output must be strictly valid JSON with only these keys (omit if not found):
-    - query
-    - category
-
-    Extract from the following text:
-    ---
-    {extracted_text}
-    ---
-
-    Output must be valid JSON with the structure:
-    {{
-        "query": "<query>",
-        "category": "<category>"
-    }}
-
-    Query must be such that it can be used in a GitHub search query.
-    Do not include small library or dependency names in the query.
-    Do not include multiple of the technology in the search query.
-    If required then use only one main technology in the query.
-    Category must be a programming language.
-
-    """
+You are a system that extracts ONLY:
+- query (string) — the search keywords
+- category (string) — the programming language or topic
+
+The extracted text may describe what kind of GitHub project a user wants.
+Your output must be strictly valid JSON with only these keys (omit if not found):
+- query
+- category
+
+Extract from the following text:
+---
+{extracted_text}
+---
+
+Output must be valid JSON with the structure:
+{{
+    "query": "<query>",
+    "category": "<category>"
+}}
+
+Query must be such that it can be used in a GitHub search query.
+Do not include small library or dependency names in the query.
+Do not include multiple of the technology in the search query.
+If required then use only one main technology in the query.
+Category must be a programming language.
+"""
+    prompt = finalize_prompt("extract_search_params", prompt)
 
     raw_response = chat_with_llm(prompt)
 
@@ -4,6 +4,8 @@ import shutil
 from github import Github
 from typing import Dict
 
+from krivisio_tools.project_structure_generator.utils.tree_converter import iter_paths
+
 
 def extract_repo_name(repo_url: str) -> str:
     """
@@ -23,22 +25,24 @@ def extract_repo_name(repo_url: str) -> str:
 
 def create_structure_local(base_path: str, structure: Dict):
     """
-    Recursively create folder and file structure locally.
-    
+    Create folder and file structure locally (iteratively, any depth).
+
+    For a scaffold without touching disk, see
+    `project_structure_generator.utils.archive_export`.
+
     Args:
         base_path (str): Path where structure should be created.
         structure (dict): Structure in JSON format.
     """
-    path = os.path.join(base_path, structure["name"])
-
-    if structure["type"] == "folder":
-        os.makedirs(path, exist_ok=True)
-        for child in structure.get("children", []):
-            create_structure_local(path, child)
-    elif structure["type"] == "file":
-        os.makedirs(os.path.dirname(path), exist_ok=True)
-        with open(path, "w", encoding="utf-8") as f:
-            f.write("")  # create empty file
+    os.makedirs(base_path, exist_ok=True)
+    for relative in iter_paths(structure):
+        path = os.path.join(base_path, relative)
+        if relative.endswith("/"):
+            # Folders are yielded before their contents
+            os.makedirs(path, exist_ok=True)
+        else:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("")  # create empty file
 
 
 def upload_structure_to_github(repo, base_path: str, github_path: str = ""):
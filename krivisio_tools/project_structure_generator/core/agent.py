@@ -1,9 +1,21 @@
 from typing import List, Dict, Optional
 from krivisio_tools.project_structure_generator.models.preferences import ProjectPreferences
-from krivisio_tools.project_structure_generator.services.llm_service import generate_directory_structure
-from krivisio_tools.project_structure_generator.services.cache_service import get_from_cache, save_to_cache
+from krivisio_tools.project_structure_generator.services.llm_service import generate_directory_structure, generate_structure_patch
+from krivisio_tools.project_structure_generator.services.hierarchical_service import (
+    generate_hierarchical_structure,
+    should_generate_hierarchically,
+)
+from krivisio_tools.project_structure_generator.services.cache_service import get_from_cache, save_to_cache, get_cache_stats
+from krivisio_tools.project_structure_generator.services.semantic_cache_service import (
+    find_semantic_match,
+    save_semantic_entry,
+    get_semantic_cache_stats,
+)
+from krivisio_tools.project_structure_generator.services.fragment_service import synthesize_structure
 from krivisio_tools.project_structure_generator.services.similarity_service import find_similar_examples
+from krivisio_tools.report_generation.app.core.config import SEMANTIC_CACHE_ENABLED, STRUCTURE_FRAGMENTS_ENABLED
 from krivisio_tools.project_structure_generator.services.validation_service import validate_structure
+from krivisio_tools.project_structure_generator.utils.tree_patch import apply_patch
 
 
 def run_structure_generation_agent(
@@ -12,17 +24,23 @@ def run_structure_generation_agent(
     tech_stack: List[str],
     preferences: ProjectPreferences,
     use_cache: bool = True,
-    use_similarity: bool = True
+    use_similarity: bool = True,
+    hierarchical: Optional[bool] = None,
+    use_fragments: bool = True
 ) -> Optional[Dict]:
     """
     Main agent function that coordinates the generation process.
 
     Args:
         project_description (str): Description of the user’s project.
+        features (List[str]): Requested features.
         tech_stack (List[str]): Tech/frameworks in use.
         preferences (ProjectPreferences): User preferences.
         use_cache (bool): Whether to reuse cached results.
         use_similarity (bool): Whether to use similar examples in prompt.
+        hierarchical (bool, optional): Generate a skeleton and then top-level
+            subtrees concurrently; defaults to STRUCTURE_HIERARCHICAL ("auto" = large requests).
+        use_fragments (bool): Compose standard stacks locally from tech-stack fragments.
 
     Returns:
         dict | None: Directory structure or None if generation failed.
@@ -32,29 +50,134 @@ def run_structure_generation_agent(
 
     # Step 1: Check cache
     if use_cache:
-        cached_result = get_from_cache(project_description, tech_stack, pref_dict)
+        cached_result = get_from_cache(project_description, features, tech_stack, pref_dict)
+        stats = get_cache_stats()
+        print(f"[Structure Cache] {stats['backend']}: hit ratio {stats['hit_ratio']:.0%}, {stats['size']} entries")
         if cached_result:
             print("⚡ Loaded from cache.")
             return cached_result
 
-    # Step 2: Retrieve similar examples
-    examples = find_similar_examples(project_description) if use_similarity else []
+        # Step 1b: Near-duplicate request worded differently
+        if SEMANTIC_CACHE_ENABLED:
+            semantic_result = find_semantic_match(project_description, features, tech_stack, pref_dict)
+            stats = get_semantic_cache_stats()
+            print(f"[Semantic Cache] hit rate {stats['hit_rate']:.0%}, "
+                  f"safeguard rejections {stats['safeguard_rejection_rate']:.0%}, {stats['size']} entries")
+            if semantic_result:
+                save_to_cache(project_description, features, tech_stack, pref_dict, semantic_result)
+                return semantic_result
 
-    # Step 3: Generate structure
-    structure = generate_directory_structure(
-        project_description=project_description,
-        features=features,
-        tech_stack=tech_stack,
-        preferences=preferences,
-        examples=examples
-    )
+    # Step 2: Compose standard stacks from fragments (LLM only for uncovered tech)
+    structure = None
+    if use_fragments and STRUCTURE_FRAGMENTS_ENABLED:
+        structure = synthesize_structure(project_description, features, tech_stack, preferences)
+
+    if not structure:
+        # Step 3: Retrieve similar examples
+        examples = find_similar_examples(project_description) if use_similarity else []
 
-    # Step 4: Validate structure
+        # Step 4: Generate structure (hierarchically for large projects)
+        if should_generate_hierarchically(features, tech_stack) if hierarchical is None else hierarchical:
+            structure = generate_hierarchical_structure(
+                project_description=project_description,
+                features=features,
+                tech_stack=tech_stack,
+                preferences=preferences,
+                examples=examples
+            )
+            if not structure:
+                print("⚠️ Hierarchical generation failed; falling back to a single call.")
+
+        if not structure:
+            structure = generate_directory_structure(
+                project_description=project_description,
+                features=features,
+                tech_stack=tech_stack,
+                preferences=preferences,
+                examples=examples
+            )
+
+    # Step 5: Validate structure
     if structure and validate_structure(structure):
-        # Step 5: Cache it for future use
+        # Step 6: Cache it for future use
         if use_cache:
-            save_to_cache(project_description, tech_stack, pref_dict, structure)
+            save_to_cache(project_description, features, tech_stack, pref_dict, structure)
+            if SEMANTIC_CACHE_ENABLED:
+                save_semantic_entry(project_description, features, tech_stack, pref_dict, structure)
         return structure
     else:
         print("❌ Structure generation failed or was invalid.")
         return None
+
+
+def run_structure_update_agent(
+    project_description: str,
+    features: List[str],
+    tech_stack: List[str],
+    preferences: ProjectPreferences,
+    previous_structure: Dict,
+    added_features: List[str],
+    removed_features: List[str],
+    use_cache: bool = True
+) -> Optional[Dict]:
+    """
+    Update an existing structure after features were added or removed.
+
+    Only a patch ("+ path" / "- path" lines) is requested from the LLM, so
+    response size and latency follow the size of the change rather than of
+    the project. The patch is applied and validated locally; if no usable
+    patch comes back, the structure is regenerated from scratch.
+
+    Args:
+        project_description (str): Description of the user’s project.
+        features (List[str]): Project features (added/removed ones are reconciled).
+        tech_stack (List[str]): Tech/frameworks in use.
+        preferences (ProjectPreferences): User preferences.
+        previous_structure (dict): Structure returned by an earlier call.
+        added_features (List[str]): Newly requested features.
+        removed_features (List[str]): Features dropped from the project.
+        use_cache (bool): Whether to reuse and store cached results.
+
+    Returns:
+        dict | None: Updated directory structure or None if it failed.
+    """
+    removed = set(removed_features)
+    current_features = [f for f in dict.fromkeys([*features, *added_features]) if f not in removed]
+    pref_dict = preferences.to_dict()
+
+    if not validate_structure(previous_structure):
+        print("⚠️ Previous structure is invalid; generating from scratch.")
+        return run_structure_generation_agent(project_description, current_features, tech_stack, preferences, use_cache)
+
+    if not added_features and not removed_features:
+        return previous_structure
+
+    if use_cache:
+        cached_result = get_from_cache(project_description, current_features, tech_stack, pref_dict)
+        if cached_result:
+            print("⚡ Loaded updated structure from cache.")
+            return cached_result
+
+    patch = generate_structure_patch(
+        project_description=project_description,
+        features=current_features,
+        tech_stack=tech_stack,
+        preferences=preferences,
+        previous_structure=previous_structure,
+        added_features=added_features,
+        removed_features=removed_features
+    )
+    structure = None
+    if patch:
+        structure, counts = apply_patch(previous_structure, *patch)
+        print(f"[Delta Update] +{counts['added']} -{counts['removed']} nodes, {counts['skipped']} skipped")
+
+    if not structure or not validate_structure(structure):
+        print("⚠️ Delta update failed; regenerating the full structure.")
+        return run_structure_generation_agent(project_description, current_features, tech_stack, preferences, use_cache)
+
+    if use_cache:
+        save_to_cache(project_description, current_features, tech_stack, pref_dict, structure)
+        if SEMANTIC_CACHE_ENABLED:
+            save_semantic_entry(project_description, current_features, tech_stack, pref_dict, structure)
+    return structure
@@ -0,0 +1,278 @@
+"""
+Structure fragments for common technology stacks.
+
+Trees are written in the indented-path format (see utils.path_format) and
+expanded by `services.fragment_service`. Placeholders:
+    {name}  feature module name in the fragment's naming style
+    {js}    "ts" when TypeScript is in the stack, otherwise "js"
+    {jsx}   "tsx" when TypeScript is in the stack, otherwise "jsx"
+
+Each framework fragment has:
+    kind      mount folder when several frameworks share a project
+    aliases   other spellings of the technology
+    base      files and folders of a fresh project
+    module    per-feature module (one per requested feature)
+    style     naming of module folders/files: "snake" or "kebab"
+    tests     test scaffold (include_tests), with module_test per feature
+    docker    container files (include_docker)
+"""
+
+from typing import Dict, List
+
+
+def get_framework_fragments() -> Dict[str, Dict]:
+    """Return framework fragments keyed by canonical technology name."""
+    return {
+        "django": {
+            "kind": "backend",
+            "aliases": ["django rest framework", "drf", "djangorestframework"],
+            "style": "snake",
+            "base": """
+                manage.py
+                requirements.txt
+                .env.example
+                config/
+                  __init__.py
+                  settings.py
+                  urls.py
+                  wsgi.py
+                  asgi.py
+                apps/
+                  __init__.py
+            """,
+            "module": """
+                apps/
+                  {name}/
+                    __init__.py
+                    apps.py
+                    models.py
+                    serializers.py
+                    views.py
+                    urls.py
+                    admin.py
+                    migrations/
+                      __init__.py
+            """,
+            "tests": """
+                pytest.ini
+                tests/
+                  __init__.py
+                  conftest.py
+            """,
+            "module_test": """
+                tests/
+                  test_{name}.py
+            """,
+            "docker": """
+                Dockerfile
+                .dockerignore
+            """,
+        },
+        "fastapi": {
+            "kind": "backend",
+            "aliases": ["fast api"],
+            "style": "snake",
+            "base": """
+                requirements.txt
+                .env.example
+                app/
+                  __init__.py
+                  main.py
+                  config.py
+                  database.py
+                  routers/
+                    __init__.py
+                  models/
+                    __init__.py
+                  schemas/
+                    __init__.py
+                  services/
+                    __init__.py
+            """,
+            "module": """
+                app/
+                  routers/
+                    {name}.py
+                  models/
+                    {name}.py
+                  schemas/
+                    {name}.py
+                  services/
+                    {name}.py
+            """,
+            "tests": """
+                pytest.ini
+                tests/
+                  __init__.py
+                  conftest.py
+            """,
+            "module_test": """
+                tests/
+                  test_{name}.py
+            """,
+            "docker": """
+                Dockerfile
+                .dockerignore
+            """,
+        },
+        "flask": {
+            "kind": "backend",
+            "aliases": [],
+            "style": "snake",
+            "base": """
+                requirements.txt
+                wsgi.py
+                .env.example
+                app/
+                  __init__.py
+                  config.py
+                  extensions.py
+                  models/
+                    __init__.py
+                  templates/
+                  static/
+            """,
+            "module": """
+                app/
+                  {name}/
+                    __init__.py
+                    routes.py
+                    forms.py
+                  models/
+                    {name}.py
+            """,
+            "tests": """
+                pytest.ini
+                tests/
+                  __init__.py
+                  conftest.py
+            """,
+            "module_test": """
+                tests/
+                  test_{name}.py
+            """,
+            "docker": """
+                Dockerfile
+                .dockerignore
+            """,
+        },
+        "express": {
+            "kind": "backend",
+            "aliases": ["express.js", "expressjs", "node", "node.js", "nodejs", "node/express", "node.js/express"],
+            "style": "kebab",
+            "base": """
+                package.json
+                .env.example
+                src/
+                  server.{js}
+                  app.{js}
+                  config/
+                    index.{js}
+                  routes/
+                    index.{js}
+                  controllers/
+                  models/
+                  middleware/
+                    error-handler.{js}
+            """,
+            "module": """
+                src/
+                  routes/
+                    {name}.routes.{js}
+                  controllers/
+                    {name}.controller.{js}
+                  models/
+                    {name}.model.{js}
+            """,
+            "tests": """
+                jest.config.{js}
+                tests/
+                  setup.{js}
+            """,
+            "module_test": """
+                tests/
+                  {name}.test.{js}
+            """,
+            "docker": """
+                Dockerfile
+                .dockerignore
+            """,
+        },
+        "react": {
+            "kind": "frontend",
+            "aliases": ["react.js", "reactjs"],
+            "style": "kebab",
+            "base": """
+                package.json
+                index.html
+                vite.config.{js}
+                public/
+                  favicon.ico
+                src/
+                  main.{jsx}
+                  App.{jsx}
+                  components/
+                  pages/
+                  hooks/
+                  services/
+                    api.{js}
+                  styles/
+                    index.css
+            """,
+            "module": """
+                src/
+                  features/
+                    {name}/
+                      index.{js}
+                      components/
+                      {name}.api.{js}
+            """,
+            "tests": """
+                src/
+                  setupTests.{js}
+            """,
+            "module_test": """
+                src/
+                  features/
+                    {name}/
+                      {name}.test.{jsx}
+            """,
+            "docker": """
+                Dockerfile
+                nginx.conf
+                .dockerignore
+            """,
+        },
+    }
+
+
+def get_supporting_technologies() -> List[str]:
+    """Technologies that need no folders of their own once a framework is chosen."""
+    return [
+        "python", "javascript", "typescript", "html", "css", "sass", "tailwind", "tailwindcss",
+        "postgresql", "postgres", "mysql", "sqlite", "mongodb", "redis", "sqlalchemy",
+        "celery", "jwt", "rest", "rest api", "graphql", "vite", "webpack", "redux",
+    ]
+
+
+def get_project_fragments() -> Dict[str, str]:
+    """Project-level fragments applied from ProjectPreferences flags."""
+    return {
+        "root": """
+            README.md
+            .gitignore
+        """,
+        "docs": """
+            docs/
+              index.md
+              architecture.md
+        """,
+        "docker": """
+            docker-compose.yml
+        """,
+        "ci_cd": """
+            .github/
+              workflows/
+                ci.yml
+        """,
+    }
@@ -0,0 +1,316 @@
+"""
+Approximate nearest-neighbour index for large example stores.
+
+An inverted-file (IVF) index in pure NumPy: vectors are assigned to the
+nearest of `n_lists` k-means centroids and a query only scans the `n_probe`
+closest lists. Vectors are stored int8-quantized with one float32 scale per
+row, a quarter of the float32 footprint.
+
+The index is built incrementally. Until `train_size` vectors have been added
+it behaves like an exact (quantized) scan; it then trains its centroids once
+and routes every later `add` to its list. Same interface as VectorIndex.
+"""
+
+import json
+import os
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from krivisio_tools.project_structure_generator.services.vector_index import normalize
+
+
+META_FILE = "ivf.json"
+
+
+def quantize(vectors: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Symmetric per-row int8 quantization; returns (codes, scales)."""
+    peaks = np.abs(vectors).max(axis=1)
+    peaks[peaks == 0] = 1.0
+    scales = (peaks / 127.0).astype(np.float32)
+    codes = np.rint(vectors / scales[:, None]).astype(np.int8)
+    return codes, scales
+
+
+class _InvertedList:
+    """Growable int8 codes, scales and row ids for one IVF cell."""
+
+    def __init__(self, dim: int, capacity: int = 64):
+        self.codes = np.empty((capacity, dim), dtype=np.int8)
+        self.scales = np.empty(capacity, dtype=np.float32)
+        self.ids = np.empty(capacity, dtype=np.int64)
+        self.count = 0
+
+    def append(self, codes: np.ndarray, scales: np.ndarray, ids: np.ndarray) -> None:
+        needed = self.count + len(ids)
+        if needed > len(self.ids) or not self.codes.flags.writeable:
+            capacity = max(len(self.ids), 64)
+            while capacity < needed:
+                capacity *= 2
+            for name in ("codes", "scales", "ids"):
+                old = getattr(self, name)
+                grown = np.empty((capacity,) + old.shape[1:], dtype=old.dtype)
+                grown[:self.count] = old[:self.count]
+                setattr(self, name, grown)
+        self.codes[self.count:needed] = codes
+        self.scales[self.count:needed] = scales
+        self.ids[self.count:needed] = ids
+        self.count = needed
+
+    def scores(self, query: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Approximate cosine scores of every row against a normalized query."""
+        n = self.count
+        return (self.codes[:n] @ query) * self.scales[:n], self.ids[:n]
+
+
+def _spherical_kmeans(vectors: np.ndarray, k: int, iterations: int = 10, seed: int = 0) -> np.ndarray:
+    """Cosine k-means; returns normalized centroids of shape (k, dim)."""
+    rng = np.random.default_rng(seed)
+    centroids = vectors[rng.choice(len(vectors), size=k, replace=False)].copy()
+    for _ in range(iterations):
+        assignment = np.argmax(vectors @ centroids.T, axis=1)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assignment, vectors)
+        empty = ~sums.any(axis=1)
+        if empty.any():
+            sums[empty] = vectors[rng.choice(len(vectors), size=int(empty.sum()), replace=False)]
+        centroids = normalize(sums)
+    return centroids
+
+
+class IVFIndex:
+    """
+    IVF index over int8-quantized, normalized vectors.
+
+    Args:
+        dim (int, optional): Vector dimension; inferred from the first insert.
+        n_lists (int): Number of k-means cells.
+        n_probe (int): Cells scanned per query.
+        train_size (int, optional): Vectors collected before training;
+            defaults to 16 per cell.
+    """
+
+    def __init__(
+        self,
+        dim: Optional[int] = None,
+        n_lists: int = 256,
+        n_probe: int = 8,
+        train_size: Optional[int] = None
+    ):
+        self.dim = dim
+        self.n_lists = n_lists
+        self.n_probe = n_probe
+        self.train_size = train_size or n_lists * 16
+        self.payloads: List[Dict] = []
+        self.centroids: Optional[np.ndarray] = None
+        self._lists: List[_InvertedList] = []
+        self._pending: Optional[_InvertedList] = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.payloads)
+
+    @property
+    def is_trained(self) -> bool:
+        return self.centroids is not None
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by codes, scales, ids and centroids."""
+        lists = self._lists + ([self._pending] if self._pending else [])
+        total = sum(l.codes.nbytes + l.scales.nbytes + l.ids.nbytes for l in lists)
+        return total + (self.centroids.nbytes if self.centroids is not None else 0)
+
+    def add(self, vector: Sequence[float], payload: Dict) -> int:
+        """Add one vector; returns its row id."""
+        return self.add_batch([vector], [payload])[0]
+
+    def add_batch(self, vectors: Sequence[Sequence[float]], payloads: Sequence[Dict]) -> List[int]:
+        """
+        Add many vectors, training the centroids once enough have arrived.
+
+        Returns:
+            List[int]: Row ids of the new entries.
+        """
+        matrix = normalize(np.atleast_2d(np.asarray(vectors, dtype=np.float32)))
+        if len(matrix) != len(payloads):
+            raise ValueError("Number of vectors and payloads must match.")
+
+        with self._lock:
+            if self.dim is None:
+                self.dim = matrix.shape[1]
+            if matrix.shape[1] != self.dim:
+                raise ValueError(f"Expected vectors of dimension {self.dim}, got {matrix.shape[1]}.")
+
+            start = len(self.payloads)
+            ids = np.arange(start, start + len(matrix))
+            self.payloads.extend(payloads)
+
+            if self.is_trained:
+                self._route(matrix, ids)
+            else:
+                if self._pending is None:
+                    self._pending = _InvertedList(self.dim)
+                self._pending.append(*quantize(matrix), ids)
+                if self._pending.count >= max(self.train_size, self.n_lists):
+                    self._train()
+            return ids.tolist()
+
+    def _route(self, matrix: np.ndarray, ids: np.ndarray) -> None:
+        """Append normalized vectors to the lists of their nearest centroids."""
+        assignment = np.argmax(matrix @ self.centroids.T, axis=1)
+        codes, scales = quantize(matrix)
+        order = np.argsort(assignment, kind="stable")
+        cells, starts = np.unique(assignment[order], return_index=True)
+        bounds = list(starts[1:]) + [len(order)]
+        for cell, lo, hi in zip(cells, starts, bounds):
+            rows = order[lo:hi]
+            self._lists[cell].append(codes[rows], scales[rows], ids[rows])
+
+    def _train(self) -> None:
+        """Fit centroids on the collected vectors and distribute them into lists."""
+        pending = self._pending
+        n = pending.count
+        vectors = pending.codes[:n].astype(np.float32) * pending.scales[:n, None]
+        sample = vectors
+        if n > self.n_lists * 256:
+            sample = vectors[np.random.default_rng(0).choice(n, size=self.n_lists * 256, replace=False)]
+        self.centroids = _spherical_kmeans(normalize(sample), self.n_lists)
+        self._lists = [_InvertedList(self.dim) for _ in range(self.n_lists)]
+        self._pending = None
+        for lo in range(0, n, 65536):
+            chunk = slice(lo, min(lo + 65536, n))
+            self._route(normalize(vectors[chunk]), pending.ids[chunk])
+
+    def search(self, query: Sequence[float], top_k: int = 3) -> List[Tuple[float, Dict]]:
+        """
+        Return approximately the `top_k` most similar entries.
+
+        Returns:
+            List[Tuple[float, Dict]]: (approximate cosine similarity, payload), best first.
+        """
+        if not len(self) or top_k <= 0:
+            return []
+        q = normalize(np.asarray(query, dtype=np.float32))
+
+        with self._lock:
+            if self.is_trained:
+                n_probe = min(self.n_probe, self.n_lists)
+                probe = np.argpartition(-(self.centroids @ q), n_probe - 1)[:n_probe]
+                parts = [self._lists[cell].scores(q) for cell in probe if self._lists[cell].count]
+            else:
+                parts = [self._pending.scores(q)]
+
+        if not parts:
+            return []
+        scores = np.concatenate([p[0] for p in parts])
+        ids = np.concatenate([p[1] for p in parts])
+        top_k = min(top_k, len(scores))
+        best = np.argpartition(-scores, top_k - 1)[:top_k] if top_k < len(scores) else np.arange(len(scores))
+        best = best[np.argsort(-scores[best])]
+        return [(float(scores[i]), self.payloads[ids[i]]) for i in best]
+
+    def save(self, directory: str) -> None:
+        """Write centroids, concatenated lists and payloads to a directory."""
+        os.makedirs(directory, exist_ok=True)
+        with self._lock:
+            lists = self._lists if self.is_trained else [self._pending or _InvertedList(self.dim or 1)]
+            counts = [l.count for l in lists]
+            arrays = {
+                "codes": np.concatenate([l.codes[:l.count] for l in lists]),
+                "scales": np.concatenate([l.scales[:l.count] for l in lists]),
+                "ids": np.concatenate([l.ids[:l.count] for l in lists]),
+            }
+            if self.is_trained:
+                arrays["centroids"] = self.centroids
+            meta = {
+                "dim": self.dim, "n_lists": self.n_lists, "n_probe": self.n_probe,
+                "train_size": self.train_size, "trained": self.is_trained, "list_counts": counts,
+            }
+            payloads = list(self.payloads)
+
+        for name, array in arrays.items():
+            tmp = os.path.join(directory, f".{name}.npy.{os.getpid()}.tmp")
+            with open(tmp, "wb") as f:
+                np.save(f, array)
+            os.replace(tmp, os.path.join(directory, f"{name}.npy"))
+        for name, data in (("payloads.json", payloads), (META_FILE, meta)):
+            tmp = os.path.join(directory, f".{name}.{os.getpid()}.tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp, os.path.join(directory, name))
+
+    @classmethod
+    def load(cls, directory: str, mmap: bool = True) -> "IVFIndex":
+        """Open a saved index; lists are memory-mapped views until first appended to."""
+        with open(os.path.join(directory, META_FILE), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        with open(os.path.join(directory, "payloads.json"), "r", encoding="utf-8") as f:
+            payloads = json.load(f)
+        mode = "r" if mmap else None
+        codes, scales, ids = (np.load(os.path.join(directory, f"{n}.npy"), mmap_mode=mode) for n in ("codes", "scales", "ids"))
+
+        index = cls(dim=meta["dim"], n_lists=meta["n_lists"], n_probe=meta["n_probe"], train_size=meta["train_size"])
+        index.payloads = payloads
+
+        lists, offset = [], 0
+        for count in meta["list_counts"]:
+            cell = _InvertedList.__new__(_InvertedList)
+            cell.codes, cell.scales, cell.ids = codes[offset:offset + count], scales[offset:offset + count], ids[offset:offset + count]
+            cell.count = count
+            lists.append(cell)
+            offset += count
+
+        if meta["trained"]:
+            index.centroids = np.load(os.path.join(directory, "centroids.npy"))
+            index._lists = lists
+        elif lists[0].count:
+            index._pending = lists[0]
+        return index
+
+
+# ──────────────────────────────────────────────────────────────────────────
+# Benchmark against exact search
+# (run `python -m krivisio_tools.project_structure_generator.services.ann_index [size] [dim]`)
+if __name__ == "__main__":
+    import sys
+    import time
+
+    from krivisio_tools.project_structure_generator.services.vector_index import VectorIndex
+
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    dim = int(sys.argv[2]) if len(sys.argv) > 2 else 512
+    k, n_queries = 10, 100
+    rng = np.random.default_rng(0)
+
+    # Clustered synthetic embeddings: project descriptions group by domain
+    topics = normalize(rng.standard_normal((2_000, dim), dtype=np.float32))
+
+    def sample(n):
+        base = topics[rng.integers(0, len(topics), size=n)]
+        return base + 0.03 * rng.standard_normal((n, dim), dtype=np.float32)
+
+    exact, ann = VectorIndex(dim=dim), IVFIndex(dim=dim, n_lists=int(np.sqrt(size) * 2))
+    start = time.perf_counter()
+    for offset in range(0, size, 20_000):
+        batch = sample(min(20_000, size - offset))
+        payloads = [{"id": offset + i} for i in range(len(batch))]
+        exact.add_batch(batch, payloads)
+        ann.add_batch(batch, payloads)
+    print(f"Built {size} x {dim} in {time.perf_counter() - start:.1f}s "
+          f"(n_lists={ann.n_lists}, incremental, trained={ann.is_trained})")
+    print(f"Memory: exact {exact.vectors.nbytes / 2**20:.0f} MiB, IVF-int8 {ann.nbytes / 2**20:.0f} MiB")
+
+    queries = sample(n_queries)
+    start = time.perf_counter()
+    truth = [{p["id"] for _, p in exact.search(q, k)} for q in queries]
+    exact_ms = (time.perf_counter() - start) / n_queries * 1000
+
+    for n_probe in (4, 8, 16, 32, ann.n_lists):
+        ann.n_probe = n_probe
+        start = time.perf_counter()
+        found = [{p["id"] for _, p in ann.search(q, k)} for q in queries]
+        ann_ms = (time.perf_counter() - start) / n_queries * 1000
+        recall = np.mean([len(f & t) / k for f, t in zip(found, truth)])
+        print(f"n_probe={n_probe:>2}: recall@{k} {recall:.3f}, {ann_ms:.2f} ms/query (exact {exact_ms:.2f} ms)")
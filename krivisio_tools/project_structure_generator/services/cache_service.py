@@ -1,14 +1,218 @@
 import hashlib
 import json
-from typing import Dict, Optional
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
 
+from krivisio_tools.report_generation.app.core.config import (
+    STRUCTURE_CACHE_BACKEND,
+    STRUCTURE_CACHE_PATH,
+    STRUCTURE_CACHE_MAX_ENTRIES,
+    STRUCTURE_CACHE_TTL_SECONDS,
+)
 
-# In-memory cache (simple Python dict)
-_cache: Dict[str, Dict] = {}
+
+class LRUCache:
+    """
+    In-process LRU cache with a per-entry time-to-live.
+
+    Args:
+        max_entries (int): Entries kept before the least recently used is evicted.
+        ttl_seconds (int): Seconds an entry stays valid.
+    """
+
+    name = "memory"
+
+    def __init__(self, max_entries: int = STRUCTURE_CACHE_MAX_ENTRIES, ttl_seconds: int = STRUCTURE_CACHE_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Dict]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Dict) -> None:
+        with self._lock:
+            self._entries[key] = (time.time() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def size(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteCache:
+    """
+    Disk cache in SQLite, shared by every worker process on the host.
+
+    WAL mode lets readers run alongside a writer. Entries expire after the
+    TTL and the least recently used rows are pruned beyond `max_entries`.
+
+    Args:
+        path (str): SQLite database file.
+        max_entries (int): Rows kept before pruning.
+        ttl_seconds (int): Seconds an entry stays valid.
+    """
+
+    name = "sqlite"
+
+    def __init__(
+        self,
+        path: str = STRUCTURE_CACHE_PATH,
+        max_entries: int = STRUCTURE_CACHE_MAX_ENTRIES,
+        ttl_seconds: int = STRUCTURE_CACHE_TTL_SECONDS
+    ):
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._local = threading.local()
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._connect().executescript("""
+            CREATE TABLE IF NOT EXISTS structure_cache (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                expires_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_structure_cache_access ON structure_cache (last_access);
+        """)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Optional[Dict]:
+        conn = self._connect()
+        now = time.time()
+        row = conn.execute(
+            "SELECT value FROM structure_cache WHERE key = ? AND expires_at >= ?", (key, now)
+        ).fetchone()
+        if row is None:
+            return None
+        conn.execute("UPDATE structure_cache SET last_access = ? WHERE key = ?", (now, key))
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Dict) -> None:
+        conn = self._connect()
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO structure_cache (key, value, expires_at, last_access) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value, separators=(",", ":")), now + self.ttl_seconds, now)
+            )
+            conn.execute("DELETE FROM structure_cache WHERE expires_at < ?", (now,))
+            conn.execute(
+                "DELETE FROM structure_cache WHERE key IN ("
+                "SELECT key FROM structure_cache ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def size(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM structure_cache").fetchone()[0]
+
+    def clear(self) -> None:
+        self._connect().execute("DELETE FROM structure_cache")
+
+
+class TieredCache:
+    """In-process LRU in front of the shared SQLite cache; disk hits are promoted."""
+
+    name = "tiered"
+
+    def __init__(self, memory: Optional[LRUCache] = None, disk: Optional[SQLiteCache] = None):
+        self.memory = memory or LRUCache()
+        self.disk = disk or SQLiteCache()
+
+    def get(self, key: str) -> Optional[Dict]:
+        value = self.memory.get(key)
+        if value is None:
+            value = self.disk.get(key)
+            if value is not None:
+                self.memory.set(key, value)
+        return value
+
+    def set(self, key: str, value: Dict) -> None:
+        self.memory.set(key, value)
+        self.disk.set(key, value)
+
+    def size(self) -> int:
+        return self.disk.size()
+
+    def clear(self) -> None:
+        self.memory.clear()
+        self.disk.clear()
+
+
+CACHE_BACKENDS = {
+    "memory": LRUCache,
+    "sqlite": SQLiteCache,
+    "tiered": TieredCache,
+}
+
+_backend = None
+_backend_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0, "writes": 0}
+
+
+def get_cache_backend():
+    """Return the configured cache backend, creating it on first use."""
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            if STRUCTURE_CACHE_BACKEND not in CACHE_BACKENDS:
+                raise ValueError(
+                    f"Unknown structure cache backend: '{STRUCTURE_CACHE_BACKEND}'. "
+                    f"Choose from {list(CACHE_BACKENDS)}."
+                )
+            _backend = CACHE_BACKENDS[STRUCTURE_CACHE_BACKEND]()
+        return _backend
+
+
+def set_cache_backend(backend) -> None:
+    """
+    Replace the cache backend.
+
+    Args:
+        backend: Any object with get(key), set(key, value), size() and clear().
+    """
+    global _backend
+    with _backend_lock:
+        _backend = backend
 
 
 def _generate_cache_key(
     project_description: str,
+    features: List[str],
     tech_stack: list,
     preferences: dict
 ) -> str:
@@ -17,6 +221,7 @@ def _generate_cache_key(
 
     Args:
         project_description (str): Project description.
+        features (List[str]): Requested features.
         tech_stack (list): List of tech/frameworks.
         preferences (dict): Preferences as dictionary.
 
@@ -25,6 +230,7 @@ def _generate_cache_key(
     """
     raw = json.dumps({
         "description": project_description.strip(),
+        "features": sorted(f.strip() for f in features or []),
         "tech_stack": sorted(tech_stack),
         "preferences": preferences
     }, sort_keys=True)
@@ -34,6 +240,7 @@ def _generate_cache_key(
 
 def get_from_cache(
     project_description: str,
+    features: List[str],
     tech_stack: list,
     preferences: dict
 ) -> Optional[Dict]:
@@ -43,12 +250,16 @@ def get_from_cache(
     Returns:
         dict or None
     """
-    key = _generate_cache_key(project_description, tech_stack, preferences)
-    return _cache.get(key)
+    key = _generate_cache_key(project_description, features, tech_stack, preferences)
+    value = get_cache_backend().get(key)
+    with _backend_lock:
+        _stats["hits" if value is not None else "misses"] += 1
+    return value
 
 
 def save_to_cache(
     project_description: str,
+    features: List[str],
     tech_stack: list,
     preferences: dict,
     structure: Dict
@@ -56,5 +267,26 @@ def save_to_cache(
     """
     Saves a generated structure to cache.
     """
-    key = _generate_cache_key(project_description, tech_stack, preferences)
-    _cache[key] = structure
+    key = _generate_cache_key(project_description, features, tech_stack, preferences)
+    get_cache_backend().set(key, structure)
+    with _backend_lock:
+        _stats["writes"] += 1
+
+
+def get_cache_stats() -> Dict:
+    """
+    Report cache effectiveness for this process.
+
+    Returns:
+        dict: backend, hits, misses, writes, hit_ratio and size (entries).
+    """
+    backend = get_cache_backend()
+    with _backend_lock:
+        stats = dict(_stats)
+    lookups = stats["hits"] + stats["misses"]
+    return {
+        "backend": getattr(backend, "name", type(backend).__name__),
+        **stats,
+        "hit_ratio": round(stats["hits"] / lookups, 4) if lookups else 0.0,
+        "size": backend.size(),
+    }
@@ -0,0 +1,247 @@
+"""
+Embedding service with a persistent cache and batched ingestion.
+
+Embeddings are memoized in SQLite under sha256(model, dimensions, text), so a
+description is only ever sent to the embeddings API once per model. Bulk
+requests are deduplicated, served from the cache where possible, and the rest
+are embedded in batched API calls with bounded concurrency.
+
+With EMBEDDING_BACKEND = "local", texts are instead embedded in-process by a
+hashed character n-gram embedder: no network, no cache, sub-millisecond.
+"""
+
+import hashlib
+import math
+import os
+import re
+import sqlite3
+import threading
+import zlib
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+from openai import OpenAI
+
+from krivisio_tools.report_generation.app.core.config import (
+    OPENAI_API_KEY,
+    EMBEDDING_BACKEND,
+    EMBEDDING_MODEL,
+    EMBEDDING_DIMENSIONS,
+    EMBEDDING_CACHE_PATH,
+    EMBEDDING_BATCH_SIZE,
+    EMBEDDING_MAX_WORKERS,
+)
+
+
+client = OpenAI(api_key=OPENAI_API_KEY)
+
+# SQLite's default limit on bound parameters per statement
+_SQL_CHUNK = 500
+
+LOCAL_EMBEDDER = "hashed-char-ngram-v1"
+_NGRAM_SIZES = (3, 4, 5)
+_WORD_RE = re.compile(r"[a-z0-9+#.]+")
+
+
+def embedder_signature() -> Dict:
+    """Identify the embedder a query must use to search an index."""
+    if EMBEDDING_BACKEND == "local":
+        return {"embedder": "local", "embedding_model": LOCAL_EMBEDDER, "dimensions": EMBEDDING_DIMENSIONS}
+    return {"embedder": "openai", "embedding_model": EMBEDDING_MODEL, "dimensions": EMBEDDING_DIMENSIONS}
+
+
+def _local_features(text: str) -> Counter:
+    """Word tokens plus character 3-5-grams of each padded word."""
+    features = Counter()
+    for word in _WORD_RE.findall(text.lower()):
+        features["w:" + word] += 1
+        padded = f" {word} "
+        for n in _NGRAM_SIZES:
+            for i in range(len(padded) - n + 1):
+                features[padded[i:i + n]] += 1
+    return features
+
+
+def embed_locally(texts: Sequence[str], dimensions: int = EMBEDDING_DIMENSIONS) -> np.ndarray:
+    """
+    Hashed character n-gram embedding (feature hashing with signed buckets
+    and sublinear term frequency), L2-normalized.
+
+    Args:
+        texts (Sequence[str]): Texts to embed.
+        dimensions (int): Number of hash buckets.
+
+    Returns:
+        np.ndarray: float32 array of shape (len(texts), dimensions).
+    """
+    vectors = np.zeros((len(texts), dimensions), dtype=np.float32)
+    for row, text in enumerate(texts):
+        for feature, count in _local_features(text).items():
+            h = zlib.crc32(feature.encode("utf-8"))
+            sign = 1.0 if h & 0x80000000 else -1.0
+            vectors[row, h % dimensions] += sign * (1.0 + math.log(count))
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+def _cache_key(text: str, model: str, dimensions: int) -> str:
+    return hashlib.sha256(f"{model}\0{dimensions}\0{text}".encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """
+    SQLite-backed embedding cache, safe to share between processes.
+
+    Args:
+        path (str): SQLite database file.
+    """
+
+    def __init__(self, path: str = EMBEDDING_CACHE_PATH):
+        self.path = path
+        self._local = threading.local()
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._connect().execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, np.ndarray]:
+        """Return cached vectors for the keys that are present."""
+        conn = self._connect()
+        found = {}
+        for lo in range(0, len(keys), _SQL_CHUNK):
+            chunk = keys[lo:lo + _SQL_CHUNK]
+            rows = conn.execute(
+                f"SELECT key, vector FROM embeddings WHERE key IN ({', '.join('?' * len(chunk))})", chunk
+            ).fetchall()
+            found.update((key, np.frombuffer(blob, dtype=np.float32)) for key, blob in rows)
+        return found
+
+    def put_many(self, items: Dict[str, np.ndarray]) -> None:
+        """Store vectors as float32 blobs."""
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                [(key, np.asarray(vec, dtype=np.float32).tobytes()) for key, vec in items.items()]
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def size(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+
+_cache: Optional[EmbeddingCache] = None
+_cache_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0, "api_calls": 0}
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """Return the process-wide embedding cache, creating it on first use."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = EmbeddingCache()
+        return _cache
+
+
+def _embed_batch(texts: List[str], model: str, dimensions: int) -> List[List[float]]:
+    """One embeddings API request for a batch of texts."""
+    response = client.embeddings.create(model=model, input=texts, dimensions=dimensions)
+    with _cache_lock:
+        _stats["api_calls"] += 1
+    return [item.embedding for item in sorted(response.data, key=lambda d: d.index)]
+
+
+def get_embeddings(
+    texts: Sequence[str],
+    model: str = EMBEDDING_MODEL,
+    dimensions: int = EMBEDDING_DIMENSIONS,
+    batch_size: int = EMBEDDING_BATCH_SIZE,
+    max_workers: int = EMBEDDING_MAX_WORKERS,
+    backend: str = EMBEDDING_BACKEND
+) -> np.ndarray:
+    """
+    Embed many texts, using the cache and batched API requests.
+
+    Args:
+        texts (Sequence[str]): Texts to embed; duplicates are embedded once.
+        model (str): Embedding model.
+        dimensions (int): Output dimensions.
+        batch_size (int): Texts per API request.
+        max_workers (int): Concurrent API requests.
+        backend (str): "openai" or "local".
+
+    Returns:
+        np.ndarray: float32 array of shape (len(texts), dimensions), row-aligned with `texts`.
+    """
+    if backend == "local":
+        return embed_locally(texts, dimensions)
+    if backend != "openai":
+        raise ValueError(f"Unknown embedding backend: '{backend}'. Choose 'openai' or 'local'.")
+
+    cleaned = [t.strip() for t in texts]
+    keys = [_cache_key(t, model, dimensions) for t in cleaned]
+    unique = dict(zip(keys, cleaned))
+
+    cache = get_embedding_cache()
+    vectors = cache.get_many(list(unique))
+    missing = [(key, text) for key, text in unique.items() if key not in vectors]
+
+    with _cache_lock:
+        _stats["hits"] += len(unique) - len(missing)
+        _stats["misses"] += len(missing)
+
+    if missing:
+        batches = [missing[lo:lo + batch_size] for lo in range(0, len(missing), batch_size)]
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(batches)))) as executor:
+            results = executor.map(lambda b: _embed_batch([t for _, t in b], model, dimensions), batches)
+            for batch, embeddings in zip(batches, results):
+                fresh = {key: np.asarray(vec, dtype=np.float32) for (key, _), vec in zip(batch, embeddings)}
+                cache.put_many(fresh)
+                vectors.update(fresh)
+
+    if not keys:
+        return np.empty((0, dimensions), dtype=np.float32)
+    return np.stack([vectors[key] for key in keys])
+
+
+def get_embedding(text: str) -> List[float]:
+    """
+    Embed a single text, served from the cache when possible.
+
+    Args:
+        text (str): Input string.
+
+    Returns:
+        List[float]: Embedding vector.
+    """
+    return get_embeddings([text])[0].tolist()
+
+
+def get_embedding_stats() -> Dict:
+    """Cache hits, misses, API calls made by this process and cached entry count."""
+    with _cache_lock:
+        stats = dict(_stats)
+    lookups = stats["hits"] + stats["misses"]
+    return {
+        **stats,
+        "hit_ratio": round(stats["hits"] / lookups, 4) if lookups else 0.0,
+        "size": get_embedding_cache().size(),
+    }
@@ -0,0 +1,195 @@
+"""
+Rule-based structure synthesis from tech-stack fragments.
+
+Standard stacks (Django, FastAPI, Flask, Express, React) are composed
+locally from `models.fragments`: framework skeletons mounted at the root (one
+framework) or under backend/ and frontend/ (several), one module per
+requested feature in each framework's conventions, and the docs / tests /
+docker / CI / custom folders selected by `ProjectPreferences`.
+
+When every technology in the stack is covered, no LLM call is made. When
+some are not (e.g. Kubernetes, Flutter), the composed tree is sent to the LLM
+which only adds what is missing for them.
+"""
+
+import re
+import textwrap
+import time
+from typing import Dict, List, Optional, Tuple
+
+from krivisio_tools.project_structure_generator.models.fragments import (
+    get_framework_fragments,
+    get_project_fragments,
+    get_supporting_technologies,
+)
+from krivisio_tools.project_structure_generator.models.preferences import ProjectPreferences
+from krivisio_tools.project_structure_generator.services.llm_service import generate_structure_extension
+from krivisio_tools.project_structure_generator.utils.path_format import parse_indented_paths
+
+
+_FRAMEWORKS = get_framework_fragments()
+_PROJECT = get_project_fragments()
+_SUPPORTING = set(get_supporting_technologies())
+_ALIASES = {alias: tech for tech, fragment in _FRAMEWORKS.items() for alias in [tech, *fragment["aliases"]]}
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+_STOPWORDS = {"a", "an", "and", "the", "with", "for", "of", "to", "in", "on", "by", "via", "using", "system", "management"}
+
+
+def canonical_tech(name: str) -> str:
+    """Lower-case technology name with aliases resolved to the fragment key."""
+    key = " ".join(name.lower().split())
+    return _ALIASES.get(key, key)
+
+
+def _slug(text: str, style: str, max_words: int = 3) -> str:
+    words = [w for w in _WORD_RE.findall(text.lower()) if w not in _STOPWORDS][:max_words]
+    return ("_" if style == "snake" else "-").join(words)
+
+
+def _expand(template: str, **values) -> List[Dict]:
+    """Expand an indented-path fragment into a list of top-level nodes."""
+    text = textwrap.dedent(template).strip().format(**values)
+    return parse_indented_paths("fragment/\n" + textwrap.indent(text, "  "))["children"]
+
+
+def _merge(into: List[Dict], extra: List[Dict]) -> None:
+    """Merge `extra` nodes into the sibling list `into`, combining folders by name."""
+    folders = {node["name"]: node for node in into if node["type"] == "folder"}
+    files = {node["name"] for node in into if node["type"] == "file"}
+    for node in extra:
+        if node["type"] == "folder":
+            if node["name"] in folders:
+                _merge(folders[node["name"]]["children"], node.get("children", []))
+            else:
+                into.append(node)
+                folders[node["name"]] = node
+        elif node["name"] not in files and node["name"] not in folders:
+            into.append(node)
+            files.add(node["name"])
+
+
+def _folder_chain(path: str) -> List[Dict]:
+    """
+    Nested folder nodes for a user-supplied path such as "tools/scripts".
+
+    Names are taken verbatim (no prose or comment stripping, unlike LLM
+    output); empty, "." and ".." segments are dropped.
+    """
+    segments = [s.strip() for s in path.split("/") if s.strip() not in ("", ".", "..")]
+    node: List[Dict] = []
+    for name in reversed(segments):
+        node = [{"name": name, "type": "folder", "children": node}]
+    return node
+
+
+def _mount(root: List[Dict], mount: str) -> List[Dict]:
+    """Children list of the mount folder (the root itself when mount is empty)."""
+    if not mount:
+        return root
+    folder = {"name": mount, "type": "folder", "children": []}
+    _merge(root, [folder])
+    return next(n for n in root if n["name"] == mount and n["type"] == "folder")["children"]
+
+
+def compose_structure(
+    project_description: str,
+    features: List[str],
+    tech_stack: List[str],
+    preferences: ProjectPreferences
+) -> Tuple[Optional[Dict], List[str]]:
+    """
+    Compose a directory tree from fragments.
+
+    Args:
+        project_description (str): Description of the user’s project.
+        features (List[str]): Requested features (one module each).
+        tech_stack (List[str]): Tech/frameworks in use.
+        preferences (ProjectPreferences): User preferences.
+
+    Returns:
+        tuple: (tree, uncovered) – tree is None when no framework in the
+        stack has a fragment; uncovered lists technologies without one.
+    """
+    canonical = [canonical_tech(t) for t in tech_stack]
+    frameworks = list(dict.fromkeys(t for t in canonical if t in _FRAMEWORKS))
+    if not frameworks:
+        return None, list(tech_stack)
+    uncovered = [raw for raw, t in zip(tech_stack, canonical) if t not in _FRAMEWORKS and t not in _SUPPORTING]
+
+    typescript = "typescript" in canonical
+    ext = {"js": "ts" if typescript else "js", "jsx": "tsx" if typescript else "jsx"}
+
+    kinds = [_FRAMEWORKS[t]["kind"] for t in frameworks]
+    children: List[Dict] = []
+    _merge(children, _expand(_PROJECT["root"]))
+
+    for tech, kind in zip(frameworks, kinds):
+        fragment = _FRAMEWORKS[tech]
+        if len(frameworks) == 1:
+            mount = ""
+        else:
+            mount = kind if kinds.count(kind) == 1 else tech
+        target = _mount(children, mount)
+
+        _merge(target, _expand(fragment["base"], **ext))
+        modules = dict.fromkeys(filter(None, (_slug(f, fragment["style"]) for f in features or [])))
+        for name in modules:
+            _merge(target, _expand(fragment["module"], name=name, **ext))
+        if preferences.include_tests:
+            _merge(target, _expand(fragment["tests"], **ext))
+            for name in modules:
+                _merge(target, _expand(fragment["module_test"], name=name, **ext))
+        if preferences.include_docker:
+            _merge(target, _expand(fragment["docker"], **ext))
+
+    if preferences.include_docs:
+        _merge(children, _expand(_PROJECT["docs"]))
+    if preferences.include_docker:
+        _merge(children, _expand(_PROJECT["docker"]))
+    if preferences.include_ci_cd:
+        _merge(children, _expand(_PROJECT["ci_cd"]))
+    for folder in preferences.custom_folders or []:
+        _merge(children, _folder_chain(folder))
+
+    root_name = _slug(project_description, "kebab") or "project"
+    return {"name": root_name, "type": "folder", "children": children}, uncovered
+
+
+def synthesize_structure(
+    project_description: str,
+    features: List[str],
+    tech_stack: List[str],
+    preferences: ProjectPreferences
+) -> Optional[Dict]:
+    """
+    Build the structure from fragments, asking the LLM only for technologies
+    the fragments do not cover.
+
+    Returns:
+        dict | None: Directory tree, or None when fragments do not apply
+        (no known framework, or `framework_specific` is off) and the caller
+        should generate the structure with the LLM.
+    """
+    if not preferences.framework_specific:
+        return None
+
+    start = time.perf_counter()
+    structure, uncovered = compose_structure(project_description, features, tech_stack, preferences)
+    if structure is None:
+        return None
+
+    if not uncovered:
+        print(f"[Fragments] composed {', '.join(tech_stack)} locally in {(time.perf_counter() - start) * 1000:.1f} ms")
+        return structure
+
+    print(f"[Fragments] composed base locally; asking LLM for: {', '.join(uncovered)}")
+    extension = generate_structure_extension(
+        project_description, features, tech_stack, preferences, structure, uncovered
+    )
+    if extension:
+        if extension["type"] == "folder" and extension["name"] == structure["name"]:
+            _merge(structure["children"], extension.get("children", []))
+        else:
+            _merge(structure["children"], [extension])
+    return structure
@@ -0,0 +1,119 @@
+"""
+Hierarchical generation for large, multi-service projects.
+
+A single completion for a big monorepo either runs into its output cap or
+takes as long as the whole tree is big. Instead:
+
+1. one short call produces the skeleton (root folder + top-level entries),
+2. each top-level folder (backend, frontend, infra, ...) is generated by its
+   own concurrent call with its own output budget,
+3. the subtrees are merged into the skeleton.
+
+Wall-clock time is bounded by the skeleton plus the slowest subtree.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from krivisio_tools.report_generation.app.core.config import (
+    STRUCTURE_HIERARCHICAL,
+    STRUCTURE_HIERARCHICAL_MIN_ITEMS,
+    STRUCTURE_SUBTREE_WORKERS,
+)
+from krivisio_tools.project_structure_generator.models.preferences import ProjectPreferences
+from krivisio_tools.project_structure_generator.services.llm_service import generate_skeleton, generate_subtree
+
+
+def should_generate_hierarchically(
+    features: List[str],
+    tech_stack: List[str],
+    mode: str = STRUCTURE_HIERARCHICAL
+) -> bool:
+    """
+    Decide whether a request is large enough for hierarchical generation.
+
+    Args:
+        features (List[str]): Requested features.
+        tech_stack (List[str]): Tech/frameworks in use.
+        mode (str): "off", "auto" (by request size) or "always".
+
+    Returns:
+        bool: True to use hierarchical generation.
+    """
+    if mode == "always":
+        return True
+    if mode == "auto":
+        return len(features or []) + len(tech_stack or []) >= STRUCTURE_HIERARCHICAL_MIN_ITEMS
+    return False
+
+
+def generate_hierarchical_structure(
+    project_description: str,
+    features: List[str],
+    tech_stack: List[str],
+    preferences: ProjectPreferences,
+    examples: Optional[List[Dict]] = None,
+    max_workers: int = STRUCTURE_SUBTREE_WORKERS
+) -> Optional[Dict]:
+    """
+    Generate a skeleton, then all top-level subtrees concurrently, and merge them.
+
+    Args:
+        project_description (str): Description of the user’s project.
+        features (List[str]): Requested features.
+        tech_stack (List[str]): Tech/frameworks in use.
+        preferences (ProjectPreferences): User preferences.
+        examples (Optional[List[Dict]]): Similar example structures for context.
+        max_workers (int): Concurrent subtree calls.
+
+    Returns:
+        dict | None: Merged directory tree, or None if the skeleton or every
+        subtree failed (the caller should fall back to single-shot generation).
+    """
+    start = time.perf_counter()
+    try:
+        skeleton = generate_skeleton(project_description, features, tech_stack, preferences, examples)
+    except Exception as e:
+        print(f"❌ Skeleton generation failed: {e}")
+        return None
+    if not skeleton:
+        return None
+
+    folders = [child for child in skeleton.get("children", []) if child["type"] == "folder"]
+    if not folders:
+        print("⚠️ Skeleton has no top-level folders.")
+        return None
+    skeleton_time = time.perf_counter() - start
+
+    def _subtree(folder: Dict):
+        began = time.perf_counter()
+        # API errors, rate limits and timeouts only cost this folder, not the request
+        try:
+            subtree = generate_subtree(
+                project_description, features, tech_stack, preferences, skeleton, folder["name"]
+            )
+        except Exception as e:
+            print(f"❌ Subtree '{folder['name']}/' failed: {e}")
+            subtree = None
+        return subtree, time.perf_counter() - began
+
+    # Subtree prompts read the skeleton, so results are merged only after all calls finish
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(folders)))) as executor:
+        results = list(executor.map(_subtree, folders))
+
+    generated = 0
+    for folder, (subtree, _) in zip(folders, results):
+        if subtree:
+            folder["children"] = subtree.get("children", [])
+            generated += 1
+        else:
+            print(f"⚠️ Keeping '{folder['name']}/' empty; its subtree could not be generated.")
+
+    if not generated:
+        return None
+
+    slowest = max(elapsed for _, elapsed in results)
+    print(f"[Hierarchical] {generated}/{len(folders)} subtrees; skeleton {skeleton_time:.1f}s, "
+          f"slowest subtree {slowest:.1f}s, total {time.perf_counter() - start:.1f}s")
+    return skeleton
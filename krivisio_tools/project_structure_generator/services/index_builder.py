@@ -0,0 +1,183 @@
+"""
+Build-time CLI for the prebuilt similar-project example index.
+
+Normalizes curated examples (`models.examples.get_example_repos`) and any
+historical example files into the name/type/children schema, embeds their
+descriptions in batches, and writes a versioned artifact:
+
+    <output>/<version>/vectors.npy | codes.npy ...   index arrays
+    <output>/<version>/payloads.json                  normalized examples
+    <output>/<version>/manifest.json                  embedder, model, count
+    <output>/CURRENT                                  name of the live version
+
+The server memory-maps the CURRENT version at startup.
+
+Usage:
+    python -m krivisio_tools.project_structure_generator.services.index_builder \
+        [--examples history.json ...] [--no-curated] [--backend exact|ivf] [--output DIR]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+from krivisio_tools.report_generation.app.core.config import (
+    EMBEDDING_DIMENSIONS,
+    EXAMPLE_INDEX_DIR,
+    SIMILARITY_INDEX_BACKEND,
+    IVF_N_LISTS,
+    IVF_N_PROBE,
+)
+from krivisio_tools.project_structure_generator.models.examples import get_example_repos
+from krivisio_tools.project_structure_generator.services.ann_index import IVFIndex
+from krivisio_tools.project_structure_generator.services.embedding_service import embedder_signature, get_embeddings
+from krivisio_tools.project_structure_generator.services.vector_index import VectorIndex
+from krivisio_tools.project_structure_generator.utils.output_parser import is_valid_structure
+
+
+MANIFEST_FILE = "manifest.json"
+CURRENT_FILE = "CURRENT"
+ARTIFACT_FORMAT = 1
+
+
+def normalize_structure(node: Dict) -> Dict:
+    """
+    Convert an example tree to the name/type/children schema.
+
+    Accepts the legacy `structure` key for child lists and infers a missing
+    `type` from whether the node has children.
+    """
+    children = node.get("children", node.get("structure"))
+    node_type = node.get("type") or ("folder" if children is not None else "file")
+    normalized = {"name": str(node.get("name", "")), "type": node_type}
+    if node_type == "folder":
+        normalized["children"] = [normalize_structure(child) for child in children or []]
+    return normalized
+
+
+def normalize_example(example: Dict) -> Optional[Dict]:
+    """Normalize one example; returns None if it has no description or an invalid tree."""
+    description = (example.get("description") or "").strip()
+    structure = normalize_structure(example.get("structure") or {})
+    if not description or not structure["name"] or not is_valid_structure(structure):
+        return None
+    return {
+        "description": description,
+        "tech_stack": list(example.get("tech_stack") or []),
+        "structure": structure,
+    }
+
+
+def load_examples(paths: List[str], include_curated: bool = True) -> List[Dict]:
+    """
+    Collect and normalize curated and historical examples, dropping duplicates.
+
+    Args:
+        paths (List[str]): JSON files holding a list of examples, or JSONL
+            files with one example per line.
+        include_curated (bool): Include `get_example_repos()`.
+
+    Returns:
+        List[Dict]: Normalized examples.
+    """
+    raw = list(get_example_repos()) if include_curated else []
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            if path.endswith(".jsonl"):
+                raw.extend(json.loads(line) for line in f if line.strip())
+            else:
+                data = json.load(f)
+                raw.extend(data if isinstance(data, list) else [data])
+
+    examples, seen, skipped = [], set(), 0
+    for item in raw:
+        example = normalize_example(item)
+        if example is None:
+            skipped += 1
+            continue
+        key = (example["description"], json.dumps(example["structure"], sort_keys=True))
+        if key not in seen:
+            seen.add(key)
+            examples.append(example)
+    if skipped:
+        print(f"[Index Builder] Skipped {skipped} invalid examples.")
+    return examples
+
+
+def build_index(examples: List[Dict], output_dir: str = EXAMPLE_INDEX_DIR, backend: str = SIMILARITY_INDEX_BACKEND) -> str:
+    """
+    Embed examples and write a new index version, then mark it current.
+
+    Returns:
+        str: Path of the written version directory.
+    """
+    digest = hashlib.sha256(json.dumps(examples, sort_keys=True).encode("utf-8")).hexdigest()
+    version = f"{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')}-{digest[:8]}"
+    version_dir = os.path.join(output_dir, version)
+
+    vectors = get_embeddings([ex["description"] for ex in examples])
+    if backend == "ivf":
+        index = IVFIndex(dim=EMBEDDING_DIMENSIONS, n_lists=IVF_N_LISTS, n_probe=IVF_N_PROBE)
+    else:
+        index = VectorIndex(dim=EMBEDDING_DIMENSIONS)
+    if examples:
+        index.add_batch(vectors, examples)
+    index.save(version_dir)
+
+    manifest = {
+        "format": ARTIFACT_FORMAT,
+        "version": version,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "backend": backend,
+        "count": len(examples),
+        "examples_sha256": digest,
+        **embedder_signature(),
+    }
+    with open(os.path.join(version_dir, MANIFEST_FILE), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+
+    tmp = os.path.join(output_dir, f".{CURRENT_FILE}.{os.getpid()}.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(version)
+    os.replace(tmp, os.path.join(output_dir, CURRENT_FILE))
+    return version_dir
+
+
+def current_index_dir(output_dir: str = EXAMPLE_INDEX_DIR) -> Optional[str]:
+    """Directory of the live index version, or None if none was built."""
+    try:
+        with open(os.path.join(output_dir, CURRENT_FILE), "r", encoding="utf-8") as f:
+            version = f.read().strip()
+    except OSError:
+        return None
+    path = os.path.join(output_dir, version)
+    return path if version and os.path.isdir(path) else None
+
+
+def read_manifest(version_dir: str) -> Dict:
+    with open(os.path.join(version_dir, MANIFEST_FILE), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Build the prebuilt similar-project example index.")
+    parser.add_argument("--examples", nargs="*", default=[], help="Historical example files (.json list or .jsonl).")
+    parser.add_argument("--no-curated", action="store_true", help="Skip the curated examples in models/examples.py.")
+    parser.add_argument("--backend", choices=("exact", "ivf"), default=SIMILARITY_INDEX_BACKEND)
+    parser.add_argument("--output", default=EXAMPLE_INDEX_DIR, help="Artifact root directory.")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    examples = load_examples(args.examples, include_curated=not args.no_curated)
+    version_dir = build_index(examples, args.output, args.backend)
+    print(f"✅ Indexed {len(examples)} examples into {version_dir} in {time.perf_counter() - start:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,111 @@
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+from krivisio_tools.report_generation.app.core.config import (
+    STRUCTURE_STREAMING,
+    STRUCTURE_OUTPUT_FORMAT,
+    STRUCTURE_MAX_TOKENS,
+    STRUCTURE_SKELETON_MAX_TOKENS,
+    STRUCTURE_SUBTREE_MAX_TOKENS,
+    STRUCTURE_PATCH_MAX_TOKENS,
+)
 from krivisio_tools.project_structure_generator.models.preferences import ProjectPreferences
-from krivisio_tools.project_structure_generator.utils.prompt_builder import build_prompt
-from krivisio_tools.project_structure_generator.utils.llm_client import chat_with_llm
-from krivisio_tools.project_structure_generator.utils.output_parser import parse_llm_output
+from krivisio_tools.project_structure_generator.utils.prompt_builder import (
+    build_prompt,
+    build_skeleton_prompt,
+    build_subtree_prompt,
+    build_extension_prompt,
+    build_patch_prompt,
+)
+from krivisio_tools.project_structure_generator.utils.llm_client import chat_with_llm, stream_chat_with_llm
+from krivisio_tools.project_structure_generator.utils.output_parser import parse_llm_output, is_valid_structure
+from krivisio_tools.project_structure_generator.utils.path_format import (
+    IndentedTreeBuilder,
+    parse_indented_paths,
+    starts_with_json,
+)
+from krivisio_tools.project_structure_generator.utils.tree_patch import parse_patch
+from krivisio_tools.project_structure_generator.utils.stream_parser import (
+    IncrementalTreeParser,
+    InvalidNodeError,
+    JSONSyntaxError,
+)
+
+
+def _stream_directory_structure(prompt: str, max_tokens: int = STRUCTURE_MAX_TOKENS) -> Optional[Dict]:
+    """
+    Stream the completion through the incremental parser.
+
+    Stops the stream as soon as the root object closes and aborts it on the
+    first invalid node. If the text is not strict JSON, the rest of the
+    response is collected and handed to the regular (repairing) parser.
+    """
+    parser = IncrementalTreeParser()
+    received: List[str] = []
+    stream = stream_chat_with_llm(prompt, max_tokens=max_tokens)
+    strict = True
+
+    try:
+        for chunk in stream:
+            received.append(chunk)
+            if not strict:
+                continue
+            try:
+                if parser.feed(chunk):
+                    print(f"✅ Root closed after {parser.nodes_validated} nodes; stopping stream.")
+                    return parser.result
+            except JSONSyntaxError as e:
+                print(f"⚠️ Streamed output is not strict JSON ({e}); collecting full response.")
+                strict = False
+    except InvalidNodeError as e:
+        print(f"❌ Aborting stream on invalid structure: {e}")
+        return None
+    finally:
+        stream.close()
+
+    # Stream ended without a complete root (truncated or non-strict JSON)
+    return parse_llm_output("".join(received))
+
+
+def _parse_paths_output(response_text: str) -> Optional[Dict]:
+    """Expand indented-path output; JSON output (model ignored the format) goes to the JSON parser."""
+    if starts_with_json(response_text):
+        return parse_llm_output(response_text)
+    structure = parse_indented_paths(response_text)
+    return structure if structure and is_valid_structure(structure) else None
+
+
+def _stream_paths_structure(prompt: str, max_tokens: int = STRUCTURE_MAX_TOKENS) -> Optional[Dict]:
+    """Stream indented-path output line by line, stopping once trailing prose or a fence follows the tree."""
+    builder = IndentedTreeBuilder()
+    received: List[str] = []
+    stream = stream_chat_with_llm(prompt, max_tokens=max_tokens)
+    try:
+        for chunk in stream:
+            received.append(chunk)
+            if builder.feed(chunk):
+                print(f"✅ Tree complete after {builder.nodes} nodes; stopping stream.")
+                break
+    finally:
+        stream.close()
+
+    response_text = "".join(received)
+    # Fences or prose may precede a JSON reply; never read it as a tree
+    if starts_with_json(response_text):
+        return parse_llm_output(response_text)
+    structure = builder.close()
+    return structure if structure and is_valid_structure(structure) else None
+
+
+def _complete(prompt: str, output_format: str, stream: Optional[bool], max_tokens: int) -> Optional[Dict]:
+    """Run one structure completion (streamed or blocking) and parse it in the requested format."""
+    if STRUCTURE_STREAMING if stream is None else stream:
+        if output_format == "paths":
+            return _stream_paths_structure(prompt, max_tokens)
+        return _stream_directory_structure(prompt, max_tokens)
+
+    response_text = chat_with_llm(prompt, max_tokens=max_tokens)
+    if output_format == "paths":
+        return _parse_paths_output(response_text)
+    return parse_llm_output(response_text)
 
 
 def generate_directory_structure(
@@ -10,7 +113,9 @@ def generate_directory_structure(
     features: List[str],
     tech_stack: List[str],
     preferences: ProjectPreferences,
-    examples: Optional[List[Dict]] = None
+    examples: Optional[List[Dict]] = None,
+    stream: Optional[bool] = None,
+    output_format: str = STRUCTURE_OUTPUT_FORMAT
 ) -> Optional[Dict]:
     """
     Main service to generate a directory structure using an LLM.
@@ -20,6 +125,9 @@ def generate_directory_structure(
         tech_stack (List[str]): List of technologies/frameworks.
         preferences (ProjectPreferences): User customization.
         examples (Optional[List[Dict]]): Similar example structures for context.
+        stream (bool, optional): Stream and parse incrementally; defaults to
+            STRUCTURE_STREAMING.
+        output_format (str): "paths" (compact indented paths) or "json".
 
     Returns:
         dict | None: Parsed directory tree or None on failure.
@@ -30,17 +138,154 @@ def generate_directory_structure(
         features=features,
         tech_stack=tech_stack,
         preferences=preferences,
-        similar_examples=examples or []
+        similar_examples=examples or [],
+        output_format=output_format
     )
 
-    # 2. Query the LLM
-    response_text = chat_with_llm(prompt)
-
-    # 3. Parse and validate the result
-    structure = parse_llm_output(response_text)
+    # 2-3. Query the LLM and parse the result
+    structure = _complete(prompt, output_format, stream, STRUCTURE_MAX_TOKENS)
 
     if structure:
         return structure
     else:
         print("⚠️ LLM returned an invalid structure.")
         return None
+
+
+def generate_skeleton(
+    project_description: str,
+    features: List[str],
+    tech_stack: List[str],
+    preferences: ProjectPreferences,
+    examples: Optional[List[Dict]] = None,
+    stream: Optional[bool] = None,
+    output_format: str = STRUCTURE_OUTPUT_FORMAT
+) -> Optional[Dict]:
+    """
+    First stage of hierarchical generation: the root folder and its direct
+    children. Anything the model nests deeper is dropped.
+
+    Returns:
+        dict | None: Root folder whose child folders are empty, or None on failure.
+    """
+    prompt = build_skeleton_prompt(
+        project_description=project_description,
+        features=features,
+        tech_stack=tech_stack,
+        preferences=preferences,
+        similar_examples=examples or [],
+        output_format=output_format
+    )
+    skeleton = _complete(prompt, output_format, stream, STRUCTURE_SKELETON_MAX_TOKENS)
+    if not skeleton or skeleton["type"] != "folder":
+        print("⚠️ LLM returned an invalid skeleton.")
+        return None
+
+    for child in skeleton.get("children", []):
+        if child["type"] == "folder":
+            child["children"] = []
+    return skeleton
+
+
+def generate_subtree(
+    project_description: str,
+    features: List[str],
+    tech_stack: List[str],
+    preferences: ProjectPreferences,
+    skeleton: Dict,
+    folder_name: str,
+    stream: Optional[bool] = None,
+    output_format: str = STRUCTURE_OUTPUT_FORMAT
+) -> Optional[Dict]:
+    """
+    Second stage of hierarchical generation: the full contents of one
+    top-level folder of `skeleton`.
+
+    Returns:
+        dict | None: Folder node named `folder_name`, or None on failure.
+    """
+    prompt = build_subtree_prompt(
+        project_description=project_description,
+        features=features,
+        tech_stack=tech_stack,
+        preferences=preferences,
+        skeleton=skeleton,
+        folder_name=folder_name,
+        output_format=output_format
+    )
+    subtree = _complete(prompt, output_format, stream, STRUCTURE_SUBTREE_MAX_TOKENS)
+    if not subtree:
+        print(f"⚠️ LLM returned an invalid subtree for '{folder_name}/'.")
+        return None
+
+    # The model may answer with the folder itself, the project root around it, or its bare contents
+    if subtree["type"] == "folder" and subtree["name"] != folder_name:
+        nested = [c for c in subtree.get("children", []) if c["type"] == "folder" and c["name"] == folder_name]
+        subtree = nested[0] if nested else {"name": folder_name, "type": "folder", "children": subtree.get("children", [])}
+    elif subtree["type"] == "file":
+        subtree = {"name": folder_name, "type": "folder", "children": [subtree]}
+    return subtree
+
+
+def generate_structure_extension(
+    project_description: str,
+    features: List[str],
+    tech_stack: List[str],
+    preferences: ProjectPreferences,
+    base_structure: Dict,
+    technologies: List[str],
+    stream: Optional[bool] = None,
+    output_format: str = STRUCTURE_OUTPUT_FORMAT
+) -> Optional[Dict]:
+    """
+    Ask for the additions `base_structure` needs for `technologies`.
+
+    Returns:
+        dict | None: Tree of additions (usually rooted at the base root), or None on failure.
+    """
+    prompt = build_extension_prompt(
+        project_description=project_description,
+        features=features,
+        tech_stack=tech_stack,
+        preferences=preferences,
+        base_structure=base_structure,
+        technologies=technologies,
+        output_format=output_format
+    )
+    extension = _complete(prompt, output_format, stream, STRUCTURE_SUBTREE_MAX_TOKENS)
+    if not extension:
+        print(f"⚠️ LLM returned no valid additions for {', '.join(technologies)}.")
+    return extension
+
+
+def generate_structure_patch(
+    project_description: str,
+    features: List[str],
+    tech_stack: List[str],
+    preferences: ProjectPreferences,
+    previous_structure: Dict,
+    added_features: List[str],
+    removed_features: List[str]
+) -> Optional[Tuple[List[str], List[str]]]:
+    """
+    Ask for the patch an existing structure needs after a feature change.
+
+    Returns:
+        tuple | None: (added paths, removed paths), or None if the response
+        held no patch lines.
+    """
+    prompt = build_patch_prompt(
+        project_description=project_description,
+        features=features,
+        tech_stack=tech_stack,
+        preferences=preferences,
+        previous_structure=previous_structure,
+        added_features=added_features,
+        removed_features=removed_features
+    )
+    response_text = chat_with_llm(prompt, max_tokens=STRUCTURE_PATCH_MAX_TOKENS)
+    added, removed = parse_patch(response_text)
+    if not added and not removed:
+        print("⚠️ LLM returned no patch lines.")
+        return None
+    return added, removed
@@ -0,0 +1,160 @@
+"""
+Semantic near-duplicate cache for generated structures.
+
+Catches requests that describe the same project in different words. Each
+cached structure is indexed by the embedding of its normalized description,
+tech stack and features. A lookup reuses a structure only when:
+
+- cosine similarity is at least SEMANTIC_CACHE_THRESHOLD,
+- preferences are identical, and
+- the tech stacks and feature sets match exactly (case-insensitive) – the
+  safeguard that keeps "Django API" from being served for "FastAPI API",
+  and a tree without a newly requested feature from being reused.
+
+Candidates that pass the threshold but fail a safeguard are counted as
+safeguard rejections.
+"""
+
+import re
+import threading
+from typing import Dict, List, Optional
+
+from krivisio_tools.report_generation.app.core.config import (
+    EMBEDDING_DIMENSIONS,
+    SEMANTIC_CACHE_THRESHOLD,
+    SEMANTIC_CACHE_MAX_ENTRIES,
+)
+from krivisio_tools.project_structure_generator.services.embedding_service import get_embedding
+from krivisio_tools.project_structure_generator.services.vector_index import VectorIndex
+
+
+_CANDIDATES = 5
+_SPACE_RE = re.compile(r"\s+")
+
+_lock = threading.Lock()
+_index = VectorIndex(dim=EMBEDDING_DIMENSIONS)
+_stats = {"lookups": 0, "hits": 0, "misses": 0, "rejected_by_safeguard": 0}
+
+
+def _normalize(text: str) -> str:
+    return _SPACE_RE.sub(" ", text.lower()).strip(" .!?")
+
+
+def _tech_key(tech_stack: List[str]) -> tuple:
+    return tuple(sorted({_normalize(t) for t in tech_stack or []}))
+
+
+def _feature_key(features: List[str]) -> tuple:
+    return tuple(sorted({_normalize(f) for f in features or []}))
+
+
+def _semantic_text(project_description: str, features: List[str], tech_stack: List[str]) -> str:
+    """Text that is embedded for both stored entries and lookups."""
+    parts = [_normalize(project_description), "tech: " + ", ".join(_tech_key(tech_stack))]
+    if features:
+        parts.append("features: " + "; ".join(_feature_key(features)))
+    return " | ".join(parts)
+
+
+def _compact() -> None:
+    """Drop the oldest quarter of entries once the cache is full (called under the lock)."""
+    global _index
+    keep = _index.payloads[len(_index.payloads) // 4:]
+    rebuilt = VectorIndex(dim=EMBEDDING_DIMENSIONS)
+    if keep:
+        rebuilt.add_batch(_index.vectors[-len(keep):], keep)
+    _index = rebuilt
+
+
+def find_semantic_match(
+    project_description: str,
+    features: List[str],
+    tech_stack: List[str],
+    preferences: Dict,
+    threshold: float = SEMANTIC_CACHE_THRESHOLD
+) -> Optional[Dict]:
+    """
+    Return a cached structure for a near-duplicate request, or None.
+
+    Args:
+        project_description (str): Project description.
+        features (List[str]): Requested features.
+        tech_stack (List[str]): Tech/frameworks in use.
+        preferences (dict): Preferences as dictionary.
+        threshold (float): Minimum cosine similarity.
+
+    Returns:
+        dict | None: Cached structure.
+    """
+    with _lock:
+        index = _index
+        _stats["lookups"] += 1
+    if not len(index):
+        with _lock:
+            _stats["misses"] += 1
+        return None
+
+    vector = get_embedding(_semantic_text(project_description, features, tech_stack))
+    tech_key = _tech_key(tech_stack)
+    feature_key = _feature_key(features)
+
+    rejected = 0
+    match = None
+    for score, entry in index.search(vector, _CANDIDATES):
+        if score < threshold:
+            break
+        if (
+            entry["tech_stack"] != list(tech_key)
+            or entry["features"] != list(feature_key)
+            or entry["preferences"] != preferences
+        ):
+            rejected += 1
+            continue
+        match = entry
+        print(f"[Semantic Cache] hit (similarity {score:.3f})")
+        break
+
+    with _lock:
+        _stats["rejected_by_safeguard"] += rejected
+        _stats["hits" if match else "misses"] += 1
+    return match["structure"] if match else None
+
+
+def save_semantic_entry(
+    project_description: str,
+    features: List[str],
+    tech_stack: List[str],
+    preferences: Dict,
+    structure: Dict
+) -> None:
+    """Index a generated structure for future near-duplicate lookups."""
+    vector = get_embedding(_semantic_text(project_description, features, tech_stack))
+    with _lock:
+        if len(_index) >= SEMANTIC_CACHE_MAX_ENTRIES:
+            _compact()
+        _index.add(vector, {
+            "tech_stack": list(_tech_key(tech_stack)),
+            "features": list(_feature_key(features)),
+            "preferences": preferences,
+            "structure": structure
+        })
+
+
+def get_semantic_cache_stats() -> Dict:
+    """
+    Report semantic cache effectiveness for this process.
+
+    `safeguard_rejection_rate` is the share of above-threshold matches that
+    the tech-stack / feature / preference safeguard rejected, i.e. the stale
+    structures the cache would have served without it.
+    """
+    with _lock:
+        stats = dict(_stats)
+        size = len(_index)
+    candidates = stats["hits"] + stats["rejected_by_safeguard"]
+    return {
+        **stats,
+        "hit_rate": round(stats["hits"] / stats["lookups"], 4) if stats["lookups"] else 0.0,
+        "safeguard_rejection_rate": round(stats["rejected_by_safeguard"] / candidates, 4) if candidates else 0.0,
+        "size": size,
+    }
@@ -1,32 +1,37 @@
-from typing import List, Dict
-import hashlib
+from typing import List, Dict, Optional
 import numpy as np
-from openai import OpenAI
-from krivisio_tools.report_generation.app.core.config import OPENAI_API_KEY
-
-
-client = OpenAI(api_key=OPENAI_API_KEY)
-
-
-# Example in-memory project example store
-SIMILAR_PROJECTS_DB: List[Dict] = []
-
-
-def get_embedding(text: str) -> List[float]:
-    """
-    Uses OpenAI Embedding API to get a vector representation of text.
-
-    Args:
-        text (str): Input string.
-
-    Returns:
-        List[float]: Embedding vector.
-    """
-    response = client.embeddings.create(
-        model="text-embedding-3-small",
-        input=[text.strip()]
-    )
-    return response.data[0].embedding
+import os
+from krivisio_tools.report_generation.app.core.config import (
+    EMBEDDING_DIMENSIONS,
+    EXAMPLE_INDEX_DIR,
+    SIMILARITY_INDEX_BACKEND,
+    IVF_N_LISTS,
+    IVF_N_PROBE,
+)
+from krivisio_tools.project_structure_generator.services.vector_index import VectorIndex
+from krivisio_tools.project_structure_generator.services.ann_index import IVFIndex, META_FILE as IVF_META_FILE
+from krivisio_tools.project_structure_generator.services.embedding_service import (
+    embedder_signature,
+    get_embedding,
+    get_embeddings,
+)
+from krivisio_tools.project_structure_generator.services.index_builder import current_index_dir, read_manifest
+
+
+def _new_index():
+    """Create an empty example index for the configured backend."""
+    if SIMILARITY_INDEX_BACKEND == "ivf":
+        return IVFIndex(dim=EMBEDDING_DIMENSIONS, n_lists=IVF_N_LISTS, n_probe=IVF_N_PROBE)
+    if SIMILARITY_INDEX_BACKEND != "exact":
+        raise ValueError(f"Unknown similarity index backend: '{SIMILARITY_INDEX_BACKEND}'. Choose 'exact' or 'ivf'.")
+    return VectorIndex(dim=EMBEDDING_DIMENSIONS)
+
+
+# In-memory example index (exact float32 matrix or IVF/int8, see config)
+_example_index = _new_index()
+
+# Example payloads (description, tech_stack, structure), row-aligned with the index
+SIMILAR_PROJECTS_DB: List[Dict] = _example_index.payloads
 
 
 def cosine_similarity(vec1: List[float], vec2: List[float]) -> float:
@@ -55,34 +60,96 @@ def find_similar_examples(
     Returns:
         List[Dict]: Top similar examples with structure and metadata.
     """
-    input_vec = get_embedding(input_description)
-
-    scored_projects = []
-    for project in SIMILAR_PROJECTS_DB:
-        example_vec = project.get("embedding")
-        if not example_vec:
-            continue
-        similarity = cosine_similarity(input_vec, example_vec)
-        scored_projects.append((similarity, project))
-
-    # Sort by highest similarity
-    scored_projects.sort(key=lambda x: x[0], reverse=True)
+    # Nothing to compare against – skip the embedding call entirely
+    if not len(_example_index):
+        return []
 
-    # Return top-K examples
-    return [p[1] for p in scored_projects[:top_k]]
+    input_vec = get_embedding(input_description)
+    return [payload for _, payload in _example_index.search(input_vec, top_k)]
 
 
-def add_example_to_db(description: str, structure: Dict) -> None:
+def add_example_to_db(description: str, structure: Dict, tech_stack: Optional[List[str]] = None) -> None:
     """
     Adds a new example to the in-memory project DB.
 
     Args:
         description (str): Project description.
         structure (dict): Associated directory structure.
+        tech_stack (List[str], optional): Technologies used by the example.
     """
     embedding = get_embedding(description)
-    SIMILAR_PROJECTS_DB.append({
+    _example_index.add(embedding, {
         "description": description,
-        "structure": structure,
-        "embedding": embedding
+        "tech_stack": tech_stack or [],
+        "structure": structure
     })
+
+
+def add_examples_to_db(examples: List[Dict]) -> int:
+    """
+    Bulk-add examples, embedding their descriptions in batched, cached requests.
+
+    Args:
+        examples (List[Dict]): Items with "description", "structure" and
+            optionally "tech_stack".
+
+    Returns:
+        int: Number of examples added.
+    """
+    if not examples:
+        return 0
+    vectors = get_embeddings([ex["description"] for ex in examples])
+    _example_index.add_batch(vectors, [
+        {
+            "description": ex["description"],
+            "tech_stack": ex.get("tech_stack") or [],
+            "structure": ex["structure"]
+        }
+        for ex in examples
+    ])
+    return len(examples)
+
+
+def save_example_index(directory: str) -> None:
+    """Persist the example index (arrays as .npy, payloads as JSON)."""
+    _example_index.save(directory)
+
+
+def load_example_index(directory: str, mmap: bool = True) -> int:
+    """
+    Replace the in-memory examples with a saved index.
+
+    Args:
+        directory (str): Directory written by `save_example_index`.
+        mmap (bool): Memory-map the vectors instead of reading them into RAM.
+
+    Returns:
+        int: Number of examples loaded.
+    """
+    global _example_index, SIMILAR_PROJECTS_DB
+    index_cls = IVFIndex if os.path.exists(os.path.join(directory, IVF_META_FILE)) else VectorIndex
+    _example_index = index_cls.load(directory, mmap=mmap)
+    SIMILAR_PROJECTS_DB = _example_index.payloads
+    return len(_example_index)
+
+
+def _load_prebuilt_index() -> None:
+    """Memory-map the current prebuilt example index, if one was built for this embedder."""
+    version_dir = current_index_dir(EXAMPLE_INDEX_DIR)
+    if not version_dir:
+        return
+    try:
+        manifest = read_manifest(version_dir)
+        expected = embedder_signature()
+        if any(manifest.get(k) != v for k, v in expected.items()):
+            print(f"⚠️ Example index {manifest.get('version')} was built for "
+                  f"{manifest.get('embedding_model')}/{manifest.get('dimensions')}; expected "
+                  f"{expected['embedding_model']}/{expected['dimensions']}. Skipping.")
+            return
+        count = load_example_index(version_dir)
+        print(f"📁 Loaded {count} prebuilt examples (index {manifest['version']}).")
+    except Exception as e:
+        print(f"⚠️ Could not load prebuilt example index: {e}")
+
+
+_load_prebuilt_index()
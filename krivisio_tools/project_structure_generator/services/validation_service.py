@@ -3,7 +3,8 @@ from typing import Dict, List
 
 def is_valid_structure(node: Dict) -> bool:
     """
-    Recursively validates the directory structure returned by the LLM.
+    Validates the directory structure returned by the LLM, walking it with
+    an explicit stack so deep trees cannot exhaust the recursion limit.
 
     Args:
         node (dict): A file or folder node.
@@ -11,26 +12,27 @@ def is_valid_structure(node: Dict) -> bool:
     Returns:
         bool: True if the structure is valid, False otherwise.
     """
-    if not isinstance(node, dict):
-        return False
-
-    if "name" not in node or "type" not in node:
-        return False
-
-    if node["type"] not in ["file", "folder"]:
-        return False
+    stack: List = [node]
+    while stack:
+        node = stack.pop()
+        if not isinstance(node, dict):
+            return False
 
-    if not isinstance(node["name"], str) or not node["name"]:
-        return False
+        if "name" not in node or "type" not in node:
+            return False
 
-    if node["type"] == "folder":
-        if "children" not in node:
+        if node["type"] not in ["file", "folder"]:
             return False
-        if not isinstance(node["children"], list):
+
+        if not isinstance(node["name"], str) or not node["name"]:
             return False
-        for child in node["children"]:
-            if not is_valid_structure(child):
+
+        if node["type"] == "folder":
+            if "children" not in node:
+                return False
+            if not isinstance(node["children"], list):
                 return False
+            stack.extend(node["children"])
 
     return True
 
@@ -0,0 +1,204 @@
+"""
+Exact cosine-similarity index over example embeddings.
+
+Vectors are L2-normalized once on insert and kept in one contiguous float32
+matrix, so a query is a single matrix-vector product followed by an
+`argpartition` top-k. The matrix grows by doubling, and an index can be saved
+as `.npy` and reopened memory-mapped.
+"""
+
+import json
+import os
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+VECTORS_FILE = "vectors.npy"
+PAYLOADS_FILE = "payloads.json"
+
+
+def normalize(vectors: np.ndarray) -> np.ndarray:
+    """L2-normalize rows of a float32 array; zero rows stay zero."""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+class VectorIndex:
+    """
+    Append-friendly exact vector index.
+
+    Args:
+        dim (int, optional): Vector dimension; inferred from the first insert.
+        capacity (int): Initial number of rows to allocate.
+    """
+
+    def __init__(self, dim: Optional[int] = None, capacity: int = 1024):
+        self.dim = dim
+        self.payloads: List[Dict] = []
+        self._vectors: Optional[np.ndarray] = None
+        self._capacity = capacity
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def vectors(self) -> np.ndarray:
+        """View of the stored (normalized) vectors."""
+        if self._vectors is None:
+            return np.empty((0, self.dim or 0), dtype=np.float32)
+        return self._vectors[:self._count]
+
+    def _reserve(self, extra: int) -> None:
+        """Ensure room for `extra` more rows, doubling capacity as needed."""
+        needed = self._count + extra
+        if self._vectors is not None and needed <= self._vectors.shape[0] and self._vectors.flags.writeable:
+            return
+        capacity = max(self._capacity, self._vectors.shape[0] if self._vectors is not None else 0)
+        while capacity < needed:
+            capacity *= 2
+        grown = np.empty((capacity, self.dim), dtype=np.float32)
+        if self._count:
+            grown[:self._count] = self._vectors[:self._count]
+        self._vectors = grown
+
+    def add(self, vector: Sequence[float], payload: Dict) -> int:
+        """
+        Add one vector with its payload.
+
+        Returns:
+            int: Row id of the new entry.
+        """
+        return self.add_batch([vector], [payload])[0]
+
+    def add_batch(self, vectors: Sequence[Sequence[float]], payloads: Sequence[Dict]) -> List[int]:
+        """
+        Add many vectors at once.
+
+        Args:
+            vectors: Array-like of shape (n, dim).
+            payloads: One payload dict per vector.
+
+        Returns:
+            List[int]: Row ids of the new entries.
+        """
+        matrix = normalize(np.atleast_2d(np.asarray(vectors, dtype=np.float32)))
+        if len(matrix) != len(payloads):
+            raise ValueError("Number of vectors and payloads must match.")
+
+        with self._lock:
+            if self.dim is None:
+                self.dim = matrix.shape[1]
+            if matrix.shape[1] != self.dim:
+                raise ValueError(f"Expected vectors of dimension {self.dim}, got {matrix.shape[1]}.")
+
+            self._reserve(len(matrix))
+            start = self._count
+            self._vectors[start:start + len(matrix)] = matrix
+            self.payloads.extend(payloads)
+            self._count += len(matrix)
+            return list(range(start, self._count))
+
+    def search(self, query: Sequence[float], top_k: int = 3) -> List[Tuple[float, Dict]]:
+        """
+        Return the `top_k` most similar entries.
+
+        Args:
+            query: Query vector.
+            top_k (int): Number of results.
+
+        Returns:
+            List[Tuple[float, Dict]]: (cosine similarity, payload), best first.
+        """
+        with self._lock:
+            count = self._count
+            matrix = self.vectors
+        if count == 0 or top_k <= 0:
+            return []
+
+        scores = matrix @ normalize(np.asarray(query, dtype=np.float32))
+        top_k = min(top_k, count)
+        if top_k < count:
+            candidates = np.argpartition(-scores, top_k - 1)[:top_k]
+        else:
+            candidates = np.arange(count)
+        best = candidates[np.argsort(-scores[candidates])]
+        return [(float(scores[i]), self.payloads[i]) for i in best]
+
+    def save(self, directory: str) -> None:
+        """Write vectors (`.npy`) and payloads (JSON) to a directory atomically."""
+        os.makedirs(directory, exist_ok=True)
+        with self._lock:
+            vectors = np.ascontiguousarray(self.vectors)
+            payloads = list(self.payloads)
+
+        tmp_vectors = os.path.join(directory, f".{VECTORS_FILE}.{os.getpid()}.tmp")
+        with open(tmp_vectors, "wb") as f:
+            np.save(f, vectors)
+        os.replace(tmp_vectors, os.path.join(directory, VECTORS_FILE))
+
+        tmp_payloads = os.path.join(directory, f".{PAYLOADS_FILE}.{os.getpid()}.tmp")
+        with open(tmp_payloads, "w", encoding="utf-8") as f:
+            json.dump(payloads, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_payloads, os.path.join(directory, PAYLOADS_FILE))
+
+    @classmethod
+    def load(cls, directory: str, mmap: bool = True) -> "VectorIndex":
+        """
+        Open a saved index.
+
+        With `mmap=True` the vectors stay on disk and pages are read on demand;
+        the first `add` copies them into memory.
+        """
+        vectors = np.load(os.path.join(directory, VECTORS_FILE), mmap_mode="r" if mmap else None)
+        with open(os.path.join(directory, PAYLOADS_FILE), "r", encoding="utf-8") as f:
+            payloads = json.load(f)
+        if len(vectors) != len(payloads):
+            raise ValueError(f"Index at '{directory}' is inconsistent: {len(vectors)} vectors, {len(payloads)} payloads.")
+
+        index = cls(dim=vectors.shape[1] if vectors.ndim == 2 else None)
+        index._vectors = vectors
+        index._count = len(vectors)
+        index.payloads = payloads
+        return index
+
+
+# ──────────────────────────────────────────────────────────────────────────
+# Benchmark (run `python -m krivisio_tools.project_structure_generator.services.vector_index`)
+if __name__ == "__main__":
+    import sys
+    import tempfile
+    import time
+
+    from krivisio_tools.report_generation.app.core.config import EMBEDDING_DIMENSIONS
+
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    dim = int(sys.argv[2]) if len(sys.argv) > 2 else EMBEDDING_DIMENSIONS
+    rng = np.random.default_rng(0)
+
+    index = VectorIndex(dim=dim)
+    start = time.perf_counter()
+    for offset in range(0, size, 10_000):
+        batch = rng.standard_normal((min(10_000, size - offset), dim), dtype=np.float32)
+        index.add_batch(batch, [{"id": offset + i} for i in range(len(batch))])
+    print(f"Build : {size} x {dim} in {time.perf_counter() - start:.2f}s, "
+          f"{index.vectors.nbytes / 2**20:.0f} MiB (Python float lists: ~{size * dim * 32 / 2**20:.0f} MiB)")
+
+    queries = rng.standard_normal((50, dim), dtype=np.float32)
+    index.search(queries[0], 3)
+    start = time.perf_counter()
+    for q in queries:
+        index.search(q, 3)
+    print(f"Search: {(time.perf_counter() - start) / len(queries) * 1000:.2f} ms/query (top-3)")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        index.save(tmp)
+        start = time.perf_counter()
+        loaded = VectorIndex.load(tmp)
+        print(f"Load  : {len(loaded)} vectors memory-mapped in {(time.perf_counter() - start) * 1000:.1f} ms")
+        assert loaded.search(queries[0], 3)[0][1] == index.search(queries[0], 3)[0][1]
@@ -0,0 +1,30 @@
+"""Archive export: entry names must stay inside the project root."""
+
+import io
+import zipfile
+
+import pytest
+
+from krivisio_tools.project_structure_generator.utils.archive_export import ARCHIVE_FORMATS, write_archive
+
+
+def _tree(name):
+    return {"name": "app", "type": "folder", "children": [
+        {"name": "src", "type": "folder", "children": [{"name": name, "type": "file"}]},
+    ]}
+
+
+@pytest.mark.parametrize("archive_format", ARCHIVE_FORMATS)
+@pytest.mark.parametrize("name", ["", " ", ".", "..", "../../etc/passwd", "/etc/passwd", "a\\b.txt", "C:evil.txt"])
+def test_unsafe_names_are_rejected(name, archive_format):
+    buffer = io.BytesIO()
+    with pytest.raises(ValueError, match="Unsafe name"):
+        write_archive(_tree(name), buffer, archive_format)
+    assert buffer.getvalue() == b""
+
+
+def test_safe_tree_is_written():
+    buffer = io.BytesIO()
+    counts = write_archive(_tree("main.py"), buffer, "zip")
+    assert counts == {"files": 1, "folders": 2}
+    assert zipfile.ZipFile(buffer).namelist() == ["app/", "app/src/", "app/src/main.py"]
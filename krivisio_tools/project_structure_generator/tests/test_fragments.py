@@ -0,0 +1,23 @@
+"""Fragment composition: user-supplied custom folders are taken verbatim."""
+
+from krivisio_tools.project_structure_generator.models.preferences import ProjectPreferences
+from krivisio_tools.project_structure_generator.services.fragment_service import compose_structure
+
+
+def _top_level(custom_folders):
+    preferences = ProjectPreferences(
+        include_docs=False, include_docker=False, include_ci_cd=False, include_tests=False,
+        custom_folders=custom_folders
+    )
+    tree, uncovered = compose_structure("Shop", ["Cart"], ["Django"], preferences)
+    assert uncovered == []
+    return {node["name"]: node for node in tree["children"]}
+
+
+def test_custom_folders_are_not_parsed_as_model_output():
+    top = _top_level(["my custom data folder here", "tools (internal)", "/scripts/db/", "", "../outside"])
+    assert top["my custom data folder here"] == {"name": "my custom data folder here", "type": "folder", "children": []}
+    assert top["tools (internal)"]["type"] == "folder"
+    assert "tools" not in top
+    assert top["scripts"]["children"] == [{"name": "db", "type": "folder", "children": []}]
+    assert top["outside"]["type"] == "folder" and ".." not in top
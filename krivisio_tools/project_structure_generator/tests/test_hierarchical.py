@@ -0,0 +1,47 @@
+"""Hierarchical generation: failed calls degrade, they never abort the request."""
+
+from unittest import mock
+
+from krivisio_tools.project_structure_generator.models.preferences import ProjectPreferences
+from krivisio_tools.project_structure_generator.services import hierarchical_service
+
+
+def _skeleton(*args, **kwargs):
+    return {"name": "app", "type": "folder", "children": [
+        {"name": "backend", "type": "folder", "children": []},
+        {"name": "frontend", "type": "folder", "children": []},
+    ]}
+
+
+def _subtree(description, features, tech_stack, preferences, skeleton, folder_name):
+    if folder_name == "frontend":
+        raise TimeoutError("request timed out")
+    return {"name": folder_name, "type": "folder", "children": [{"name": "main.py", "type": "file"}]}
+
+
+def _generate():
+    return hierarchical_service.generate_hierarchical_structure(
+        "Shop", ["Cart"], ["Django", "React"], ProjectPreferences()
+    )
+
+
+def test_failed_subtree_stays_empty():
+    with mock.patch.object(hierarchical_service, "generate_skeleton", side_effect=_skeleton), \
+            mock.patch.object(hierarchical_service, "generate_subtree", side_effect=_subtree):
+        tree = _generate()
+    backend, frontend = tree["children"]
+    assert backend["children"] == [{"name": "main.py", "type": "file"}]
+    assert frontend["children"] == []
+
+
+def test_all_subtrees_failing_returns_none():
+    with mock.patch.object(hierarchical_service, "generate_skeleton", side_effect=_skeleton), \
+            mock.patch.object(hierarchical_service, "generate_subtree", side_effect=RuntimeError("429")):
+        assert _generate() is None
+
+
+def test_failed_skeleton_returns_none():
+    with mock.patch.object(hierarchical_service, "generate_skeleton", side_effect=TimeoutError("timed out")), \
+            mock.patch.object(hierarchical_service, "generate_subtree") as subtree:
+        assert _generate() is None
+        subtree.assert_not_called()
@@ -0,0 +1,98 @@
+"""
+Parsing regression tests for model output.
+
+The LLM is never called: streaming and repair calls are patched with
+canned replies.
+"""
+
+import json
+from unittest import mock
+
+import pytest
+
+from krivisio_tools.project_structure_generator.services import llm_service
+from krivisio_tools.project_structure_generator.utils import json_cleaner
+from krivisio_tools.project_structure_generator.utils.path_format import IndentedTreeBuilder, starts_with_json
+
+
+TREE = {
+    "name": "app",
+    "type": "folder",
+    "children": [
+        {"name": "src", "type": "folder", "children": [{"name": "main.py", "type": "file"}]},
+        {"name": "README.md", "type": "file"},
+    ],
+}
+
+
+@pytest.fixture(autouse=True)
+def _reset_stats():
+    json_cleaner.reset_json_repair_stats()
+
+
+@pytest.mark.parametrize("text, tier", [
+    (json.dumps(TREE), "direct"),
+    ("```json\n" + json.dumps(TREE) + "\n```", "regex"),
+    ("[Note] the tree follows: " + json.dumps(TREE), "tolerant"),
+    (json.dumps(TREE)[:-3], "tolerant"),
+])
+def test_repair_tiers_run_in_order(text, tier):
+    with mock.patch.object(json_cleaner, "chat_with_llm") as llm:
+        result = json_cleaner.sanitize_and_parse_json(text)
+        llm.assert_not_called()
+    assert result["name"] == "app" and result["children"][0]["name"] == "src"
+    stats = json_cleaner.get_json_repair_stats()
+    assert stats[tier] == stats["total"] == 1
+    assert stats["llm_rate"] == 0.0
+
+
+def test_tolerant_tier_falls_through_to_llm_for_non_trees():
+    with mock.patch.object(json_cleaner, "chat_with_llm", return_value=json.dumps(TREE)) as llm:
+        assert json_cleaner.sanitize_and_parse_json("[Note] no tree here, only [brackets]") == TREE
+        llm.assert_called_once()
+    stats = json_cleaner.get_json_repair_stats()
+    assert (stats["tolerant"], stats["llm"], stats["failed"], stats["total"]) == (0, 1, 0, 1)
+
+
+def test_failed_repair_is_counted():
+    with mock.patch.object(json_cleaner, "chat_with_llm", return_value="still not json"):
+        assert json_cleaner.sanitize_and_parse_json("[Note] nothing") is None
+    stats = json_cleaner.get_json_repair_stats()
+    assert (stats["llm"], stats["failed"], stats["llm_rate"]) == (0, 1, 0.0)
+
+
+def _chunks(text, size=7):
+    """Fake token stream: a generator, so the service can close() it."""
+    for i in range(0, len(text), size):
+        yield text[i:i + size]
+
+
+def test_streamed_json_after_prose_with_brackets():
+    reply = "Here is the layout [paths format]:\n" + json.dumps(TREE, indent=2)
+    with mock.patch.object(llm_service, "stream_chat_with_llm", return_value=_chunks(reply)), \
+            mock.patch.object(json_cleaner, "chat_with_llm") as llm:
+        assert llm_service._stream_directory_structure("prompt") == TREE
+        llm.assert_not_called()
+
+
+FENCED_JSON = "Sure! Here is the structure:\n```json\n" + json.dumps(TREE, indent=2) + "\n```\n"
+
+
+def test_fenced_json_in_paths_mode_is_parsed_as_json():
+    with mock.patch.object(json_cleaner, "chat_with_llm") as llm:
+        assert llm_service._parse_paths_output(FENCED_JSON) == TREE
+        with mock.patch.object(llm_service, "stream_chat_with_llm", return_value=_chunks(FENCED_JSON)):
+            assert llm_service._stream_paths_structure("prompt") == TREE
+        llm.assert_not_called()
+
+
+def test_indented_paths_still_win_over_json_detection():
+    reply = "```\napp/\n  src/\n    main.py\n  README.md\n```\nLet me know if you need changes."
+    assert not starts_with_json(reply)
+    assert llm_service._parse_paths_output(reply) == TREE
+
+
+def test_path_builder_skips_json_lines():
+    builder = IndentedTreeBuilder()
+    builder.feed('app/\n  "name": "src",\n  {\n  src/\n    main.py\n  },\n  README.md\n')
+    assert builder.close() == TREE
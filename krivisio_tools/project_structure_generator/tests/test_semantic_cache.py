@@ -0,0 +1,42 @@
+"""Semantic cache safeguards: near-duplicates only count with the same stack and features."""
+
+from unittest import mock
+
+import numpy as np
+import pytest
+
+from krivisio_tools.project_structure_generator.services import semantic_cache_service as cache
+from krivisio_tools.project_structure_generator.services.vector_index import VectorIndex
+
+
+TREE = {"name": "shop", "type": "folder", "children": []}
+FEATURES = ["Cart", "Checkout", "User accounts"]
+STACK = ["Django", "React"]
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    # Every text embeds to the same vector: similarity is 1.0, so only the safeguard decides
+    vector = np.ones(cache.EMBEDDING_DIMENSIONS, dtype=np.float32)
+    with mock.patch.object(cache, "_index", VectorIndex(dim=cache.EMBEDDING_DIMENSIONS)), \
+            mock.patch.dict(cache._stats, {k: 0 for k in cache._stats}), \
+            mock.patch.object(cache, "get_embedding", return_value=vector):
+        cache.save_semantic_entry("An online shop", FEATURES, STACK, {}, TREE)
+        yield
+
+
+def test_reworded_request_with_same_features_hits():
+    features = ["checkout", "user  accounts", "CART"]
+    assert cache.find_semantic_match("An online store.", features, ["react", "django"], {}) == TREE
+
+
+@pytest.mark.parametrize("features", [FEATURES[:-1], FEATURES + ["Wishlist"], []])
+def test_changed_feature_list_misses(features):
+    assert cache.find_semantic_match("An online shop", features, STACK, {}) is None
+    stats = cache.get_semantic_cache_stats()
+    assert (stats["hits"], stats["rejected_by_safeguard"], stats["safeguard_rejection_rate"]) == (0, 1, 1.0)
+
+
+def test_changed_tech_stack_or_preferences_miss():
+    assert cache.find_semantic_match("An online shop", FEATURES, ["FastAPI", "React"], {}) is None
+    assert cache.find_semantic_match("An online shop", FEATURES, STACK, {"testing": True}) is None
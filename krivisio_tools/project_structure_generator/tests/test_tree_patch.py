@@ -0,0 +1,24 @@
+"""Tree patches: unsafe paths are skipped, never applied."""
+
+from krivisio_tools.project_structure_generator.utils.tree_patch import apply_patch, parse_patch
+
+
+TREE = {"name": "app", "type": "folder", "children": [
+    {"name": "src", "type": "folder", "children": [{"name": "main.py", "type": "file"}]},
+]}
+
+
+def test_unsafe_paths_are_counted_as_skipped():
+    added, removed = parse_patch(
+        "+ ../outside.py\n"
+        "+ src/../../etc/passwd\n"
+        "+ /etc/cron.d/job\n"
+        "+ C:/Windows/evil.dll\n"
+        "+ src\\\\evil.py\n"
+        "- ../src/\n"
+        "+ app/src/utils.py\n"
+    )
+    patched, counts = apply_patch(TREE, added, removed)
+    assert counts == {"added": 1, "removed": 0, "skipped": 6}
+    assert [c["name"] for c in patched["children"]] == ["src"]
+    assert [c["name"] for c in patched["children"][0]["children"]] == ["main.py", "utils.py"]
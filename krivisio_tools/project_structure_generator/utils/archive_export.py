@@ -0,0 +1,218 @@
+"""
+Export a directory structure straight into a zip or tar archive.
+
+Entries are streamed from the tree walker into the archive, so nothing is
+written to a temporary directory and memory does not grow with file content.
+`fileobj` may be a BytesIO, an open file or a non-seekable stream such as a
+pipe or socket (zip falls back to data descriptors, tar uses stream mode).
+
+Files can be filled with short placeholder content chosen by file name or
+extension; everything else is created empty.
+"""
+
+import io
+import json
+import os
+import re
+import tarfile
+import time
+import zipfile
+from typing import BinaryIO, Dict, List, Optional
+
+from krivisio_tools.project_structure_generator.utils.tree_converter import iter_paths
+
+
+ARCHIVE_FORMATS = ("zip", "tar", "tar.gz")
+_STORE_BELOW = 256
+_DRIVE_RE = re.compile(r"^[A-Za-z]:")
+
+_GITIGNORE = "__pycache__/\n*.pyc\n.env\n.venv/\nnode_modules/\ndist/\nbuild/\n.DS_Store\n"
+
+# Exact file names first, then extensions; {project} and {stem} are filled in
+_PLACEHOLDERS_BY_NAME = {
+    "readme.md": "# {project}\n",
+    ".gitignore": _GITIGNORE,
+    ".dockerignore": ".git\n.env\n__pycache__/\nnode_modules/\n",
+    ".env.example": "# Copy to .env and fill in\n",
+    "requirements.txt": "",
+    "dockerfile": "# Build instructions for {project}\n",
+    "__init__.py": "",
+}
+_PLACEHOLDERS_BY_EXT = {
+    ".py": '"""{stem}"""\n',
+    ".md": "# {stem}\n",
+    ".js": "// {stem}\n",
+    ".jsx": "// {stem}\n",
+    ".ts": "// {stem}\n",
+    ".tsx": "// {stem}\n",
+    ".css": "/* {stem} */\n",
+    ".html": "<!doctype html>\n<title>{project}</title>\n",
+    ".yml": "# {stem}\n",
+    ".yaml": "# {stem}\n",
+    ".sh": "#!/usr/bin/env sh\n",
+}
+
+
+def placeholder_content(path: str, project_name: str) -> bytes:
+    """
+    Placeholder content for a file path (empty for unknown types).
+
+    Args:
+        path (str): File path inside the archive.
+        project_name (str): Root folder name.
+
+    Returns:
+        bytes: UTF-8 content.
+    """
+    name = os.path.basename(path)
+    stem, ext = os.path.splitext(name)
+    if name.lower() == "package.json":
+        return (json.dumps({"name": project_name, "version": "0.1.0", "private": True}, indent=2) + "\n").encode("utf-8")
+    template = _PLACEHOLDERS_BY_NAME.get(name.lower(), _PLACEHOLDERS_BY_EXT.get(ext.lower(), ""))
+    return template.format(project=project_name, stem=stem).encode("utf-8")
+
+
+def _check_entry_names(structure: Dict) -> None:
+    """
+    Reject node names that would escape the archive root when extracted
+    (zip-slip): empty, "." or "..", path separators, or absolute/drive paths.
+
+    Raises:
+        ValueError: On the first unsafe name.
+    """
+    stack: List[Dict] = [structure]
+    while stack:
+        node = stack.pop()
+        name = node["name"]
+        if (
+            not isinstance(name, str) or name.strip() in ("", ".", "..")
+            or "/" in name or "\\" in name or "\x00" in name
+            or _DRIVE_RE.match(name)
+        ):
+            raise ValueError(f"Unsafe name for an archive entry: {name!r}")
+        stack.extend(node.get("children", []) if node["type"] == "folder" else [])
+
+
+def write_archive(
+    structure: Dict,
+    fileobj: BinaryIO,
+    archive_format: str = "zip",
+    placeholders: bool = True
+) -> Dict[str, int]:
+    """
+    Stream a structure into an archive written to `fileobj`.
+
+    Args:
+        structure (dict): Directory tree (name/type/children).
+        fileobj (BinaryIO): Writable binary stream.
+        archive_format (str): "zip", "tar" or "tar.gz".
+        placeholders (bool): Fill files with placeholder content.
+
+    Returns:
+        dict: Counts of files and folders written.
+
+    Raises:
+        ValueError: If the format is unsupported or a node name is unsafe.
+    """
+    if archive_format not in ARCHIVE_FORMATS:
+        raise ValueError(f"Unsupported archive format: '{archive_format}'. Choose one of {', '.join(ARCHIVE_FORMATS)}.")
+    # Checked before writing, so a bad tree never leaves a partial archive
+    _check_entry_names(structure)
+
+    project = structure["name"]
+    counts = {"files": 0, "folders": 0}
+    # An integer mtime keeps tar in plain ustar headers (a float forces a PAX header per entry)
+    mtime = int(time.time())
+
+    if archive_format == "zip":
+        with zipfile.ZipFile(fileobj, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            date_time = time.localtime(mtime)[:6]
+            for path in iter_paths(structure):
+                info = zipfile.ZipInfo(path, date_time=date_time)
+                if path.endswith("/"):
+                    info.external_attr = (0o40755 << 16) | 0x10
+                    archive.writestr(info, b"")
+                    counts["folders"] += 1
+                else:
+                    data = placeholder_content(path, project) if placeholders else b""
+                    info.external_attr = 0o644 << 16
+                    # Deflating a few bytes only costs time; store small files as-is
+                    info.compress_type = zipfile.ZIP_DEFLATED if len(data) > _STORE_BELOW else zipfile.ZIP_STORED
+                    archive.writestr(info, data)
+                    counts["files"] += 1
+        return counts
+
+    mode = "w|gz" if archive_format == "tar.gz" else "w|"
+    with tarfile.open(fileobj=fileobj, mode=mode) as archive:
+        for path in iter_paths(structure):
+            info = tarfile.TarInfo(path.rstrip("/"))
+            info.mtime = mtime
+            if path.endswith("/"):
+                info.type = tarfile.DIRTYPE
+                info.mode = 0o755
+                archive.addfile(info)
+                counts["folders"] += 1
+            else:
+                data = placeholder_content(path, project) if placeholders else b""
+                info.size = len(data)
+                info.mode = 0o644
+                archive.addfile(info, io.BytesIO(data))
+                counts["files"] += 1
+            # Stream mode never reads members back; don't keep one TarInfo per entry
+            archive.members.clear()
+    return counts
+
+
+def export_archive(
+    structure: Dict,
+    archive_format: str = "zip",
+    placeholders: bool = True,
+    path: Optional[str] = None
+) -> bytes:
+    """
+    Build an archive in memory, or write it to `path` when given.
+
+    Args:
+        structure (dict): Directory tree.
+        archive_format (str): "zip", "tar" or "tar.gz".
+        placeholders (bool): Fill files with placeholder content.
+        path (str, optional): Output file; the archive is then not kept in memory.
+
+    Returns:
+        bytes: Archive content (empty when written to `path`).
+    """
+    if path:
+        with open(path, "wb") as f:
+            write_archive(structure, f, archive_format, placeholders)
+        return b""
+    buffer = io.BytesIO()
+    write_archive(structure, buffer, archive_format, placeholders)
+    return buffer.getvalue()
+
+
+if __name__ == "__main__":
+    import tracemalloc
+
+    # ~50k nodes: 500 packages x 10 folders x 9 files
+    tree = {"name": "big-project", "type": "folder", "children": [
+        {"name": f"pkg{p}", "type": "folder", "children": [
+            {"name": f"mod{m}", "type": "folder", "children": [
+                {"name": f"file_{f}.py", "type": "file"} for f in range(9)
+            ]} for m in range(10)
+        ]} for p in range(500)
+    ]}
+
+    for archive_format in ARCHIVE_FORMATS:
+        start = time.perf_counter()
+        with open(os.devnull, "wb") as sink:
+            counts = write_archive(tree, sink, archive_format)
+        elapsed = time.perf_counter() - start
+
+        # Separate pass: tracing slows the writer down several times
+        tracemalloc.start()
+        with open(os.devnull, "wb") as sink:
+            write_archive(tree, sink, archive_format)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"{archive_format:<7} {counts['files'] + counts['folders']} entries in {elapsed * 1000:.0f} ms, "
+              f"peak {peak / 1e6:.1f} MB")
@@ -1,18 +1,67 @@
 import json
 import re
-from typing import Any, Optional
+import threading
+from typing import Any, Dict, Optional
 
 from krivisio_tools.project_structure_generator.utils.llm_client import chat_with_llm
+from krivisio_tools.project_structure_generator.services.validation_service import is_valid_structure
+from krivisio_tools.project_structure_generator.utils.tolerant_json import TolerantJSONError, parse_tolerant
+from krivisio_tools.report_generation.app.services.agent_integration.prompt_engineering import finalize_prompt
+
+
+_TIERS = ("direct", "regex", "tolerant", "llm", "failed")
+# Start positions (the text, then each later "{") the tolerant tier tries
+_TOLERANT_MAX_STARTS = 8
+_stats_lock = threading.Lock()
+_tier_stats = {tier: 0 for tier in _TIERS}
+
+
+def _record(tier: str) -> None:
+    with _stats_lock:
+        _tier_stats[tier] += 1
+
+
+def get_json_repair_stats() -> Dict:
+    """How often each repair tier produced the parsed result in this process."""
+    with _stats_lock:
+        stats = dict(_tier_stats)
+    total = sum(stats.values())
+    return {
+        **stats,
+        "total": total,
+        "llm_rate": round(stats["llm"] / total, 4) if total else 0.0,
+    }
+
+
+def reset_json_repair_stats() -> None:
+    with _stats_lock:
+        for tier in _TIERS:
+            _tier_stats[tier] = 0
+
+
+def _prune_incomplete(node: Any) -> None:
+    """Drop children cut off mid-object by truncation (no name or type)."""
+    if not isinstance(node, dict) or not isinstance(node.get("children"), list):
+        return
+    node["children"] = [
+        child for child in node["children"]
+        if isinstance(child, dict) and child.get("name") and child.get("type") in ("file", "folder")
+    ]
+    for child in node["children"]:
+        _prune_incomplete(child)
 
 
 def sanitize_and_parse_json(text: str) -> Optional[Any]:
     """
-    Attempts to sanitize and parse JSON content. Uses regex cleanup first,
-    then falls back to LLM to auto-correct malformed JSON if needed.
+    Attempts to sanitize and parse JSON content. Tries, in order: a direct
+    parse, regex cleanup, the local tolerant parser, and only then an LLM
+    repair call. Tier usage is reported by `get_json_repair_stats`.
     """
     # Try direct parse
     try:
-        return json.loads(text)
+        result = json.loads(text)
+        _record("direct")
+        return result
     except json.JSONDecodeError:
         pass
 
@@ -34,9 +83,31 @@ def sanitize_and_parse_json(text: str) -> Optional[Any]:
         cleaned = re.sub(r'"\s*:\s*([a-zA-Z0-9_./\-]+)(?=\s*[,}])', r'": "\1"', cleaned)
         cleaned = re.sub(r',(\s*[}\]])', r'\1', cleaned)
 
-        return json.loads(cleaned)
+        result = json.loads(cleaned)
+        _record("regex")
+        return result
     except Exception:
-        pass  # Proceed to LLM fallback
+        pass
+
+    # Local fault-tolerant parse (quotes, barewords, comments, truncation).
+    # Only a valid tree counts; a bracket in leading prose would otherwise
+    # parse as the payload, so retry from each later "{".
+    start, attempts = 0, 0
+    while start != -1 and attempts < _TOLERANT_MAX_STARTS:
+        attempts += 1
+        try:
+            result, truncated = parse_tolerant(text[start:])
+        except TolerantJSONError:
+            result, truncated = None, False
+        if isinstance(result, dict):
+            if truncated:
+                _prune_incomplete(result)
+            if is_valid_structure(result):
+                if truncated:
+                    print("⚠️ JSON output was truncated; closed open containers.")
+                _record("tolerant")
+                return result
+        start = text.find("{", start + 1)
 
     # Fallback: Use LLM to fix the structure
     try:
@@ -58,10 +129,14 @@ Your task:
 Broken JSON:
 {text}
 """
+        prompt = finalize_prompt("json_repair", prompt)
 
         llm_fixed = chat_with_llm(prompt)
         print(f"LLM fixed JSON: {llm_fixed}")
-        return json.loads(llm_fixed)
+        result = json.loads(llm_fixed)
+        _record("llm")
+        return result
     except Exception as e:
+        _record("failed")
         print(f"❌ JSON parsing failed after LLM fix: {e}")
         return None
@@ -4,7 +4,7 @@ Includes preprocessing for prompt outputs.
 """
 
 import re
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterator, Optional
 from openai import OpenAI
 from krivisio_tools.report_generation.app.core.config import KRIVISIO_STRUCTURE_GENERATION_TOOL
 
@@ -64,3 +64,40 @@ def chat_with_llm(
 
     raw_response = response.choices[0].message.content.strip()
     return strip_code_fences(raw_response)
+
+
+def stream_chat_with_llm(
+    prompt: str,
+    model: str = "gpt-4o",
+    temperature: float = 0.7,
+    max_tokens: int = 800,
+    frequency_penalty: float = 0.3,
+    presence_penalty: float = 0.2
+) -> Iterator[str]:
+    """
+    Streams the model's response as text chunks.
+
+    Closing the generator early (e.g. `break` in the consuming loop) closes
+    the HTTP stream, so no further tokens are generated or billed.
+
+    Args:
+        Same as `chat_with_llm`, without conversation history.
+
+    Yields:
+        str: Content deltas in arrival order (code fences are not stripped).
+    """
+    stream = client.chat.completions.create(
+        model=model,
+        messages=[{"role": "user", "content": prompt}],
+        temperature=temperature,
+        max_tokens=max_tokens,
+        frequency_penalty=frequency_penalty,
+        presence_penalty=presence_penalty,
+        stream=True
+    )
+    try:
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+    finally:
+        stream.close()
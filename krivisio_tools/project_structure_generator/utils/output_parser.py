@@ -31,7 +31,8 @@ def parse_llm_output(response_text: str) -> Union[Dict, None]:
 
 def is_valid_structure(structure: Dict) -> bool:
     """
-    Recursively validates that the structure follows expected schema:
+    Validates that the structure follows expected schema (iteratively, so
+    deep trees cannot exhaust the recursion limit):
     - Each node must have: name (str), type ('file' or 'folder')
     - If type == 'folder', must optionally include 'children': list
 
@@ -41,22 +42,23 @@ def is_valid_structure(structure: Dict) -> bool:
     Returns:
         bool: True if structure is valid
     """
-    if not isinstance(structure, dict):
-        return False
-
-    if "name" not in structure or "type" not in structure:
-        return False
+    stack = [structure]
+    while stack:
+        node = stack.pop()
+        if not isinstance(node, dict):
+            return False
 
-    if structure["type"] not in ("file", "folder"):
-        return False
+        if "name" not in node or "type" not in node:
+            return False
 
-    if structure["type"] == "folder":
-        children = structure.get("children", [])
-        if not isinstance(children, list):
+        if node["type"] not in ("file", "folder"):
             return False
-        for child in children:
-            if not is_valid_structure(child):
+
+        if node["type"] == "folder":
+            children = node.get("children", [])
+            if not isinstance(children, list):
                 return False
+            stack.extend(children)
 
     return True
 
@@ -0,0 +1,225 @@
+"""
+Compact indented-path format for directory structures.
+
+One line per node, two spaces of indentation per level, folders marked by a
+trailing slash:
+
+    my-app/
+      backend/
+        main.py
+      README.md
+
+The nested name/type/children JSON spends most of its tokens on keys and
+punctuation; this format carries the same tree in well under half the
+tokens. It is used for few-shot examples in the prompt and for the model's
+output, which is expanded locally into the usual tree dict.
+
+The parser is lenient about what models actually emit: tree-drawing glyphs
+(├── │ └──), bullet markers, inline comments, code fences, prose before or
+after the tree, and full path lines such as `my-app/src/main.py`.
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+
+INDENT = "  "
+
+_PREFIX_RE = re.compile(r"^([\s│├└┬─|`]*)(?:[-*+]\s+)?")
+_COMMENT_RE = re.compile(r"\s+(?:#|//|<-|←|—|\(\s*).*$")
+_JSON_CHARS = set('"{}:')
+_JSON_PUNCTUATION_RE = re.compile(r"^[\[\]{},]+$")
+
+
+def to_indented_paths(structure: Dict) -> str:
+    """
+    Render a tree dict in the indented-path format.
+
+    Args:
+        structure (dict): Directory tree (name/type/children).
+
+    Returns:
+        str: One line per node.
+    """
+    lines: List[str] = []
+    stack: List[Tuple[Dict, int]] = [(structure, 0)]
+    while stack:
+        node, depth = stack.pop()
+        if node.get("type") == "folder":
+            lines.append(f"{INDENT * depth}{node['name']}/")
+            stack.extend((child, depth + 1) for child in reversed(node.get("children", [])))
+        else:
+            lines.append(f"{INDENT * depth}{node['name']}")
+    return "\n".join(lines)
+
+
+def _is_prose(name: str) -> bool:
+    """Heuristic for explanation lines mixed into the tree."""
+    return name.endswith(":") or len(name.split()) > 3
+
+
+def _is_json_line(entry: str) -> bool:
+    """Lines of a JSON reply (quotes, braces, colons) are never tree entries."""
+    return bool(_JSON_CHARS.intersection(entry)) or bool(_JSON_PUNCTUATION_RE.match(entry))
+
+
+def starts_with_json(text: str) -> bool:
+    """
+    True if the model answered with a JSON object instead of indented paths.
+
+    Blank lines, code fences and prose are skipped: the reply is JSON when a
+    line opening an object comes before the first folder line (the root of
+    an indented tree always ends with "/").
+    """
+    for line in text.splitlines():
+        stripped = line.strip().strip("`")
+        if stripped.startswith("{"):
+            return True
+        if stripped.rstrip().endswith("/"):
+            return False
+    return False
+
+
+class IndentedTreeBuilder:
+    """
+    Line-oriented builder for the indented-path format.
+
+    Chunks may split lines anywhere; only complete lines are consumed until
+    `close()`. `feed` returns True once the tree is followed by a closing code
+    fence or prose, so a streaming caller can stop early.
+    """
+
+    def __init__(self):
+        self.roots: List[Dict] = []
+        self.done = False
+        self.nodes = 0
+        self._pending = ""
+        self._stack: List[Tuple[int, Dict]] = []
+        self._folders: Dict[int, Dict[str, Dict]] = {}
+
+    def _child(self, parent: Optional[Dict], name: str, is_folder: bool) -> Dict:
+        """Return the named child of `parent`, creating it (and merging repeated folders)."""
+        siblings = self.roots if parent is None else parent.setdefault("children", [])
+        if parent is not None and parent.get("type") != "folder":
+            parent["type"] = "folder"
+        index = self._folders.setdefault(id(parent), {})
+        if is_folder and name in index:
+            return index[name]
+        node = {"name": name, "type": "folder", "children": []} if is_folder else {"name": name, "type": "file"}
+        siblings.append(node)
+        self.nodes += 1
+        if is_folder:
+            index[name] = node
+        return node
+
+    def _line(self, raw: str) -> None:
+        line = raw.expandtabs(4).rstrip()
+        if not line.strip():
+            return
+        if line.lstrip().startswith("```"):
+            if self.roots:
+                self.done = True
+            return
+
+        prefix = _PREFIX_RE.match(line)
+        indent = len(prefix.group(1))
+        entry = _COMMENT_RE.sub("", line[prefix.end():]).strip().strip("`\"'")
+        if not entry or entry in ("/", "./"):
+            return
+        if _is_prose(entry):
+            if self.roots:
+                self.done = True
+            return
+        if _is_json_line(entry):
+            return
+
+        is_folder = entry.endswith("/")
+        segments = [s for s in entry.strip("/").split("/") if s and s != "."]
+        if not segments:
+            return
+
+        while self._stack and self._stack[-1][0] >= indent:
+            self._stack.pop()
+        parent = self._stack[-1][1] if self._stack else None
+
+        # A full path repeating the root name belongs under the root
+        if parent is None and self.roots and len(segments) > 1 and segments[0] == self.roots[0]["name"]:
+            parent, segments = self.roots[0], segments[1:]
+
+        for name in segments[:-1]:
+            parent = self._child(parent, name, True)
+        node = self._child(parent, segments[-1], is_folder)
+        if node["type"] == "folder":
+            self._stack.append((indent, node))
+
+    def feed(self, chunk: str) -> bool:
+        """
+        Consume streamed text.
+
+        Returns:
+            bool: True once the tree is complete.
+        """
+        if self.done:
+            return True
+        lines = (self._pending + chunk).split("\n")
+        self._pending = lines.pop()
+        for line in lines:
+            self._line(line)
+            if self.done:
+                break
+        return self.done
+
+    def close(self) -> Optional[Dict]:
+        """
+        Flush the last line and return the tree.
+
+        Entries left at the top level next to the root (lost indentation) are
+        moved into the root folder.
+
+        Returns:
+            dict | None: Tree dict, or None if no entries were read.
+        """
+        if self._pending and not self.done:
+            self._line(self._pending)
+        self._pending = ""
+        if not self.roots:
+            return None
+        root = self.roots[0]
+        if len(self.roots) > 1:
+            if root["type"] != "folder":
+                root = {"name": "project", "type": "folder", "children": self.roots}
+            else:
+                root["children"].extend(self.roots[1:])
+        return root
+
+
+def parse_indented_paths(text: str) -> Optional[Dict]:
+    """
+    Expand indented-path text into a tree dict.
+
+    Args:
+        text (str): Model output.
+
+    Returns:
+        dict | None: Tree dict, or None if the text holds no entries.
+    """
+    builder = IndentedTreeBuilder()
+    builder.feed(text)
+    return builder.close()
+
+
+if __name__ == "__main__":
+    import json
+    from krivisio_tools.project_structure_generator.models.examples import get_example_repos
+    from krivisio_tools.project_structure_generator.services.index_builder import normalize_structure
+    from krivisio_tools.report_generation.app.services.agent_integration.prompt_engineering import compact_json, count_tokens
+
+    json_tokens = path_tokens = 0
+    for example in get_example_repos():
+        tree = normalize_structure(example["structure"])
+        rendered = to_indented_paths(tree)
+        assert parse_indented_paths(rendered) == tree, example["description"]
+        json_tokens += count_tokens(compact_json(tree))
+        path_tokens += count_tokens(rendered)
+    print(f"JSON: {json_tokens} tokens, indented paths: {path_tokens} tokens "
+          f"({1 - path_tokens / json_tokens:.0%} fewer)")
@@ -1,16 +1,31 @@
 from typing import List, Dict
+from krivisio_tools.report_generation.app.core.config import STRUCTURE_OUTPUT_FORMAT
 from krivisio_tools.project_structure_generator.models.preferences import ProjectPreferences
+from krivisio_tools.project_structure_generator.utils.path_format import to_indented_paths
+from krivisio_tools.report_generation.app.services.agent_integration.prompt_engineering import compact_json, finalize_prompt
 
-def build_prompt(
+_FORMAT_EXAMPLE = {
+    "name": "my-app",
+    "type": "folder",
+    "children": [
+        {"name": "backend", "type": "folder", "children": [{"name": "main.py", "type": "file"}]},
+        {"name": "README.md", "type": "file"}
+    ]
+}
+
+
+def _check_output_format(output_format: str) -> None:
+    if output_format not in ("paths", "json"):
+        raise ValueError(f"Unknown output format: '{output_format}'. Choose 'paths' or 'json'.")
+
+
+def _project_context_lines(
     project_description: str,
     features: List[str],
     tech_stack: List[str],
-    preferences: ProjectPreferences,
-    similar_examples: List[Dict] = []
-) -> str:
-    """
-    Builds a precise, strict prompt to instruct the LLM to generate a valid directory structure.
-    """
+    preferences: ProjectPreferences
+) -> List[str]:
+    """Role, project overview and preferences shared by all structure prompts."""
     prompt_lines = []
 
     # Role and intent
@@ -32,13 +47,27 @@ def build_prompt(
     for k, v in preferences.to_dict().items():
         prompt_lines.append(f"- {k}: {v}")
 
-    # Similar examples (optional)
-    if similar_examples:
-        prompt_lines.append("\n📁 Similar Examples:")
-        for ex in similar_examples:
-            prompt_lines.append(f"- Description: {ex['description']}")
-            prompt_lines.append(f"  Tech Stack: {', '.join(ex['tech_stack'])}")
-            prompt_lines.append(f"  Structure:\n  {ex['structure']}\n")
+    return prompt_lines
+
+
+def _output_format_lines(output_format: str) -> List[str]:
+    """Strict output-format instructions, schema example and closing reminder."""
+    prompt_lines = []
+
+    if output_format == "paths":
+        # Formatting requirements
+        prompt_lines.append("\n✅ Output Format (MUST FOLLOW STRICTLY):")
+        prompt_lines.append("- One line per file or folder, starting with a single root folder.")
+        prompt_lines.append("- Indent each level by exactly two spaces under its parent folder.")
+        prompt_lines.append("- Folder names end with \"/\"; file names do not.")
+        prompt_lines.append("- No tree glyphs, bullets, comments, markdown, or explanation.")
+
+        # Add a small schema example
+        prompt_lines.append("\n🧾 Example Format:")
+        prompt_lines.append(to_indented_paths(_FORMAT_EXAMPLE))
+
+        prompt_lines.append("\n⛔ Output ONLY the indented tree. Nothing before or after it.")
+        return prompt_lines
 
     # Formatting requirements
     prompt_lines.append("\n✅ Output Format (MUST FOLLOW STRICTLY):")
@@ -52,23 +81,178 @@ def build_prompt(
 
     # Add a small schema example
     prompt_lines.append("\n🧾 Example Schema:")
-    prompt_lines.append('''{
-  "name": "my-app",
-  "type": "folder",
-  "children": [
-    {
-      "name": "backend",
-      "type": "folder",
-      "children": [
-        {
-          "name": "main.py",
-          "type": "file"
-        }
-      ]
-    }
-  ]
-}''')
+    prompt_lines.append(compact_json({
+        "name": "my-app",
+        "type": "folder",
+        "children": [
+            {"name": "backend", "type": "folder", "children": [{"name": "main.py", "type": "file"}]}
+        ]
+    }))
 
     prompt_lines.append("\n⛔ Output ONLY valid JSON. No markdown, comments, or backticks. No extra fields.")
+    return prompt_lines
+
+
+def build_prompt(
+    project_description: str,
+    features: List[str],
+    tech_stack: List[str],
+    preferences: ProjectPreferences,
+    similar_examples: List[Dict] = [],
+    output_format: str = STRUCTURE_OUTPUT_FORMAT
+) -> str:
+    """
+    Builds a precise, strict prompt to instruct the LLM to generate a valid directory structure.
+
+    `output_format` "paths" asks for the compact indented-path format
+    (see utils.path_format); "json" asks for the nested name/type/children object.
+    """
+    _check_output_format(output_format)
+
+    prompt_lines = _project_context_lines(project_description, features, tech_stack, preferences)
+
+    # Similar examples (optional)
+    if similar_examples:
+        prompt_lines.append("\n📁 Similar Examples:")
+        for ex in similar_examples:
+            prompt_lines.append(f"- Description: {ex['description']}")
+            prompt_lines.append(f"  Tech Stack: {', '.join(ex['tech_stack'])}")
+            if output_format == "paths":
+                prompt_lines.append("  Structure:")
+                prompt_lines.append(to_indented_paths(ex["structure"]))
+            else:
+                prompt_lines.append(f"  Structure: {compact_json(ex['structure'])}")
+
+    prompt_lines.extend(_output_format_lines(output_format))
+
+    return finalize_prompt("project_structure", "\n".join(prompt_lines))
+
+
+def build_skeleton_prompt(
+    project_description: str,
+    features: List[str],
+    tech_stack: List[str],
+    preferences: ProjectPreferences,
+    similar_examples: List[Dict] = [],
+    output_format: str = STRUCTURE_OUTPUT_FORMAT
+) -> str:
+    """
+    Builds the first-stage prompt of hierarchical generation: the root folder
+    and its direct children only (one folder per service/component).
+    """
+    _check_output_format(output_format)
+
+    prompt_lines = _project_context_lines(project_description, features, tech_stack, preferences)
+
+    # Top levels of similar examples are enough to convey the layout
+    if similar_examples:
+        prompt_lines.append("\n📁 Similar Project Layouts:")
+        for ex in similar_examples:
+            top_level = [
+                child["name"] + ("/" if child.get("type") == "folder" else "")
+                for child in ex["structure"].get("children", [])
+            ]
+            prompt_lines.append(f"- {ex['description']}: {', '.join(top_level)}")
+
+    prompt_lines.append("\n🎯 Task:")
+    prompt_lines.append("List ONLY the root folder and its direct children: one folder per service, app, package or")
+    prompt_lines.append("infrastructure area, plus root-level files. Leave every folder empty; its contents are generated separately.")
+
+    prompt_lines.extend(_output_format_lines(output_format))
+
+    return finalize_prompt("project_skeleton", "\n".join(prompt_lines))
+
+
+def build_subtree_prompt(
+    project_description: str,
+    features: List[str],
+    tech_stack: List[str],
+    preferences: ProjectPreferences,
+    skeleton: Dict,
+    folder_name: str,
+    output_format: str = STRUCTURE_OUTPUT_FORMAT
+) -> str:
+    """
+    Builds the second-stage prompt of hierarchical generation: the complete
+    contents of one top-level folder, with the skeleton as context.
+    """
+    _check_output_format(output_format)
+
+    prompt_lines = _project_context_lines(project_description, features, tech_stack, preferences)
+
+    prompt_lines.append("\n🗂️ Top-Level Layout (already decided):")
+    prompt_lines.append(to_indented_paths(skeleton))
+
+    prompt_lines.append("\n🎯 Task:")
+    prompt_lines.append(f"Generate the COMPLETE contents of the `{folder_name}/` folder only, with `{folder_name}` as the root folder.")
+    prompt_lines.append("Do not repeat files that belong to the other top-level folders.")
+
+    prompt_lines.extend(_output_format_lines(output_format))
+
+    return finalize_prompt("project_subtree", "\n".join(prompt_lines))
+
+
+def build_extension_prompt(
+    project_description: str,
+    features: List[str],
+    tech_stack: List[str],
+    preferences: ProjectPreferences,
+    base_structure: Dict,
+    technologies: List[str],
+    output_format: str = STRUCTURE_OUTPUT_FORMAT
+) -> str:
+    """
+    Builds a prompt asking only for the additions a template-composed
+    structure needs for `technologies` the templates do not cover.
+    """
+    _check_output_format(output_format)
+
+    prompt_lines = _project_context_lines(project_description, features, tech_stack, preferences)
+
+    prompt_lines.append("\n🗂️ Base Structure (composed from standard templates):")
+    prompt_lines.append(to_indented_paths(base_structure))
+
+    prompt_lines.append("\n🎯 Task:")
+    prompt_lines.append(f"Add ONLY the files and folders still missing for: {', '.join(technologies)}.")
+    prompt_lines.append(f"Output just the additions and the folders that contain them, with `{base_structure['name']}` as the root folder.")
+    prompt_lines.append("Do not repeat entries that already exist.")
+
+    prompt_lines.extend(_output_format_lines(output_format))
+
+    return finalize_prompt("project_extension", "\n".join(prompt_lines))
+
+
+def build_patch_prompt(
+    project_description: str,
+    features: List[str],
+    tech_stack: List[str],
+    preferences: ProjectPreferences,
+    previous_structure: Dict,
+    added_features: List[str],
+    removed_features: List[str]
+) -> str:
+    """
+    Builds a prompt asking only for the changes (see utils.tree_patch) that
+    an existing structure needs after features were added or removed.
+    """
+    prompt_lines = _project_context_lines(project_description, features, tech_stack, preferences)
+
+    prompt_lines.append("\n🗂️ Current Structure:")
+    prompt_lines.append(to_indented_paths(previous_structure))
+
+    prompt_lines.append("\n🔄 Feature Changes:")
+    for feature in added_features:
+        prompt_lines.append(f"+ {feature.strip()}")
+    for feature in removed_features:
+        prompt_lines.append(f"- {feature.strip()}")
+
+    prompt_lines.append("\n✅ Output Format (MUST FOLLOW STRICTLY):")
+    prompt_lines.append("- Output ONLY the changes to the structure, one per line.")
+    prompt_lines.append("- \"+ path\" adds a file or folder; \"- path\" removes it with everything inside.")
+    prompt_lines.append(f"- Paths are relative to `{previous_structure['name']}/`; folder paths end with \"/\".")
+    prompt_lines.append("- Touch only what the feature changes require. No explanation.")
+
+    prompt_lines.append("\n🧾 Example:")
+    prompt_lines.append("+ src/payments/\n+ src/payments/service.py\n- src/legacy_checkout/")
 
-    return "\n".join(prompt_lines)
+    return finalize_prompt("project_patch", "\n".join(prompt_lines))
@@ -0,0 +1,240 @@
+"""
+Incremental JSON parser for streamed directory-structure output.
+
+Text chunks from a streaming completion are fed in as they arrive. The
+parser builds the tree as it goes and validates every file/folder node the
+moment its object closes, using the same rules as
+`output_parser.is_valid_structure`. `feed` returns True as soon as the root
+object is complete, so the caller can stop the stream without paying for
+trailing tokens.
+
+Two kinds of failure are reported:
+- InvalidNodeError: well-formed JSON describing an invalid tree (missing
+  name, bad type, ...). Unrecoverable; the stream should be aborted.
+- JSONSyntaxError: text that is not strict JSON (single quotes, comments,
+  ...). The full response may still be repairable by `json_cleaner`.
+"""
+
+from typing import Any, Dict, List, Optional
+
+
+class StreamParseError(ValueError):
+    """Base error for incremental parsing."""
+
+
+class JSONSyntaxError(StreamParseError):
+    """The stream is not strict JSON at some position."""
+
+
+class InvalidNodeError(StreamParseError):
+    """A completed node violates the directory-structure schema."""
+
+
+_WHITESPACE = " \t\r\n"
+_LITERAL_CHARS = set("0123456789+-.eEtrufalsn")
+_LITERALS = {"true": True, "false": False, "null": None}
+_ESCAPES = {'"': '"', "\\": "\\", "/": "/", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t"}
+_NODE_TYPES = ("file", "folder")
+
+
+def _validate_node(node: Any) -> None:
+    """Check one node; its children were already validated when they closed."""
+    if not isinstance(node, dict):
+        raise InvalidNodeError(f"Expected a file/folder object, got {type(node).__name__}.")
+    if not isinstance(node.get("name"), str) or not node["name"]:
+        raise InvalidNodeError(f"Node without a valid name: {list(node)}")
+    if node.get("type") not in _NODE_TYPES:
+        raise InvalidNodeError(f"Node '{node['name']}' has invalid type {node.get('type')!r}.")
+    if node["type"] == "folder" and not isinstance(node.get("children", []), list):
+        raise InvalidNodeError(f"Folder '{node['name']}' has non-list children.")
+
+
+class IncrementalTreeParser:
+    """
+    Push parser for a single JSON directory tree.
+
+    Usage:
+        parser = IncrementalTreeParser()
+        for chunk in stream:
+            if parser.feed(chunk):
+                break
+        tree = parser.result
+    """
+
+    def __init__(self):
+        self.result: Optional[Dict] = None
+        self.done = False
+        self.nodes_validated = 0
+        self.chars_consumed = 0
+        # Frames: [container, pending_key, is_node_list]
+        self._stack: List[list] = []
+        self._state = "pre"          # pre | value | key | colon | comma | string | literal
+        self._string_is_key = False
+        self._buffer: List[str] = []
+        self._escape = False
+        self._unicode: Optional[str] = None
+
+    # ── value assembly ────────────────────────────────────────────────────
+    def _attach(self, value: Any) -> None:
+        """Attach a completed value to its parent container."""
+        if not self._stack:
+            return
+        container, key, _ = self._stack[-1]
+        if isinstance(container, dict):
+            if key == "type" and value not in _NODE_TYPES:
+                raise InvalidNodeError(f"Invalid node type {value!r}.")
+            container[key] = value
+            self._stack[-1][1] = None
+        else:
+            container.append(value)
+        self._state = "comma"
+
+    def _open(self, container) -> None:
+        is_node_list = bool(
+            isinstance(container, list) and self._stack
+            and isinstance(self._stack[-1][0], dict) and self._stack[-1][1] == "children"
+        )
+        if isinstance(container, dict) and not self._stack and self.result is None:
+            self.result = container
+        self._stack.append([container, None, is_node_list])
+        self._state = "key" if isinstance(container, dict) else "value"
+
+    def _close(self) -> None:
+        container, _, _ = self._stack.pop()
+        if isinstance(container, dict):
+            parent_is_node_list = not self._stack or self._stack[-1][2]
+            if parent_is_node_list:
+                _validate_node(container)
+                self.nodes_validated += 1
+        if not self._stack:
+            self.done = True
+            return
+        self._attach(container)
+
+    def _finish_literal(self) -> None:
+        token = "".join(self._buffer)
+        self._buffer.clear()
+        if token in _LITERALS:
+            value = _LITERALS[token]
+        else:
+            try:
+                value = float(token) if any(c in token for c in ".eE") else int(token)
+            except ValueError:
+                raise JSONSyntaxError(f"Invalid literal {token!r}.")
+        self._attach(value)
+
+    # ── main loop ─────────────────────────────────────────────────────────
+    def feed(self, chunk: str) -> bool:
+        """
+        Consume the next chunk of streamed text.
+
+        Returns:
+            bool: True once the root object has closed.
+
+        Raises:
+            JSONSyntaxError, InvalidNodeError
+        """
+        i, n = 0, len(chunk)
+        while i < n and not self.done:
+            state = self._state
+
+            if state == "string":
+                if self._unicode is not None:
+                    take = min(4 - len(self._unicode), n - i)
+                    self._unicode += chunk[i:i + take]
+                    i += take
+                    if len(self._unicode) == 4:
+                        try:
+                            self._buffer.append(chr(int(self._unicode, 16)))
+                        except ValueError:
+                            raise JSONSyntaxError(f"Invalid unicode escape \\u{self._unicode}.")
+                        self._unicode = None
+                    continue
+                if self._escape:
+                    c = chunk[i]
+                    i += 1
+                    self._escape = False
+                    if c == "u":
+                        self._unicode = ""
+                    elif c in _ESCAPES:
+                        self._buffer.append(_ESCAPES[c])
+                    else:
+                        raise JSONSyntaxError(f"Invalid escape \\{c}.")
+                    continue
+                # Copy plain runs in one slice
+                quote = chunk.find('"', i)
+                backslash = chunk.find("\\", i)
+                stop = min(p for p in (quote, backslash, n) if p != -1)
+                self._buffer.append(chunk[i:stop])
+                i = stop
+                if i < n:
+                    i += 1
+                    if chunk[stop] == "\\":
+                        self._escape = True
+                    else:
+                        text = "".join(self._buffer)
+                        self._buffer.clear()
+                        if self._string_is_key:
+                            self._stack[-1][1] = text
+                            self._state = "colon"
+                        else:
+                            self._attach(text)
+                continue
+
+            c = chunk[i]
+
+            if state == "literal":
+                if c in _LITERAL_CHARS:
+                    self._buffer.append(c)
+                    i += 1
+                    continue
+                self._finish_literal()
+                continue
+
+            i += 1
+            if c in _WHITESPACE:
+                continue
+
+            if state == "pre":
+                # Skip prose or code fences before the JSON starts
+                if c == "{":
+                    self._open({})
+                elif c == "[":
+                    # A root list, or a bracket in leading prose; let the repairing parser decide
+                    raise JSONSyntaxError("'[' before the root object.")
+            elif state == "value":
+                if c == "{":
+                    self._open({})
+                elif c == "[":
+                    self._open([])
+                elif c == '"':
+                    self._state, self._string_is_key = "string", False
+                elif c == "]" and isinstance(self._stack[-1][0], list) and not self._stack[-1][0]:
+                    self._close()
+                elif c in _LITERAL_CHARS:
+                    self._buffer.append(c)
+                    self._state = "literal"
+                else:
+                    raise JSONSyntaxError(f"Unexpected {c!r} where a value was expected.")
+            elif state == "key":
+                if c == '"':
+                    self._state, self._string_is_key = "string", True
+                elif c == "}" and not self._stack[-1][0]:
+                    self._close()
+                else:
+                    raise JSONSyntaxError(f"Unexpected {c!r} where a key was expected.")
+            elif state == "colon":
+                if c != ":":
+                    raise JSONSyntaxError(f"Expected ':' but found {c!r}.")
+                self._state = "value"
+            elif state == "comma":
+                container = self._stack[-1][0]
+                if c == ",":
+                    self._state = "key" if isinstance(container, dict) else "value"
+                elif (c == "}" and isinstance(container, dict)) or (c == "]" and isinstance(container, list)):
+                    self._close()
+                else:
+                    raise JSONSyntaxError(f"Unexpected {c!r} after a value.")
+
+        self.chars_consumed += i
+        return self.done
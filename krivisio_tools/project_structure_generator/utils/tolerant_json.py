@@ -0,0 +1,215 @@
+"""
+Fault-tolerant JSON parser for malformed LLM output.
+
+Accepts the JSON5-style mistakes models make, without a second LLM call:
+- prose or ```json fences around the payload
+- single-quoted strings, unquoted keys and bareword values (main.py, src/app)
+- trailing commas and missing commas between members on separate lines
+- // line, /* block */ and # comments
+- Python literals True / False / None
+- truncated input: open strings, objects and arrays are closed at end of
+  text, and a key left without a value is dropped.
+"""
+
+from typing import Any, Dict, List, Tuple
+
+
+class TolerantJSONError(ValueError):
+    """The text holds no recoverable JSON value."""
+
+
+_WHITESPACE = " \t\r\n"
+_BAREWORD_STOP = set(",:{}[]\"'\n\r")
+_LITERALS = {"true": True, "false": False, "null": None, "True": True, "False": False, "None": None}
+_ESCAPES = {'"': '"', "'": "'", "\\": "\\", "/": "/", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t"}
+
+
+class _Parser:
+    def __init__(self, text: str):
+        self.text = text
+        self.pos = 0
+        self.n = len(text)
+        self.truncated = False
+
+    # ── lexing helpers ────────────────────────────────────────────────────
+    def _skip(self) -> None:
+        """Skip whitespace and comments."""
+        text, n = self.text, self.n
+        while self.pos < n:
+            c = text[self.pos]
+            if c in _WHITESPACE:
+                self.pos += 1
+            elif c == "#" or text.startswith("//", self.pos):
+                end = text.find("\n", self.pos)
+                self.pos = n if end == -1 else end + 1
+            elif text.startswith("/*", self.pos):
+                end = text.find("*/", self.pos + 2)
+                self.pos = n if end == -1 else end + 2
+            elif text.startswith("```", self.pos):
+                end = text.find("\n", self.pos)
+                self.pos = n if end == -1 else end + 1
+            else:
+                return
+
+    def _string(self) -> str:
+        quote = self.text[self.pos]
+        self.pos += 1
+        parts: List[str] = []
+        text, n = self.text, self.n
+        while self.pos < n:
+            c = text[self.pos]
+            if c == quote:
+                self.pos += 1
+                return "".join(parts)
+            if c == "\\" and self.pos + 1 < n:
+                nxt = text[self.pos + 1]
+                if nxt == "u" and self.pos + 6 <= n:
+                    try:
+                        parts.append(chr(int(text[self.pos + 2:self.pos + 6], 16)))
+                        self.pos += 6
+                        continue
+                    except ValueError:
+                        pass
+                parts.append(_ESCAPES.get(nxt, nxt))
+                self.pos += 2
+                continue
+            if c == "\n" and quote == "'":
+                # An unterminated single-quoted string ends at the line break
+                return "".join(parts)
+            parts.append(c)
+            self.pos += 1
+        self.truncated = True
+        return "".join(parts)
+
+    def _bareword(self) -> Any:
+        start = self.pos
+        text, n = self.text, self.n
+        while self.pos < n and text[self.pos] not in _BAREWORD_STOP and not text.startswith("//", self.pos):
+            if text[self.pos] in "}]":
+                break
+            self.pos += 1
+        word = text[start:self.pos].strip()
+        if word in _LITERALS:
+            return _LITERALS[word]
+        try:
+            return int(word)
+        except ValueError:
+            pass
+        try:
+            return float(word)
+        except ValueError:
+            return word
+
+    def _key(self) -> str:
+        if self.text[self.pos] in "\"'":
+            return self._string()
+        start = self.pos
+        while self.pos < self.n and self.text[self.pos] not in ":,{}[]\n":
+            self.pos += 1
+        return self.text[start:self.pos].strip().strip("\"'")
+
+    # ── grammar ───────────────────────────────────────────────────────────
+    def value(self) -> Any:
+        self._skip()
+        if self.pos >= self.n:
+            self.truncated = True
+            return None
+        c = self.text[self.pos]
+        if c == "{":
+            return self._object()
+        if c == "[":
+            return self._array()
+        if c in "\"'":
+            return self._string()
+        return self._bareword()
+
+    def _object(self) -> Dict:
+        self.pos += 1
+        obj: Dict[str, Any] = {}
+        while True:
+            self._skip()
+            if self.pos >= self.n:
+                self.truncated = True
+                return obj
+            c = self.text[self.pos]
+            if c == "}":
+                self.pos += 1
+                return obj
+            if c == ",":
+                self.pos += 1
+                continue
+            if c == "]":
+                # Mismatched bracket: treat as the end of this object
+                return obj
+            key = self._key()
+            self._skip()
+            if self.pos >= self.n:
+                self.truncated = True
+                return obj
+            if self.text[self.pos] != ":":
+                if not key:
+                    self.pos += 1
+                continue
+            self.pos += 1
+            self._skip()
+            if self.pos >= self.n:
+                self.truncated = True
+                return obj
+            obj[key] = self.value()
+
+    def _array(self) -> List:
+        self.pos += 1
+        arr: List[Any] = []
+        while True:
+            self._skip()
+            if self.pos >= self.n:
+                self.truncated = True
+                return arr
+            c = self.text[self.pos]
+            if c == "]":
+                self.pos += 1
+                return arr
+            if c == ",":
+                self.pos += 1
+                continue
+            if c == "}":
+                return arr
+            start = self.pos
+            item = self.value()
+            if self.pos == start:
+                # Stray character (e.g. ':') – skip it
+                self.pos += 1
+                continue
+            arr.append(item)
+
+
+def parse_tolerant(text: str) -> Tuple[Any, bool]:
+    """
+    Parse the first JSON object or array in `text`, repairing common faults.
+
+    Args:
+        text (str): Raw model output.
+
+    Returns:
+        tuple: (value, truncated) – `truncated` is True when containers or a
+        string had to be closed at end of input.
+
+    Raises:
+        TolerantJSONError: If no object or array is present.
+    """
+    starts = [p for p in (text.find("{"), text.find("[")) if p != -1]
+    if not starts:
+        raise TolerantJSONError("No JSON object or array found.")
+    parser = _Parser(text)
+    parser.pos = min(starts)
+    return parser.value(), parser.truncated
+
+
+if __name__ == "__main__":
+    samples = [
+        "{'name': 'app', 'type': 'folder', 'children': [{'name': 'main.py', 'type': 'file'},]}",
+        '```json\n{name: app, type: folder, children: [{name: main.py, type: file} // entry\n]}\n```',
+        '{"name": "app", "type": "folder", "children": [{"name": "main.py", "type": "file"}, {"name": "sr',
+    ]
+    for sample in samples:
+        print(parse_tolerant(sample))
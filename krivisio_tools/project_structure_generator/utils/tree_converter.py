@@ -1,4 +1,50 @@
-from typing import Dict, List
+"""
+Tree utilities for directory structures.
+
+All walkers are iterative (explicit stack), so arbitrarily deep trees never
+hit the recursion limit, and paths are yielded lazily instead of being
+rebuilt and re-copied at every level.
+
+`CompactTree` stores a tree as parallel arrays (parent index, interned name
+id, folder flag) in pre-order, which is far smaller than nested dicts for
+large trees and converts to and from the dict form.
+"""
+
+import sys
+from array import array
+from typing import Dict, Iterator, List, Tuple
+
+
+def iter_paths(
+    structure: Dict,
+    base_path: str = "",
+    files: bool = True,
+    folders: bool = True
+) -> Iterator[str]:
+    """
+    Lazily yields node paths in pre-order (parent before its children).
+
+    Args:
+        structure (dict): Directory tree.
+        base_path (str): Prefix for the root path.
+        files (bool): Yield file paths.
+        folders (bool): Yield folder paths (with a trailing slash).
+
+    Yields:
+        str: Paths like 'my-app/', 'my-app/src/index.js'
+    """
+    stack: List[Tuple[Dict, str]] = [(structure, base_path)]
+    while stack:
+        node, parent_path = stack.pop()
+        path = f"{parent_path}/{node['name']}".lstrip("/")
+        if node["type"] == "file":
+            if files:
+                yield path
+        elif node["type"] == "folder":
+            if folders:
+                yield path + "/"
+            children = node.get("children", [])
+            stack.extend((child, path) for child in reversed(children))
 
 
 def flatten_structure(
@@ -10,22 +56,12 @@ def flatten_structure(
 
     Args:
         structure (dict): Directory tree from LLM.
-        base_path (str): Internal use – recursive base path.
+        base_path (str): Prefix for the root path.
 
     Returns:
-        List[str]: List of full paths like ['my-app/README.md', 'my-app/src/index.js']
+        List[str]: List of full paths like ['my-app/', 'my-app/README.md', 'my-app/src/index.js']
     """
-    paths = []
-    current_path = f"{base_path}/{structure['name']}".lstrip("/")
-
-    if structure["type"] == "file":
-        paths.append(current_path)
-    elif structure["type"] == "folder":
-        paths.append(current_path + "/")  # optionally keep trailing slash
-        children = structure.get("children", [])
-        for child in children:
-            paths.extend(flatten_structure(child, current_path))
-    return paths
+    return list(iter_paths(structure, base_path))
 
 
 def extract_files_only(
@@ -37,19 +73,12 @@ def extract_files_only(
 
     Args:
         structure (dict): Directory tree
-        base_path (str): Recursive internal path
+        base_path (str): Prefix for the root path
 
     Returns:
         List[str]: All file paths
     """
-    if structure["type"] == "file":
-        return [f"{base_path}/{structure['name']}".lstrip("/")]
-    
-    files = []
-    current_path = f"{base_path}/{structure['name']}".lstrip("/")
-    for child in structure.get("children", []):
-        files.extend(extract_files_only(child, current_path))
-    return files
+    return list(iter_paths(structure, base_path, folders=False))
 
 
 def extract_folders_only(
@@ -61,15 +90,167 @@ def extract_folders_only(
 
     Args:
         structure (dict): Directory tree
-        base_path (str): Recursive internal path
+        base_path (str): Prefix for the root path
 
     Returns:
         List[str]: All folder paths
     """
-    folders = []
-    if structure["type"] == "folder":
-        current_path = f"{base_path}/{structure['name']}".lstrip("/")
-        folders.append(current_path + "/")
-        for child in structure.get("children", []):
-            folders.extend(extract_folders_only(child, current_path))
-    return folders
+    return list(iter_paths(structure, base_path, files=False))
+
+
+class CompactTree:
+    """
+    Array-backed directory tree.
+
+    Nodes are stored in pre-order; node 0 is the root and has parent -1.
+    Names are interned once in `names` and referenced by id, so repeated
+    names (__init__.py, README.md, src) cost one string each.
+    """
+
+    __slots__ = ("parents", "name_ids", "folder_flags", "names", "_name_index")
+
+    def __init__(self):
+        self.parents = array("i")
+        self.name_ids = array("i")
+        self.folder_flags = bytearray()
+        self.names: List[str] = []
+        self._name_index: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.parents)
+
+    def _intern(self, name: str) -> int:
+        name_id = self._name_index.get(name)
+        if name_id is None:
+            name_id = self._name_index[name] = len(self.names)
+            self.names.append(sys.intern(name))
+        return name_id
+
+    def add(self, parent: int, name: str, is_folder: bool) -> int:
+        """Append a node; nodes must be added in pre-order. Returns its index."""
+        self.parents.append(parent)
+        self.name_ids.append(self._intern(name))
+        self.folder_flags.append(1 if is_folder else 0)
+        return len(self.parents) - 1
+
+    def name(self, index: int) -> str:
+        return self.names[self.name_ids[index]]
+
+    def is_folder(self, index: int) -> bool:
+        return bool(self.folder_flags[index])
+
+    @classmethod
+    def from_dict(cls, structure: Dict) -> "CompactTree":
+        """Build from the name/type/children dict form."""
+        tree = cls()
+        stack: List[Tuple[Dict, int]] = [(structure, -1)]
+        while stack:
+            node, parent = stack.pop()
+            is_folder = node["type"] == "folder"
+            index = tree.add(parent, node["name"], is_folder)
+            if is_folder:
+                stack.extend((child, index) for child in reversed(node.get("children", [])))
+        return tree
+
+    def to_dict(self) -> Dict:
+        """Export to the name/type/children dict form."""
+        if not len(self):
+            return {}
+        nodes: List[Dict] = []
+        for index in range(len(self)):
+            name = self.names[self.name_ids[index]]
+            if self.folder_flags[index]:
+                node = {"name": name, "type": "folder", "children": []}
+            else:
+                node = {"name": name, "type": "file"}
+            nodes.append(node)
+            parent = self.parents[index]
+            if parent >= 0:
+                nodes[parent]["children"].append(node)
+        return nodes[0]
+
+    def iter_paths(self, files: bool = True, folders: bool = True) -> Iterator[str]:
+        """Lazily yield paths in pre-order, same format as `iter_paths`."""
+        # Only folder paths are kept, as prefixes for their children
+        prefixes: List[str] = []
+        for index in range(len(self)):
+            parent = self.parents[index]
+            name = self.names[self.name_ids[index]]
+            path = f"{prefixes[parent]}/{name}" if parent >= 0 else name
+            prefixes.append(path if self.folder_flags[index] else "")
+            if self.folder_flags[index]:
+                if folders:
+                    yield path + "/"
+            elif files:
+                yield path
+
+
+if __name__ == "__main__":
+    import time
+    import tracemalloc
+
+    def _wide_tree(n_nodes: int) -> Dict:
+        """~n_nodes nodes: packages of modules, 10 files per folder, 3 levels."""
+        root = {"name": "project", "type": "folder", "children": []}
+        count, folder_id = 1, 0
+        while count < n_nodes:
+            pkg = {"name": f"pkg{folder_id}", "type": "folder", "children": []}
+            root["children"].append(pkg)
+            count += 1
+            for sub in range(10):
+                if count >= n_nodes:
+                    break
+                folder = {"name": f"sub{sub}", "type": "folder", "children": []}
+                pkg["children"].append(folder)
+                count += 1
+                for f in range(10):
+                    if count >= n_nodes:
+                        break
+                    folder["children"].append({"name": f"module_{f}.py", "type": "file"})
+                    count += 1
+            folder_id += 1
+        return root
+
+    def _deep_tree(depth: int, files_per_level: int) -> Dict:
+        """A folder chain `depth` levels deep (past the recursion limit) with files at every level."""
+        root = node = {"name": "d0", "type": "folder", "children": []}
+        for i in range(1, depth):
+            child = {"name": f"d{i % 10}", "type": "folder", "children": []}
+            node["children"].extend({"name": f"f{f}.py", "type": "file"} for f in range(files_per_level))
+            node["children"].append(child)
+            node = child
+        return root
+
+    def _bench(label, fn):
+        start = time.perf_counter()
+        result = fn()
+        print(f"  {label:<28} {(time.perf_counter() - start) * 1000:8.1f} ms")
+        return result
+
+    print("wide, 100k nodes:")
+    tree = _wide_tree(100_000)
+    paths = _bench("flatten_structure", lambda: flatten_structure(tree))
+    _bench("extract_files_only", lambda: extract_files_only(tree))
+    _bench("first 100 paths (lazy)", lambda: [p for _, p in zip(range(100), iter_paths(tree))])
+    compact = _bench("CompactTree.from_dict", lambda: CompactTree.from_dict(tree))
+    exported = _bench("CompactTree.to_dict", compact.to_dict)
+    assert _bench("CompactTree.iter_paths", lambda: list(compact.iter_paths())) == paths
+    assert exported == tree
+
+    tracemalloc.start()
+    kept = CompactTree.from_dict(tree)
+    compact_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    tracemalloc.start()
+    kept = compact.to_dict()
+    dict_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"  memory: dict {dict_bytes / 1e6:.1f} MB, compact {compact_bytes / 1e6:.2f} MB")
+
+    # Full paths grow with depth, so deep trees are consumed lazily
+    print("deep, 2000 levels x 50 nodes:")
+    tree = _deep_tree(2000, 49)
+    count = _bench("iter_paths (streamed)", lambda: sum(1 for _ in iter_paths(tree)))
+    compact = _bench("CompactTree.from_dict", lambda: CompactTree.from_dict(tree))
+    _bench("CompactTree.to_dict", compact.to_dict)
+    assert len(compact) == count
@@ -0,0 +1,132 @@
+"""
+Line-based patches for directory trees.
+
+A patch lists one change per line, relative to the root folder:
+
+    + apps/payments/
+    + apps/payments/models.py
+    - apps/legacy_cart/
+
+`+` adds a node (intermediate folders are created; a trailing slash marks
+a folder), `-` removes a node and everything under it. A leading root-folder
+segment, bullets and code fences are tolerated.
+"""
+
+import copy
+import re
+from typing import Dict, List, Optional, Tuple
+
+
+_LINE_RE = re.compile(r"^\s*(?:[-*]\s+(?=[+-]))?([+-])\s*(.+?)\s*$")
+_DRIVE_RE = re.compile(r"^[A-Za-z]:")
+
+
+def parse_patch(text: str) -> Tuple[List[str], List[str]]:
+    """
+    Split patch text into added and removed paths.
+
+    Args:
+        text (str): Model output.
+
+    Returns:
+        tuple: (added, removed) path lists in order of appearance.
+    """
+    added, removed = [], []
+    for line in text.splitlines():
+        match = _LINE_RE.match(line)
+        if not match:
+            continue
+        path = match.group(2).strip("`\"' ")
+        if path.strip("/"):
+            (added if match.group(1) == "+" else removed).append(path)
+    return added, removed
+
+
+def _segments(structure: Dict, path: str) -> List[str]:
+    """Path segments below the root; empty for unsafe paths, which are then skipped."""
+    if path.startswith("/") or "\\" in path or _DRIVE_RE.match(path):
+        return []
+    segments = [s for s in path.strip("/").split("/") if s and s != "."]
+    if ".." in segments:
+        return []
+    if len(segments) > 1 and segments[0] == structure["name"]:
+        segments = segments[1:]
+    return segments
+
+
+def _find_child(node: Dict, name: str) -> Optional[Dict]:
+    for child in node.get("children", []):
+        if child["name"] == name:
+            return child
+    return None
+
+
+def insert_path(structure: Dict, path: str) -> bool:
+    """
+    Add `path` under the root, creating intermediate folders.
+
+    Returns:
+        bool: True if a node was added; False if it already existed or a
+        file sits where a folder is needed.
+    """
+    segments = _segments(structure, path)
+    if not segments:
+        return False
+    node = structure
+    for name in segments[:-1]:
+        child = _find_child(node, name)
+        if child is None:
+            child = {"name": name, "type": "folder", "children": []}
+            node["children"].append(child)
+        elif child["type"] != "folder":
+            return False
+        node = child
+    if _find_child(node, segments[-1]) is not None:
+        return False
+    if path.endswith("/"):
+        node["children"].append({"name": segments[-1], "type": "folder", "children": []})
+    else:
+        node["children"].append({"name": segments[-1], "type": "file"})
+    return True
+
+
+def remove_path(structure: Dict, path: str) -> bool:
+    """
+    Remove the node at `path` (with its subtree).
+
+    Returns:
+        bool: True if a node was removed.
+    """
+    segments = _segments(structure, path)
+    if not segments:
+        return False
+    node = structure
+    for name in segments[:-1]:
+        node = _find_child(node, name)
+        if node is None or node["type"] != "folder":
+            return False
+    children = node.get("children", [])
+    for index, child in enumerate(children):
+        if child["name"] == segments[-1]:
+            del children[index]
+            return True
+    return False
+
+
+def apply_patch(structure: Dict, added: List[str], removed: List[str]) -> Tuple[Dict, Dict]:
+    """
+    Apply a patch to a copy of `structure`. Removals run before additions,
+    so a path can be replaced (e.g. a file turned into a folder).
+
+    Returns:
+        tuple: (patched tree, counts) where counts has added, removed and
+        skipped (paths that did not apply).
+    """
+    patched = copy.deepcopy(structure)
+    patched.setdefault("children", [])
+    counts = {"added": 0, "removed": 0, "skipped": 0}
+    for path in removed:
+        counts["removed" if remove_path(patched, path) else "skipped"] += 1
+    for path in added:
+        counts["added" if insert_path(patched, path) else "skipped"] += 1
+    return patched, counts
@@ -9,4 +9,75 @@ KRIVISIO_GITHUB_TOOL = os.getenv("KRIVISIO_GITHUB_TOOL", OPENAI_API_KEY)
 KRIVISIO_REPORT_GENERATION_TOOL = os.getenv("KRIVISIO_REPORT_GENERATION_TOOL", OPENAI_API_KEY)
 KRIVISIO_STRUCTURE_GENERATION_TOOL = os.getenv("KRIVISIO_STRUCTURE_GENERATION_TOOL", OPENAI_API_KEY)
 KRVISIO_SIDE_TOOLS = os.getenv("KRVISIO_SIDE_TOOLS", OPENAI_API_KEY)
-KRIVISIO_TALENT_MATCHING_TOOL = os.getenv("KRIVISIO_TALENT_MATCHING_TOOL", OPENAI_API_KEY)
\ No newline at end of file
+KRIVISIO_TALENT_MATCHING_TOOL = os.getenv("KRIVISIO_TALENT_MATCHING_TOOL", OPENAI_API_KEY)
+
+# Document export
+EXPORT_CACHE_DIR = os.getenv("KRIVISIO_EXPORT_CACHE_DIR", os.path.join(".krivisio_cache", "exports"))
+EXPORT_MAX_WORKERS = int(os.getenv("KRIVISIO_EXPORT_MAX_WORKERS", "2"))
+
+# Generated document store
+DOCUMENT_STORE_DIR = os.getenv("KRIVISIO_DOCUMENT_STORE_DIR", os.path.join(".krivisio_data", "documents"))
+DOCUMENT_PAGE_SIZE = int(os.getenv("KRIVISIO_DOCUMENT_PAGE_SIZE", "16384"))
+
+# Project structure cache: "memory" (per-process LRU), "sqlite" (shared on disk) or "tiered" (both)
+STRUCTURE_CACHE_BACKEND = os.getenv("KRIVISIO_STRUCTURE_CACHE_BACKEND", "tiered")
+STRUCTURE_CACHE_PATH = os.getenv("KRIVISIO_STRUCTURE_CACHE_PATH", os.path.join(".krivisio_cache", "structures.sqlite3"))
+STRUCTURE_CACHE_MAX_ENTRIES = int(os.getenv("KRIVISIO_STRUCTURE_CACHE_MAX_ENTRIES", "512"))
+STRUCTURE_CACHE_TTL_SECONDS = int(os.getenv("KRIVISIO_STRUCTURE_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+
+# Example embeddings for similar-project retrieval (text-embedding-3 models accept reduced dimensions).
+# EMBEDDING_BACKEND "local" uses a hashed character n-gram embedder with no network calls.
+EMBEDDING_BACKEND = os.getenv("KRIVISIO_EMBEDDING_BACKEND", "openai")
+EMBEDDING_MODEL = os.getenv("KRIVISIO_EMBEDDING_MODEL", "text-embedding-3-small")
+EMBEDDING_DIMENSIONS = int(os.getenv("KRIVISIO_EMBEDDING_DIMENSIONS", "512"))
+
+# Example index backend: "exact" (float32 matrix) or "ivf" (approximate, int8-quantized)
+SIMILARITY_INDEX_BACKEND = os.getenv("KRIVISIO_SIMILARITY_INDEX_BACKEND", "exact")
+IVF_N_LISTS = int(os.getenv("KRIVISIO_IVF_N_LISTS", "1024"))
+IVF_N_PROBE = int(os.getenv("KRIVISIO_IVF_N_PROBE", "8"))
+
+# Embedding cache and batched ingestion
+EMBEDDING_CACHE_PATH = os.getenv("KRIVISIO_EMBEDDING_CACHE_PATH", os.path.join(".krivisio_cache", "embeddings.sqlite3"))
+EMBEDDING_BATCH_SIZE = int(os.getenv("KRIVISIO_EMBEDDING_BATCH_SIZE", "256"))
+EMBEDDING_MAX_WORKERS = int(os.getenv("KRIVISIO_EMBEDDING_MAX_WORKERS", "4"))
+
+# Prebuilt example index (built with `python -m krivisio_tools.project_structure_generator.services.index_builder`)
+EXAMPLE_INDEX_DIR = os.getenv("KRIVISIO_EXAMPLE_INDEX_DIR", os.path.join(".krivisio_data", "example_index"))
+
+# Semantic near-duplicate cache for structure generation
+SEMANTIC_CACHE_ENABLED = os.getenv("KRIVISIO_SEMANTIC_CACHE_ENABLED", "true").lower() == "true"
+SEMANTIC_CACHE_THRESHOLD = float(os.getenv("KRIVISIO_SEMANTIC_CACHE_THRESHOLD", "0.92"))
+SEMANTIC_CACHE_MAX_ENTRIES = int(os.getenv("KRIVISIO_SEMANTIC_CACHE_MAX_ENTRIES", "2048"))
+
+# Stream structure-generation completions through the incremental JSON parser
+STRUCTURE_STREAMING = os.getenv("KRIVISIO_STRUCTURE_STREAMING", "true").lower() == "true"
+
+# Structure generation output: "paths" (compact indented paths, expanded locally) or "json"
+STRUCTURE_OUTPUT_FORMAT = os.getenv("KRIVISIO_STRUCTURE_OUTPUT_FORMAT", "paths")
+STRUCTURE_MAX_TOKENS = int(os.getenv("KRIVISIO_STRUCTURE_MAX_TOKENS", "2000"))
+
+# Hierarchical generation for large projects ("off", "auto" or "always"): a top-level skeleton first,
+# then each top-level folder as a concurrent call with its own output budget
+STRUCTURE_HIERARCHICAL = os.getenv("KRIVISIO_STRUCTURE_HIERARCHICAL", "auto")
+STRUCTURE_HIERARCHICAL_MIN_ITEMS = int(os.getenv("KRIVISIO_STRUCTURE_HIERARCHICAL_MIN_ITEMS", "10"))
+STRUCTURE_SKELETON_MAX_TOKENS = int(os.getenv("KRIVISIO_STRUCTURE_SKELETON_MAX_TOKENS", "400"))
+STRUCTURE_SUBTREE_MAX_TOKENS = int(os.getenv("KRIVISIO_STRUCTURE_SUBTREE_MAX_TOKENS", "1500"))
+STRUCTURE_SUBTREE_WORKERS = int(os.getenv("KRIVISIO_STRUCTURE_SUBTREE_WORKERS", "6"))
+
+# Compose standard stacks locally from tech-stack fragments (models/fragments.py) before calling the LLM
+STRUCTURE_FRAGMENTS_ENABLED = os.getenv("KRIVISIO_STRUCTURE_FRAGMENTS_ENABLED", "true").lower() == "true"
+
+# Output budget for delta updates (a "+ path" / "- path" patch for changed features)
+STRUCTURE_PATCH_MAX_TOKENS = int(os.getenv("KRIVISIO_STRUCTURE_PATCH_MAX_TOKENS", "600"))
+
+# Talent matching: "scored" picks teams locally (talent_matcher/core/team_scorer.py), "llm" asks the model
+TALENT_SELECTION_MODE = os.getenv("KRIVISIO_TALENT_SELECTION_MODE", "scored")
+# Ask the LLM to explain picks that tied with another candidate (scored mode only)
+TALENT_EXPLAIN_TIES = os.getenv("KRIVISIO_TALENT_EXPLAIN_TIES", "false").lower() == "true"
+# LLM mode: best candidates per domain, and the token budget for all candidate lines in the prompt
+TALENT_PROMPT_TOP_K = int(os.getenv("KRIVISIO_TALENT_PROMPT_TOP_K", "15"))
+TALENT_PROMPT_CANDIDATE_TOKENS = int(os.getenv("KRIVISIO_TALENT_PROMPT_CANDIDATE_TOKENS", "1500"))
+# Persistent candidate pools for match_talent (talent_matcher/core/candidate_store.py)
+TALENT_STORE_PATH = os.getenv("KRIVISIO_TALENT_STORE_PATH", os.path.join(".krivisio_data", "candidates.sqlite3"))
+# Most candidates loaded from a stored pool per requested domain (best manager score first)
+TALENT_STORE_QUERY_LIMIT = int(os.getenv("KRIVISIO_TALENT_STORE_QUERY_LIMIT", "500"))
@@ -1 +1,55 @@
+"""
+Static pricing constants used by the deterministic onboarding documents.
 
+Rates are monthly, per person, in DEFAULT_CURRENCY. Effort shares split the
+COCOMO-II person-months across roles and must add up to 1.0.
+"""
+
+from typing import Dict, List
+
+
+DEFAULT_CURRENCY: str = "USD"
+
+# Contingency added on top of the labour subtotal (%)
+DEFAULT_CONTINGENCY_PERCENT: float = 10.0
+
+
+# ----------------------------------------
+# Role Rate Card
+# ----------------------------------------
+
+ROLE_RATE_CARD: Dict[str, Dict[str, float]] = {
+    "Project Manager":    {"monthly_rate": 9000.0, "effort_share": 0.10},
+    "Solution Architect": {"monthly_rate": 11000.0, "effort_share": 0.10},
+    "Backend Developer":  {"monthly_rate": 8000.0, "effort_share": 0.30},
+    "Frontend Developer": {"monthly_rate": 7500.0, "effort_share": 0.25},
+    "QA Engineer":        {"monthly_rate": 6000.0, "effort_share": 0.15},
+    "DevOps Engineer":    {"monthly_rate": 8500.0, "effort_share": 0.10},
+}
+
+# Rate uplift applied per complexity level
+COMPLEXITY_RATE_MULTIPLIER: Dict[str, float] = {
+    "basic": 1.00,
+    "intermediate": 1.15,
+    "advanced": 1.30,
+}
+
+
+# ----------------------------------------
+# Phase Split and Payment Schedule
+# ----------------------------------------
+
+# Share of total cost and schedule per delivery phase
+PHASE_SPLIT: Dict[str, float] = {
+    "Discovery & Planning": 0.10,
+    "Design": 0.15,
+    "Development": 0.45,
+    "Testing & QA": 0.20,
+    "Deployment & Handover": 0.10,
+}
+
+PAYMENT_SCHEDULE: List[Dict[str, object]] = [
+    {"milestone": "Advance on contract signing", "percent": 30.0},
+    {"milestone": "Completion of Development phase", "percent": 40.0},
+    {"milestone": "Final delivery and acceptance", "percent": 30.0},
+]
@@ -4,8 +4,8 @@ Main module for document generation via combined routes.
 Provides callable entry point for MCP or standalone execution.
 """
 
-from typing import Dict, Any
-from krivisio_tools.report_generation.app.routes.combined_routes import route_document_generation
+from typing import Dict, Any, List, Optional
+from krivisio_tools.report_generation.app.routes.combined_routes import route_document_generation, route_bundle_generation
 
 
 def run_generation(module: str, doc_type: str, input_data: Dict[str, Any]) -> str:
@@ -23,4 +23,27 @@ def run_generation(module: str, doc_type: str, input_data: Dict[str, Any]) -> st
     Raises:
         Exception: If routing or generation fails.
     """
-    return route_document_generation(module=module, doc_type=doc_type, input_data=input_data)
\ No newline at end of file
+    return route_document_generation(module=module, doc_type=doc_type, input_data=input_data)
+
+
+def run_bundle_generation(
+    module: str,
+    input_data: Dict[str, Any],
+    doc_types: Optional[List[str]] = None
+) -> Dict[str, str]:
+    """
+    Generate several documents for one project from a shared analysis.
+
+    Args:
+        module (str): Functional module name (e.g., 'onboarding').
+        input_data (Dict[str, Any]): Input data shared by all documents.
+        doc_types (List[str], optional): Document types to generate
+            (e.g., ['proposal', 'quotation', 'contract']).
+
+    Returns:
+        Dict[str, str]: Generated documents keyed by document type.
+
+    Raises:
+        Exception: If routing or generation fails.
+    """
+    return route_bundle_generation(module=module, input_data=input_data, doc_types=doc_types)
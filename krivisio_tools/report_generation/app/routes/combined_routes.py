@@ -10,7 +10,12 @@ Future expansions may include:
 - Project Tracking
 """
 
-from krivisio_tools.report_generation.app.routes.onboarding.combined_onboarding import generate_onboarding_document
+from typing import Dict, List, Optional
+
+from krivisio_tools.report_generation.app.routes.onboarding.combined_onboarding import (
+    generate_onboarding_document,
+    generate_onboarding_bundle
+)
 
 
 def route_document_generation(module: str, doc_type: str, input_data: dict) -> str:
@@ -40,3 +45,27 @@ def route_document_generation(module: str, doc_type: str, input_data: dict) -> s
     #     return generate_compliance_document(doc_type, input_data)
 
     raise ValueError(f"Unsupported module: '{module}'")
+
+
+def route_bundle_generation(module: str, input_data: dict, doc_types: Optional[List[str]] = None) -> Dict[str, str]:
+    """
+    Dispatch multi-document bundle generation across functional modules.
+
+    Args:
+        module (str): The functional module (e.g., 'onboarding')
+        input_data (dict): Input data shared by every document in the bundle
+        doc_types (List[str], optional): Document types to generate; defaults
+            to every type the module supports
+
+    Returns:
+        Dict[str, str]: Mapping of document type to generated document
+
+    Raises:
+        ValueError: If the module or a document type is unsupported
+    """
+    module = module.lower()
+
+    if module == "onboarding":
+        return generate_onboarding_bundle(input_data=input_data, doc_types=doc_types)
+
+    raise ValueError(f"Unsupported module: '{module}'")
@@ -0,0 +1,85 @@
+"""
+Shared project analysis for onboarding bundles.
+
+Derives one compact analysis per project input and caches it, so several
+documents can be generated from it without resending the full project data.
+"""
+
+import hashlib
+import json
+import re
+from collections import OrderedDict
+from typing import Dict
+
+from krivisio_tools.report_generation.app.utils.template_helpers import render_template
+from krivisio_tools.report_generation.app.utils.llm_client import chat_with_llm, strip_code_fences
+
+
+# Bounded cache of analyses keyed by a hash of the project input
+_ANALYSIS_CACHE_SIZE = 128
+_analysis_cache: "OrderedDict[str, Dict]" = OrderedDict()
+
+_ANALYSIS_FIELDS = ("project_description", "tech_stack", "complexity_level", "features")
+_OPEN_FENCE_RE = re.compile(r"^```[\w-]*\s*")
+
+
+def _analysis_key(input_data: dict) -> str:
+    raw = json.dumps({k: input_data.get(k) for k in _ANALYSIS_FIELDS}, sort_keys=True)
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def _json_payload(response: str) -> str:
+    """The JSON object in a reply, without code fences (closed or not) or surrounding prose."""
+    text = _OPEN_FENCE_RE.sub("", strip_code_fences(response)).strip().rstrip("`").strip()
+    start, end = text.find("{"), text.rfind("}")
+    return text[start:end + 1] if 0 <= start < end else text
+
+
+def _fallback_analysis(input_data: dict) -> Dict:
+    """Minimal analysis built from the raw input when the LLM output is unusable."""
+    return {
+        "summary": input_data["project_description"],
+        "objectives": [],
+        "modules": [{"name": f, "scope": f} for f in input_data["features"]],
+        "architecture": ", ".join(input_data["tech_stack"]),
+        "non_functional": [],
+        "risks": [],
+        "deliverables": [],
+        "assumptions": [],
+    }
+
+
+def derive_project_analysis(input_data: dict, use_cache: bool = True) -> Dict:
+    """
+    Returns the compact project analysis for an onboarding input.
+
+    Args:
+        input_data (dict): Onboarding input with project_description,
+            tech_stack, complexity_level and features.
+        use_cache (bool): Whether to reuse a previously derived analysis.
+
+    Returns:
+        dict: Parsed analysis (summary, modules, architecture, risks, ...).
+    """
+    key = _analysis_key(input_data)
+    if use_cache and key in _analysis_cache:
+        _analysis_cache.move_to_end(key)
+        return _analysis_cache[key]
+
+    prompt = render_template(template_name="project_analysis", input_data=input_data)
+    response = chat_with_llm(prompt=prompt, temperature=0.3)
+
+    try:
+        analysis = json.loads(_json_payload(response))
+        if not isinstance(analysis, dict):
+            raise ValueError("Analysis is not a JSON object.")
+    except ValueError as e:
+        print(f"[Analysis Warning] Falling back to raw input: {e}")
+        analysis = _fallback_analysis(input_data)
+
+    if use_cache:
+        _analysis_cache[key] = analysis
+        if len(_analysis_cache) > _ANALYSIS_CACHE_SIZE:
+            _analysis_cache.popitem(last=False)
+
+    return analysis
@@ -6,9 +6,29 @@ functions such as proposal, quotation, contract, etc.
 
 Currently supports:
 - Proposal Generation
+- Quotation Generation
+- Contract Generation
+- Bundles of the above generated from one shared project analysis
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
 from krivisio_tools.report_generation.app.routes.onboarding.proposal import generate_proposal_document
+from krivisio_tools.report_generation.app.routes.onboarding.quotation import generate_quotation_document
+from krivisio_tools.report_generation.app.routes.onboarding.contract import generate_contract_document
+from krivisio_tools.report_generation.app.routes.onboarding.analysis import derive_project_analysis
+
+
+# Document generators available to onboarding bundles
+ONBOARDING_BUNDLE_GENERATORS = {
+    "proposal": lambda data: generate_proposal_document(proposal_data=data),
+    "quotation": lambda data: generate_quotation_document(quotation_data=data),
+    "contract": lambda data: generate_contract_document(contract_data=data),
+}
+
+# Document types that are generated from the shared analysis
+_ANALYSIS_DOC_TYPES = {"proposal", "contract"}
 
 
 def generate_onboarding_document(doc_type: str, input_data: dict) -> str:
@@ -16,11 +36,11 @@ def generate_onboarding_document(doc_type: str, input_data: dict) -> str:
     Dispatch onboarding document generation based on type.
 
     Args:
-        doc_type (str): Type of document to generate (e.g., 'proposal')
+        doc_type (str): Type of document to generate (e.g., 'proposal', 'quotation', 'contract')
         input_data (dict): Structured data required for document generation
 
     Returns:
-        str: Generated document content from LLM
+        str: Generated document content
 
     Raises:
         ValueError: If the provided document type is unsupported
@@ -30,10 +50,52 @@ def generate_onboarding_document(doc_type: str, input_data: dict) -> str:
     if doc_type == "proposal":
         return generate_proposal_document(proposal_data=input_data)
 
-    # Placeholder for future onboarding types
-    # elif doc_type == "quotation":
-    #     return generate_quotation_document(input_data)
-    # elif doc_type == "contract":
-    #     return generate_contract_document(input_data)
+    if doc_type == "quotation":
+        return generate_quotation_document(quotation_data=input_data)
+
+    if doc_type == "contract":
+        return generate_contract_document(contract_data=input_data)
 
     raise ValueError(f"Unsupported onboarding document type: '{doc_type}'")
+
+
+def generate_onboarding_bundle(
+    input_data: dict,
+    doc_types: Optional[List[str]] = None,
+    max_workers: int = 3
+) -> Dict[str, str]:
+    """
+    Generate several onboarding documents for one project.
+
+    The project is analysed once; every document is then generated
+    concurrently from that cached analysis instead of the full input.
+
+    Args:
+        input_data (dict): Structured data required for document generation
+        doc_types (List[str], optional): Documents to generate. Defaults to
+            all supported onboarding types.
+        max_workers (int): Maximum number of documents generated in parallel
+
+    Returns:
+        Dict[str, str]: Mapping of document type to generated content
+
+    Raises:
+        ValueError: If any requested document type is unsupported
+    """
+    doc_types = [d.lower() for d in (doc_types or ONBOARDING_BUNDLE_GENERATORS)]
+    unsupported = [d for d in doc_types if d not in ONBOARDING_BUNDLE_GENERATORS]
+    if unsupported:
+        raise ValueError(f"Unsupported onboarding document type(s): {unsupported}")
+
+    # Step 1: Derive the shared analysis once (quotation alone does not need it)
+    shared_data = dict(input_data)
+    if _ANALYSIS_DOC_TYPES.intersection(doc_types):
+        shared_data["analysis"] = derive_project_analysis(input_data)
+
+    # Step 2: Fan out document generation against the shared analysis
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(doc_types)))) as executor:
+        futures = {
+            doc_type: executor.submit(ONBOARDING_BUNDLE_GENERATORS[doc_type], shared_data)
+            for doc_type in doc_types
+        }
+        return {doc_type: future.result() for doc_type, future in futures.items()}
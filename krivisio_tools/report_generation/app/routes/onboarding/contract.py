@@ -0,0 +1,35 @@
+"""
+Contract generation logic for onboarding phase.
+Prices the project locally and asks the LLM to draft the agreement.
+"""
+
+from krivisio_tools.report_generation.app.routes.onboarding.quotation import calculate_quotation
+from krivisio_tools.report_generation.app.utils.template_helpers import render_template
+from krivisio_tools.report_generation.app.utils.llm_client import chat_with_llm
+
+
+def generate_contract_document(contract_data: dict) -> str:
+    """
+    Generates a software development contract using a template and an LLM model.
+
+    Args:
+        contract_data (dict): Dictionary containing:
+            - project_description (str)
+            - tech_stack (List[str])
+            - complexity_level (str)
+            - features (List[str])
+            - cocomo_results (Dict)
+            - analysis (Dict, optional): Shared project analysis
+            - client_name (str, optional)
+
+    Returns:
+        str: Generated contract document content from LLM.
+    """
+    # Step 1: Price the project so the contract fees match the quotation
+    quote = calculate_quotation(contract_data)
+
+    # Step 2: Render prompt from template
+    prompt = render_template(template_name="contract", input_data={**contract_data, "quote": quote})
+
+    # Step 3: Send prompt to LLM
+    return chat_with_llm(prompt=prompt, max_tokens=1500)
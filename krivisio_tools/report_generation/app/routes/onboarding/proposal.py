@@ -18,12 +18,15 @@ def generate_proposal_document(proposal_data: dict) -> str:
             - complexity_level (str)
             - features (List[str])
             - cocomo_results (Dict)
+            - analysis (Dict, optional): Shared project analysis; when present
+              the prompt is built from it instead of the raw project input
 
     Returns:
         str: Generated proposal document content from LLM.
     """
     # Step 1: Render prompt from template
-    prompt = render_template(template_name="proposal", input_data=proposal_data)
+    template_name = "proposal_from_analysis" if proposal_data.get("analysis") else "proposal"
+    prompt = render_template(template_name=template_name, input_data=proposal_data)
 
     # Step 2: Send prompt to LLM
     llm_response = chat_with_llm(prompt=prompt)
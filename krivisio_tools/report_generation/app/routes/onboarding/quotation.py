@@ -1 +1,145 @@
+"""
+Quotation generation logic for onboarding phase.
 
+Prices COCOMO-II results against the role rate card and renders the document
+locally. The LLM is only used for the optional cover letter.
+"""
+
+from typing import Dict, Tuple
+
+from krivisio_tools.report_generation.app.core.constants import (
+    DEFAULT_CURRENCY,
+    DEFAULT_CONTINGENCY_PERCENT,
+    ROLE_RATE_CARD,
+    COMPLEXITY_RATE_MULTIPLIER,
+    PHASE_SPLIT,
+    PAYMENT_SCHEDULE,
+)
+from krivisio_tools.report_generation.app.utils.template_helpers import render_template
+from krivisio_tools.report_generation.app.utils.llm_client import chat_with_llm
+from krivisio_tools.project_evaluation.algorithms.cocomo2.constants import DEFAULT_SFS
+from krivisio_tools.project_evaluation.algorithms.cocomo2.estimator import compute_e
+from krivisio_tools.project_evaluation.algorithms.cocomo2.schedule import nominal_tdev
+
+
+def _extract_effort(cocomo: Dict) -> Tuple[float, float]:
+    """
+    Read person-months and development time from COCOMO results.
+
+    Accepts both the estimation service output ("estimation") and the
+    proposal template layout ("effort_schedule"). When the schedule is
+    missing, the nominal COCOMO-II schedule is derived from the effort.
+    """
+    effort = cocomo.get("estimation") or cocomo.get("effort_schedule") or {}
+    person_months = effort.get("person_months")
+    if not person_months:
+        raise ValueError("COCOMO results must include 'person_months' to price a quotation.")
+
+    dev_time = effort.get("development_time_months")
+    if not dev_time:
+        dev_time = nominal_tdev(person_months, compute_e(DEFAULT_SFS))
+
+    return float(person_months), float(dev_time)
+
+
+def calculate_quotation(quotation_data: dict) -> Dict:
+    """
+    Compute a priced quotation from project metadata and COCOMO-II results.
+
+    Args:
+        quotation_data (dict): Dictionary containing:
+            - project_description (str)
+            - tech_stack (List[str])
+            - complexity_level (str)
+            - features (List[str])
+            - cocomo_results (Dict)
+            - client_name, currency, rate_card, contingency_percent (optional)
+
+    Returns:
+        dict: Role breakdown, phase split, payment schedule and totals.
+
+    Raises:
+        ValueError: If the COCOMO results carry no effort estimate.
+    """
+    person_months, dev_time = _extract_effort(quotation_data["cocomo_results"])
+
+    level = quotation_data["complexity_level"]
+    currency = quotation_data.get("currency") or DEFAULT_CURRENCY
+    rate_card = quotation_data.get("rate_card") or ROLE_RATE_CARD
+    contingency_percent = quotation_data.get("contingency_percent")
+    if contingency_percent is None:
+        contingency_percent = DEFAULT_CONTINGENCY_PERCENT
+    multiplier = COMPLEXITY_RATE_MULTIPLIER.get(level.lower(), 1.0)
+
+    roles = []
+    for role, card in rate_card.items():
+        role_months = person_months * card["effort_share"]
+        monthly_rate = card["monthly_rate"] * multiplier
+        roles.append({
+            "role": role,
+            "person_months": round(role_months, 2),
+            "monthly_rate": round(monthly_rate, 2),
+            "cost": round(role_months * monthly_rate, 2),
+        })
+
+    subtotal = round(sum(r["cost"] for r in roles), 2)
+    contingency = round(subtotal * contingency_percent / 100.0, 2)
+    total = round(subtotal + contingency, 2)
+
+    phases = [
+        {
+            "phase": phase,
+            "duration_months": round(dev_time * share, 2),
+            "cost": round(total * share, 2),
+        }
+        for phase, share in PHASE_SPLIT.items()
+    ]
+    payment_schedule = [
+        {**payment, "amount": round(total * payment["percent"] / 100.0, 2)}
+        for payment in PAYMENT_SCHEDULE
+    ]
+
+    return {
+        "project_description": quotation_data["project_description"],
+        "client_name": quotation_data.get("client_name"),
+        "tech_stack": quotation_data["tech_stack"],
+        "complexity_level": level,
+        "features": quotation_data["features"],
+        "currency": currency,
+        "person_months": person_months,
+        "development_time_months": dev_time,
+        "avg_team_size": person_months / dev_time,
+        "roles": roles,
+        "subtotal": subtotal,
+        "contingency_percent": contingency_percent,
+        "contingency": contingency,
+        "total": total,
+        "phases": phases,
+        "payment_schedule": payment_schedule,
+    }
+
+
+def generate_quotation_document(quotation_data: dict) -> str:
+    """
+    Generates a priced quotation document without calling the LLM, except
+    for the cover letter when `include_cover_letter` is set.
+
+    Args:
+        quotation_data (dict): See `calculate_quotation`.
+
+    Returns:
+        str: Quotation document content in Markdown.
+    """
+    # Step 1: Price the COCOMO results
+    quote = calculate_quotation(quotation_data)
+
+    # Step 2: Render the quotation body locally
+    document = render_template(template_name="quotation", input_data=quote)
+
+    # Step 3: Optional cover letter from the LLM
+    if quotation_data.get("include_cover_letter"):
+        prompt = render_template(template_name="quotation_cover_letter", input_data=quote)
+        cover_letter = chat_with_llm(prompt=prompt, max_tokens=400)
+        document = f"{cover_letter}\n\n---\n\n{document}"
+
+    return document
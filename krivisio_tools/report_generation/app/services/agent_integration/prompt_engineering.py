@@ -1 +1,118 @@
+"""
+Shared prompt-building helpers.
 
+Every prompt builder in the toolkit finishes its prompt through
+`finalize_prompt`, which normalizes whitespace, counts tokens locally and
+records per-template token sizes. Structured data should be embedded with
+`compact_json` / `compact_list` rather than Python reprs.
+"""
+
+import json
+import re
+import textwrap
+import threading
+from functools import lru_cache
+from typing import Any, Dict, Iterable
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+
+DEFAULT_TOKENIZER_MODEL = "gpt-4o"
+
+_TRAILING_SPACE_RE = re.compile(r"[ \t]+$", re.MULTILINE)
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+_stats: Dict[str, Dict[str, int]] = {}
+_stats_lock = threading.Lock()
+
+
+def compact_text(text: str) -> str:
+    """
+    Normalize prompt whitespace: remove common indentation, trailing spaces
+    and runs of blank lines. Relative indentation (e.g. JSON examples) is kept.
+    """
+    text = textwrap.dedent(text)
+    text = _TRAILING_SPACE_RE.sub("", text)
+    text = _BLANK_LINES_RE.sub("\n\n", text)
+    return text.strip()
+
+
+def compact_json(data: Any) -> str:
+    """Serialize structured data for a prompt without indentation or ASCII escaping."""
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def compact_list(items: Iterable[Any], sep: str = ", ") -> str:
+    """Join list items into a plain delimited string instead of a Python repr."""
+    return sep.join(str(item) for item in items)
+
+
+@lru_cache(maxsize=8)
+def _get_encoding(model: str):
+    """Load the tokenizer for a model; None if tiktoken or its encoding is unavailable."""
+    if not tiktoken:
+        return None
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            # Model name tiktoken does not know: count with the current OpenAI encoding
+            return tiktoken.get_encoding("o200k_base")
+    except Exception as e:
+        # Encodings are downloaded on first use; stay usable offline.
+        print(f"[Prompt Tokens] tiktoken unavailable ({e}); using character estimate.")
+        return None
+
+
+def count_tokens(text: str, model: str = DEFAULT_TOKENIZER_MODEL) -> int:
+    """
+    Count prompt tokens locally.
+
+    Uses tiktoken when installed; otherwise estimates roughly four
+    characters per token.
+    """
+    encoding = _get_encoding(model)
+    if encoding is not None:
+        return len(encoding.encode(text))
+    return (len(text) + 3) // 4
+
+
+def finalize_prompt(template_name: str, prompt: str, model: str = DEFAULT_TOKENIZER_MODEL) -> str:
+    """
+    Normalize a prompt and record its token count under `template_name`.
+
+    Args:
+        template_name (str): Stable name of the prompt template.
+        prompt (str): Rendered prompt.
+        model (str): Model whose tokenizer is used for counting.
+
+    Returns:
+        str: The compacted prompt, ready to send.
+    """
+    prompt = compact_text(prompt)
+    tokens = count_tokens(prompt, model)
+
+    with _stats_lock:
+        entry = _stats.setdefault(template_name, {"calls": 0, "last_tokens": 0, "max_tokens": 0, "total_tokens": 0})
+        entry["calls"] += 1
+        entry["last_tokens"] = tokens
+        entry["max_tokens"] = max(entry["max_tokens"], tokens)
+        entry["total_tokens"] += tokens
+
+    print(f"[Prompt Tokens] {template_name}: {tokens} tokens")
+    return prompt
+
+
+def get_prompt_token_stats() -> Dict[str, Dict[str, int]]:
+    """Per-template token statistics recorded by `finalize_prompt`."""
+    with _stats_lock:
+        return {name: dict(entry) for name, entry in _stats.items()}
+
+
+def reset_prompt_token_stats() -> None:
+    """Clear recorded token statistics."""
+    with _stats_lock:
+        _stats.clear()
@@ -0,0 +1,116 @@
+"""
+Document service – persists generated documents and serves them by ID.
+
+Wraps the content-addressed DocumentStore with page-based access so clients
+can fetch large documents in slices instead of receiving them inline.
+"""
+
+import math
+import threading
+from typing import Dict, List, Optional
+
+from krivisio_tools.report_generation.app.core.config import DOCUMENT_STORE_DIR, DOCUMENT_PAGE_SIZE
+from krivisio_tools.report_generation.app.services.storage_service import DocumentStore
+
+
+_store: Optional[DocumentStore] = None
+_store_lock = threading.Lock()
+
+
+def get_document_store() -> DocumentStore:
+    """Return the process-wide document store, creating it on first use."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = DocumentStore(DOCUMENT_STORE_DIR)
+        return _store
+
+
+def document_uri(doc_id: str) -> str:
+    """MCP resource URI for a stored document."""
+    return f"documents://{doc_id}"
+
+
+def save_document(project: str, module: str, doc_type: str, content: str) -> Dict:
+    """
+    Persist a generated document.
+
+    Args:
+        project (str): Project identifier.
+        module (str): Functional module (e.g., 'onboarding').
+        doc_type (str): Document type (e.g., 'proposal').
+        content (str): Document content.
+
+    Returns:
+        dict: Stored record including id, version and resource uri.
+    """
+    record = get_document_store().put(project, module.lower(), doc_type.lower(), content)
+    return {**record, "uri": document_uri(record["id"])}
+
+
+def _align_to_char(store: DocumentStore, content_hash: str, offset: int, size: int) -> int:
+    """Move a byte offset back to the start of a UTF-8 character."""
+    if offset <= 0 or offset >= size:
+        return min(max(offset, 0), size)
+    window = store.read_bytes(content_hash, max(0, offset - 3), offset + 1)
+    shift = 0
+    while shift < len(window) - 1 and (window[-1 - shift] & 0xC0) == 0x80:
+        shift += 1
+    return offset - shift
+
+
+def get_document(doc_id: str, page: Optional[int] = None, page_size: int = DOCUMENT_PAGE_SIZE) -> Dict:
+    """
+    Fetch a stored document, whole or one page at a time.
+
+    Pages are byte ranges of `page_size` aligned to UTF-8 character
+    boundaries, so concatenating all pages yields the original document.
+
+    Args:
+        doc_id (str): Document ID returned by `save_document`.
+        page (int, optional): Zero-based page number; None returns everything.
+        page_size (int): Page size in bytes.
+
+    Returns:
+        dict: Record metadata plus content, page and total_pages.
+
+    Raises:
+        KeyError: If the document does not exist.
+        ValueError: If the page is out of range.
+    """
+    store = get_document_store()
+    record = store.get_metadata(doc_id)
+    if not record:
+        raise KeyError(f"Document not found: '{doc_id}'")
+
+    size = record["size_bytes"]
+    total_pages = max(1, math.ceil(size / page_size))
+
+    if page is None:
+        data = store.read_bytes(record["content_hash"])
+    else:
+        if not 0 <= page < total_pages:
+            raise ValueError(f"Page {page} out of range (0-{total_pages - 1}).")
+        start = _align_to_char(store, record["content_hash"], page * page_size, size)
+        end = _align_to_char(store, record["content_hash"], (page + 1) * page_size, size)
+        data = store.read_bytes(record["content_hash"], start, end)
+
+    return {
+        **record,
+        "uri": document_uri(doc_id),
+        "page": page,
+        "total_pages": total_pages,
+        "content": data.decode("utf-8"),
+    }
+
+
+def list_documents(
+    project: Optional[str] = None,
+    module: Optional[str] = None,
+    doc_type: Optional[str] = None
+) -> List[Dict]:
+    """List stored documents, optionally filtered by project, module and type."""
+    return [
+        {**record, "uri": document_uri(record["id"])}
+        for record in get_document_store().list_documents(project, module, doc_type)
+    ]
@@ -0,0 +1,179 @@
+"""
+Export stage for generated documents.
+
+Converts Markdown to PDF or DOCX in a bounded process pool so conversions never
+block the MCP event loop. Output is cached on disk by content hash, so exporting
+the same document again only reads the cached file.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional, Tuple
+
+from krivisio_tools.report_generation.app.core.config import EXPORT_CACHE_DIR, EXPORT_MAX_WORKERS
+from krivisio_tools.report_generation.app.utils.doc_formatter import markdown_to_docx
+from krivisio_tools.report_generation.app.utils.pdf_converter import markdown_to_pdf
+
+
+EXPORT_FORMATS = ("pdf", "docx")
+
+# Bump when rendering changes so stale cached files are not served
+_RENDERER_VERSION = "1"
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    """Lazily create the shared, bounded conversion pool."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(max_workers=EXPORT_MAX_WORKERS)
+        return _executor
+
+
+def _convert(markdown: str, fmt: str) -> Tuple[bytes, Optional[int]]:
+    """Worker entry point: render Markdown and return (content, pages)."""
+    if fmt == "pdf":
+        return markdown_to_pdf(markdown)
+    return markdown_to_docx(markdown), None
+
+
+def _content_hash(markdown: str, fmt: str) -> str:
+    raw = f"{_RENDERER_VERSION}\0{fmt}\0{markdown}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _cache_path(content_hash: str, fmt: str) -> str:
+    return os.path.join(EXPORT_CACHE_DIR, content_hash[:2], f"{content_hash}.{fmt}")
+
+
+def _read_cache(content_hash: str, fmt: str) -> Optional[Dict]:
+    path = _cache_path(content_hash, fmt)
+    try:
+        with open(path, "rb") as f:
+            content = f.read()
+        with open(f"{path}.json", "r", encoding="utf-8") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return _result(content_hash, fmt, path, content, meta.get("pages"), cached=True)
+
+
+def _write_cache(content_hash: str, fmt: str, content: bytes, pages: Optional[int]) -> str:
+    """Write the file and its metadata atomically so concurrent readers never see partial output."""
+    path = _cache_path(content_hash, fmt)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"pages": pages, "size_bytes": len(content)}, f)
+    os.replace(tmp_path, f"{path}.json")
+    return path
+
+
+def _result(content_hash: str, fmt: str, path: str, content: bytes, pages: Optional[int], cached: bool) -> Dict:
+    return {
+        "format": fmt,
+        "content_hash": content_hash,
+        "path": path,
+        "pages": pages,
+        "size_bytes": len(content),
+        "cached": cached,
+        "content": content,
+    }
+
+
+def _validate_format(fmt: str) -> str:
+    fmt = fmt.lower()
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: '{fmt}'. Choose from {list(EXPORT_FORMATS)}.")
+    return fmt
+
+
+def export_document(markdown: str, fmt: str = "pdf") -> Dict:
+    """
+    Export a Markdown document to PDF or DOCX, blocking until done.
+
+    Args:
+        markdown (str): Generated document content.
+        fmt (str): "pdf" or "docx".
+
+    Returns:
+        dict: format, content_hash, path, pages (PDF only), size_bytes,
+        cached flag and the file content as bytes.
+
+    Raises:
+        ValueError: If the format is unsupported.
+    """
+    fmt = _validate_format(fmt)
+    content_hash = _content_hash(markdown, fmt)
+
+    cached = _read_cache(content_hash, fmt)
+    if cached:
+        return cached
+
+    content, pages = _get_executor().submit(_convert, markdown, fmt).result()
+    path = _write_cache(content_hash, fmt, content, pages)
+    return _result(content_hash, fmt, path, content, pages, cached=False)
+
+
+async def export_document_async(markdown: str, fmt: str = "pdf") -> Dict:
+    """
+    Export a Markdown document without blocking the running event loop.
+
+    Same contract as `export_document`; the conversion runs in the process
+    pool and cache I/O runs in the default thread executor.
+    """
+    fmt = _validate_format(fmt)
+    content_hash = _content_hash(markdown, fmt)
+    loop = asyncio.get_running_loop()
+
+    cached = await loop.run_in_executor(None, _read_cache, content_hash, fmt)
+    if cached:
+        return cached
+
+    content, pages = await loop.run_in_executor(_get_executor(), _convert, markdown, fmt)
+    path = await loop.run_in_executor(None, _write_cache, content_hash, fmt, content, pages)
+    return _result(content_hash, fmt, path, content, pages, cached=False)
+
+
+# ──────────────────────────────────────────────────────────────────────────
+# Benchmark (run `python -m krivisio_tools.report_generation.app.services.export_service`)
+if __name__ == "__main__":
+    import time
+    from krivisio_tools.report_generation.app.routes.onboarding.quotation import generate_quotation_document
+
+    sample = generate_quotation_document({
+        "project_description": "E-commerce platform",
+        "tech_stack": ["Python", "Django", "React"],
+        "complexity_level": "intermediate",
+        "features": [f"Feature {i}: catalogue, cart and checkout flows" for i in range(40)],
+        "cocomo_results": {"estimation": {"person_months": 48.0, "development_time_months": 11.5}},
+    })
+    documents = [f"{sample}\n\nRevision {i}\n" for i in range(16)]
+
+    async def run_batch():
+        return await asyncio.gather(*(export_document_async(doc, "pdf") for doc in documents))
+
+    start = time.perf_counter()
+    results = asyncio.run(run_batch())
+    elapsed = time.perf_counter() - start
+    pages = sum(r["pages"] for r in results)
+    print(f"Cold : {len(results)} PDFs, {pages} pages in {elapsed:.2f}s "
+          f"→ {pages / elapsed:.1f} pages/s ({EXPORT_MAX_WORKERS} workers)")
+
+    start = time.perf_counter()
+    results = asyncio.run(run_batch())
+    elapsed = time.perf_counter() - start
+    print(f"Cached: {sum(r['cached'] for r in results)}/{len(results)} hits in {elapsed * 1000:.1f}ms "
+          f"→ {pages / elapsed:.1f} pages/s")
@@ -0,0 +1,172 @@
+"""
+Content-addressed storage for generated documents.
+
+Document bodies are stored once per unique content under their SHA-256 hash;
+an SQLite index maps document IDs to (project, module, doc_type, version) and
+the content hash. Reads go through mmap so large documents can be served in
+slices without loading them into memory.
+"""
+
+import hashlib
+import mmap
+import os
+import sqlite3
+import threading
+import uuid
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    id TEXT PRIMARY KEY,
+    project TEXT NOT NULL,
+    module TEXT NOT NULL,
+    doc_type TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    content_hash TEXT NOT NULL,
+    size_bytes INTEGER NOT NULL,
+    created_at TEXT NOT NULL,
+    UNIQUE (project, module, doc_type, version)
+);
+CREATE INDEX IF NOT EXISTS idx_documents_hash ON documents (content_hash);
+"""
+
+_COLUMNS = ("id", "project", "module", "doc_type", "version", "content_hash", "size_bytes", "created_at")
+
+
+class DocumentStore:
+    """
+    Local content-addressed document store.
+
+    Args:
+        root (str): Directory holding the `objects/` tree and `index.sqlite3`.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        self.objects_dir = os.path.join(root, "objects")
+        self.index_path = os.path.join(root, "index.sqlite3")
+        self._local = threading.local()
+        os.makedirs(self.objects_dir, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        """One connection per thread; WAL lets readers run alongside a writer."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.index_path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _object_path(self, content_hash: str) -> str:
+        return os.path.join(self.objects_dir, content_hash[:2], content_hash)
+
+    def _write_object(self, content_hash: str, data: bytes) -> None:
+        """Write an object file once; identical content is never stored twice."""
+        path = self._object_path(content_hash)
+        if os.path.exists(path):
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def put(self, project: str, module: str, doc_type: str, content: str) -> Dict:
+        """
+        Store a document, creating a new version unless the latest version
+        already has identical content.
+
+        Args:
+            project (str): Project identifier.
+            module (str): Functional module (e.g., 'onboarding').
+            doc_type (str): Document type (e.g., 'proposal').
+            content (str): Document body.
+
+        Returns:
+            dict: Index record of the stored (or deduplicated) document.
+        """
+        data = content.encode("utf-8")
+        content_hash = hashlib.sha256(data).hexdigest()
+        self._write_object(content_hash, data)
+
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            latest = conn.execute(
+                f"SELECT {', '.join(_COLUMNS)} FROM documents "
+                "WHERE project = ? AND module = ? AND doc_type = ? ORDER BY version DESC LIMIT 1",
+                (project, module, doc_type)
+            ).fetchone()
+
+            if latest and latest[5] == content_hash:
+                conn.execute("COMMIT")
+                return dict(zip(_COLUMNS, latest))
+
+            record = {
+                "id": uuid.uuid4().hex,
+                "project": project,
+                "module": module,
+                "doc_type": doc_type,
+                "version": (latest[4] + 1) if latest else 1,
+                "content_hash": content_hash,
+                "size_bytes": len(data),
+                "created_at": datetime.now(timezone.utc).isoformat(),
+            }
+            conn.execute(
+                f"INSERT INTO documents ({', '.join(_COLUMNS)}) VALUES ({', '.join('?' * len(_COLUMNS))})",
+                tuple(record[c] for c in _COLUMNS)
+            )
+            conn.execute("COMMIT")
+            return record
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def get_metadata(self, doc_id: str) -> Optional[Dict]:
+        """Return the index record for a document ID, or None."""
+        row = self._connect().execute(
+            f"SELECT {', '.join(_COLUMNS)} FROM documents WHERE id = ?", (doc_id,)
+        ).fetchone()
+        return dict(zip(_COLUMNS, row)) if row else None
+
+    def list_documents(
+        self,
+        project: Optional[str] = None,
+        module: Optional[str] = None,
+        doc_type: Optional[str] = None
+    ) -> List[Dict]:
+        """List index records, optionally filtered, newest version first."""
+        filters = {"project": project, "module": module, "doc_type": doc_type}
+        clauses = [f"{k} = ?" for k, v in filters.items() if v is not None]
+        params = [v for v in filters.values() if v is not None]
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self._connect().execute(
+            f"SELECT {', '.join(_COLUMNS)} FROM documents {where} "
+            "ORDER BY project, module, doc_type, version DESC",
+            params
+        ).fetchall()
+        return [dict(zip(_COLUMNS, row)) for row in rows]
+
+    def read_bytes(self, content_hash: str, start: int = 0, end: Optional[int] = None) -> bytes:
+        """
+        Read a byte range of a stored object through a read-only memory map.
+
+        Args:
+            content_hash (str): Object hash.
+            start (int): First byte offset.
+            end (int, optional): End offset (exclusive); defaults to end of file.
+
+        Returns:
+            bytes: The requested slice.
+        """
+        path = self._object_path(content_hash)
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return b""
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return mm[start:end]
@@ -1 +1,188 @@
+"""
+Markdown formatting utilities for document export.
 
+Parses the Markdown produced by the document generators into simple blocks
+and renders them to DOCX with python-docx. The same block model is reused by
+the PDF converter.
+"""
+
+import io
+import re
+from typing import List, Tuple
+
+try:
+    import docx
+    from docx.shared import Pt
+except ImportError:
+    docx = None
+
+
+# Block = (kind, payload). Kinds: heading, paragraph, bullet, numbered, table, code, rule
+Block = Tuple[str, object]
+
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.*)$")
+_BULLET_RE = re.compile(r"^(\s*)[-*+]\s+(.*)$")
+_NUMBERED_RE = re.compile(r"^\s*(\d+)[.)]\s+(.*)$")
+_RULE_RE = re.compile(r"^\s*([-*_])(\s*\1){2,}\s*$")
+_TABLE_SEPARATOR_RE = re.compile(r"^\s*\|?\s*:?-{2,}:?\s*(\|\s*:?-{2,}:?\s*)*\|?\s*$")
+_INLINE_RE = re.compile(r"(\*\*[^*]+\*\*|__[^_]+__|`[^`]+`|\*[^*\s][^*]*\*)")
+
+
+def _split_table_row(line: str) -> List[str]:
+    return [cell.strip() for cell in line.strip().strip("|").split("|")]
+
+
+def parse_markdown(text: str) -> List[Block]:
+    """
+    Parse Markdown into a flat list of blocks.
+
+    Supports headings, paragraphs, bullet and numbered lists, pipe tables,
+    fenced code blocks and horizontal rules — the subset our templates and
+    LLM prompts produce.
+
+    Args:
+        text (str): Markdown document.
+
+    Returns:
+        List[Block]: Parsed blocks in document order.
+    """
+    blocks: List[Block] = []
+    paragraph: List[str] = []
+    lines = text.splitlines()
+    i = 0
+
+    def flush_paragraph():
+        if paragraph:
+            blocks.append(("paragraph", " ".join(paragraph)))
+            paragraph.clear()
+
+    while i < len(lines):
+        line = lines[i]
+        stripped = line.strip()
+
+        if stripped.startswith("```"):
+            flush_paragraph()
+            code = []
+            i += 1
+            while i < len(lines) and not lines[i].strip().startswith("```"):
+                code.append(lines[i])
+                i += 1
+            blocks.append(("code", "\n".join(code)))
+        elif not stripped:
+            flush_paragraph()
+        elif _RULE_RE.match(stripped):
+            flush_paragraph()
+            blocks.append(("rule", None))
+        elif _HEADING_RE.match(stripped):
+            flush_paragraph()
+            hashes, heading = _HEADING_RE.match(stripped).groups()
+            blocks.append(("heading", (len(hashes), heading.strip())))
+        elif stripped.startswith("|") and i + 1 < len(lines) and _TABLE_SEPARATOR_RE.match(lines[i + 1]):
+            flush_paragraph()
+            rows = [_split_table_row(stripped)]
+            i += 2
+            while i < len(lines) and lines[i].strip().startswith("|"):
+                rows.append(_split_table_row(lines[i]))
+                i += 1
+            blocks.append(("table", rows))
+            continue
+        elif _BULLET_RE.match(line):
+            flush_paragraph()
+            indent, item = _BULLET_RE.match(line).groups()
+            blocks.append(("bullet", (len(indent.expandtabs(4)) // 2, item.strip())))
+        elif _NUMBERED_RE.match(line):
+            flush_paragraph()
+            number, item = _NUMBERED_RE.match(line).groups()
+            blocks.append(("numbered", (int(number), item.strip())))
+        else:
+            paragraph.append(stripped)
+        i += 1
+
+    flush_paragraph()
+    return blocks
+
+
+def parse_inline(text: str) -> List[Tuple[str, str]]:
+    """
+    Split a line into styled runs.
+
+    Args:
+        text (str): Inline Markdown text.
+
+    Returns:
+        List[Tuple[str, str]]: (text, style) pairs where style is one of
+        "", "bold", "italic" or "code".
+    """
+    runs = []
+    for part in _INLINE_RE.split(text):
+        if not part:
+            continue
+        if (part.startswith("**") and part.endswith("**")) or (part.startswith("__") and part.endswith("__")):
+            runs.append((part[2:-2], "bold"))
+        elif part.startswith("`") and part.endswith("`"):
+            runs.append((part[1:-1], "code"))
+        elif part.startswith("*") and part.endswith("*") and len(part) > 2:
+            runs.append((part[1:-1], "italic"))
+        else:
+            runs.append((part, ""))
+    return runs
+
+
+def _add_runs(paragraph, text: str) -> None:
+    for run_text, style in parse_inline(text):
+        run = paragraph.add_run(run_text)
+        run.bold = style == "bold"
+        run.italic = style == "italic"
+        if style == "code":
+            run.font.name = "Courier New"
+
+
+def markdown_to_docx(markdown: str) -> bytes:
+    """
+    Render a Markdown document to DOCX.
+
+    Args:
+        markdown (str): Markdown document.
+
+    Returns:
+        bytes: DOCX file content.
+    """
+    if not docx:
+        raise ImportError("python-docx is required for DOCX export. Install with `pip install python-docx`.")
+
+    document = docx.Document()
+
+    for kind, payload in parse_markdown(markdown):
+        if kind == "heading":
+            level, text = payload
+            _add_runs(document.add_heading(level=min(level, 9)), text)
+        elif kind == "paragraph":
+            _add_runs(document.add_paragraph(), payload)
+        elif kind == "bullet":
+            depth, text = payload
+            style = "List Bullet" if depth == 0 else f"List Bullet {min(depth + 1, 3)}"
+            _add_runs(document.add_paragraph(style=style), text)
+        elif kind == "numbered":
+            _, text = payload
+            _add_runs(document.add_paragraph(style="List Number"), text)
+        elif kind == "table":
+            columns = max(len(row) for row in payload)
+            table = document.add_table(rows=len(payload), cols=columns)
+            table.style = "Table Grid"
+            for r, row in enumerate(payload):
+                for c, cell in enumerate(row):
+                    paragraph = table.cell(r, c).paragraphs[0]
+                    _add_runs(paragraph, cell)
+                    if r == 0:
+                        for run in paragraph.runs:
+                            run.bold = True
+        elif kind == "code":
+            run = document.add_paragraph().add_run(payload)
+            run.font.name = "Courier New"
+            run.font.size = Pt(9)
+        elif kind == "rule":
+            document.add_paragraph("_" * 40)
+
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
@@ -1 +1,99 @@
+"""
+PDF conversion for generated Markdown documents.
 
+Renders the block model from doc_formatter with ReportLab, entirely locally.
+"""
+
+import io
+from typing import Tuple
+from xml.sax.saxutils import escape
+
+from krivisio_tools.report_generation.app.utils.doc_formatter import parse_markdown, parse_inline
+
+try:
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.platypus import (
+        SimpleDocTemplate, Paragraph, Preformatted, Spacer, Table, TableStyle, ListFlowable, HRFlowable
+    )
+except ImportError:
+    SimpleDocTemplate = None
+
+
+def _to_markup(text: str) -> str:
+    """Convert inline Markdown to ReportLab paragraph markup."""
+    parts = []
+    for run_text, style in parse_inline(text):
+        run_text = escape(run_text)
+        if style == "bold":
+            run_text = f"<b>{run_text}</b>"
+        elif style == "italic":
+            run_text = f"<i>{run_text}</i>"
+        elif style == "code":
+            run_text = f'<font face="Courier">{run_text}</font>'
+        parts.append(run_text)
+    return "".join(parts)
+
+
+def markdown_to_pdf(markdown: str) -> Tuple[bytes, int]:
+    """
+    Render a Markdown document to PDF.
+
+    Args:
+        markdown (str): Markdown document.
+
+    Returns:
+        Tuple[bytes, int]: PDF file content and its page count.
+    """
+    if not SimpleDocTemplate:
+        raise ImportError("reportlab is required for PDF export. Install with `pip install reportlab`.")
+
+    styles = getSampleStyleSheet()
+    heading_styles = {1: styles["Heading1"], 2: styles["Heading2"], 3: styles["Heading3"]}
+    body = styles["BodyText"]
+
+    story = []
+    pending_items = []
+    pending_kind = None
+
+    def flush_list():
+        if pending_items:
+            bullet_type = "1" if pending_kind == "numbered" else "bullet"
+            story.append(ListFlowable(list(pending_items), bulletType=bullet_type, leftIndent=12))
+            pending_items.clear()
+
+    for kind, payload in parse_markdown(markdown):
+        if kind != pending_kind:
+            flush_list()
+            pending_kind = kind
+
+        if kind == "heading":
+            level, text = payload
+            story.append(Paragraph(_to_markup(text), heading_styles.get(level, styles["Heading4"])))
+        elif kind == "paragraph":
+            story.append(Paragraph(_to_markup(payload), body))
+        elif kind in ("bullet", "numbered"):
+            _, text = payload
+            pending_items.append(Paragraph(_to_markup(text), body))
+        elif kind == "table":
+            rows = [[Paragraph(_to_markup(cell), body) for cell in row] for row in payload]
+            table = Table(rows, repeatRows=1, hAlign="LEFT")
+            table.setStyle(TableStyle([
+                ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
+                ("BACKGROUND", (0, 0), (-1, 0), colors.whitesmoke),
+                ("VALIGN", (0, 0), (-1, -1), "TOP"),
+            ]))
+            story.append(table)
+            story.append(Spacer(1, 6))
+        elif kind == "code":
+            story.append(Preformatted(payload, styles["Code"]))
+        elif kind == "rule":
+            story.append(HRFlowable(width="100%", color=colors.lightgrey, spaceBefore=4, spaceAfter=4))
+
+    flush_list()
+
+    buffer = io.BytesIO()
+    pdf = SimpleDocTemplate(buffer, pagesize=A4, leftMargin=50, rightMargin=50, topMargin=50, bottomMargin=50)
+    pdf.build(story)
+    return buffer.getvalue(), pdf.page
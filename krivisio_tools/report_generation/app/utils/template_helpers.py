@@ -5,7 +5,7 @@ based on template name and standardized input.
 
 from typing import Callable, Dict
 from pydantic import BaseModel
-from krivisio_tools.report_generation.templates.onboarding import proposal
+from krivisio_tools.report_generation.templates.onboarding import proposal, quotation, contract, analysis
 
 # Define the type of input expected for all templates
 TemplateInput = BaseModel
@@ -13,6 +13,11 @@ TemplateInput = BaseModel
 # Registry to map template names to their corresponding builder functions
 TEMPLATE_REGISTRY: Dict[str, Callable[[TemplateInput], str]] = {
     "proposal": proposal.build_proposal_spec_prompt,
+    "proposal_from_analysis": proposal.build_proposal_from_analysis_prompt,
+    "project_analysis": analysis.build_project_analysis_prompt,
+    "contract": contract.build_contract_prompt,
+    "quotation": quotation.build_quotation_document,
+    "quotation_cover_letter": quotation.build_quotation_cover_letter_prompt,
     # Future templates can be added here
     # "sow": sow.build_sow_document_prompt,
     # "nda": nda.build_nda_prompt,
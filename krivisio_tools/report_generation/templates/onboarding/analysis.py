@@ -0,0 +1,88 @@
+"""
+Template builder for the shared Project Analysis used by onboarding bundles.
+
+The analysis is a compact JSON digest of the project that every document in a
+bundle is generated from, so the full project input is sent to the LLM once.
+"""
+
+from typing import Any, Dict
+
+from krivisio_tools.report_generation.app.services.agent_integration.prompt_engineering import finalize_prompt
+
+
+def build_project_analysis_prompt(data: Dict) -> str:
+    """
+    Generate a prompt asking the LLM for a compact JSON project analysis.
+
+    Args:
+        data (dict): Onboarding input containing project_description,
+            tech_stack, complexity_level and features.
+
+    Returns:
+        str: Prompt string requesting raw JSON output.
+    """
+    features = "\n".join(f"- {f}" for f in data["features"])
+    tech_stack = ", ".join(data["tech_stack"])
+
+    prompt = f"""
+You are a senior technical project manager preparing onboarding documents.
+
+Analyse the project below and return a compact digest that proposal, quotation
+and contract writers will share. Keep every value short and factual.
+
+Project: {data["project_description"]}
+Complexity: {data["complexity_level"]}
+Tech Stack: {tech_stack}
+Features:
+{features}
+
+Respond ONLY with raw JSON (no markdown) in this format:
+{{
+  "summary": "two-sentence project summary",
+  "objectives": ["objective"],
+  "modules": [{{"name": "module", "scope": "one line"}}],
+  "architecture": "one-paragraph architecture outline",
+  "non_functional": ["requirement"],
+  "risks": [{{"risk": "risk", "mitigation": "mitigation"}}],
+  "deliverables": ["deliverable"],
+  "assumptions": ["assumption"]
+}}
+"""
+    return finalize_prompt("project_analysis", prompt)
+
+
+def _format_item(item: Any, first: str, second: str, template: str) -> str:
+    """One module/risk line; items that are not objects are rendered as text."""
+    if isinstance(item, dict):
+        return template.format(item.get(first), item.get(second))
+    return f"- {item}"
+
+
+def format_project_analysis(analysis: Dict) -> str:
+    """
+    Render a project analysis as compact Markdown context for document prompts.
+
+    Args:
+        analysis (dict): Output of `derive_project_analysis`.
+
+    Returns:
+        str: Bullet-style summary of the analysis.
+    """
+    lines = [f"Summary: {analysis.get('summary', '')}"]
+    if analysis.get("objectives"):
+        lines.append("Objectives: " + "; ".join(map(str, analysis["objectives"])))
+    if analysis.get("modules"):
+        lines.append("Modules:")
+        lines += [_format_item(m, "name", "scope", "- {}: {}") for m in analysis["modules"]]
+    if analysis.get("architecture"):
+        lines.append(f"Architecture: {analysis['architecture']}")
+    if analysis.get("non_functional"):
+        lines.append("Non-functional: " + "; ".join(map(str, analysis["non_functional"])))
+    if analysis.get("risks"):
+        lines.append("Risks:")
+        lines += [_format_item(r, "risk", "mitigation", "- {} (mitigation: {})") for r in analysis["risks"]]
+    if analysis.get("deliverables"):
+        lines.append("Deliverables: " + "; ".join(map(str, analysis["deliverables"])))
+    if analysis.get("assumptions"):
+        lines.append("Assumptions: " + "; ".join(map(str, analysis["assumptions"])))
+    return "\n".join(lines)
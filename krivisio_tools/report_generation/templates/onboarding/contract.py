@@ -0,0 +1,64 @@
+"""
+Template builder for the Software Development Contract used in the Onboarding Phase.
+
+Builds the LLM prompt from the shared project analysis and the priced quotation,
+so contract terms stay consistent with the other onboarding documents.
+"""
+
+from typing import Dict
+
+from krivisio_tools.report_generation.app.services.agent_integration.prompt_engineering import finalize_prompt
+from krivisio_tools.report_generation.templates.onboarding.analysis import format_project_analysis
+
+
+def build_contract_prompt(data: Dict) -> str:
+    """
+    Generate a prompt for LLM to draft a software development contract.
+
+    Args:
+        data (dict): Onboarding input with:
+            - analysis (dict): Shared project analysis, or None to fall back
+              to project_description and features
+            - quote (dict): Output of `calculate_quotation`
+            - client_name (str, optional)
+
+    Returns:
+        str: Formatted LLM prompt string in Markdown format.
+    """
+    quote = data["quote"]
+    currency = quote["currency"]
+
+    if data.get("analysis"):
+        project_context = format_project_analysis(data["analysis"])
+    else:
+        features = "; ".join(data["features"])
+        project_context = f"Summary: {data['project_description']}\nFeatures: {features}"
+
+    payments = "\n".join(
+        f"- {p['milestone']}: {p['percent']:g}% ({currency} {p['amount']:,.2f})"
+        for p in quote["payment_schedule"]
+    )
+    client = data.get("client_name") or "[Client Name]"
+
+    prompt = f"""
+You are a contracts specialist at a software development company.
+
+Draft a **Software Development Agreement** in **Markdown** between the company
+("Provider") and {client} ("Client") for the project below.
+
+{project_context}
+
+Commercials:
+- Total Fee: {currency} {quote['total']:,.2f}
+- Timeline: {quote['development_time_months']:.1f} months
+Payment Schedule:
+{payments}
+
+Sections: 1. Parties 2. Scope of Work 3. Deliverables & Milestones 4. Fees & Payment
+5. Change Requests 6. Acceptance 7. Intellectual Property 8. Confidentiality
+9. Warranties & Support 10. Limitation of Liability 11. Termination 12. Governing Law
+
+Use placeholders in square brackets for unknown legal details. Keep the fees and
+payment schedule exactly as given.
+"""
+    return finalize_prompt("contract", prompt)
@@ -8,6 +8,12 @@ Designed to support multiple templates via unified input schema.
 from typing import List, Dict, Optional
 from pydantic import BaseModel
 
+from krivisio_tools.report_generation.app.services.agent_integration.prompt_engineering import (
+    compact_list,
+    finalize_prompt,
+)
+from krivisio_tools.report_generation.templates.onboarding.analysis import format_project_analysis
+
 
 class ProposalTemplateInput(BaseModel):
     """Unified input schema for proposal prompt generation."""
@@ -18,6 +24,26 @@ class ProposalTemplateInput(BaseModel):
     cocomo_results: Dict
 
 
+def _extract_cocomo_summary(cocomo: Dict) -> tuple:
+    """
+    Read the headline COCOMO-II figures, accepting both the template layout
+    (function_points / revl / effort_schedule) and the estimation service
+    output (function_point_sizing / revl_adjustment / estimation).
+    """
+    sizing = cocomo.get("function_points") or cocomo.get("function_point_sizing") or {}
+    revl = cocomo.get("revl") or cocomo.get("revl_adjustment") or {}
+    effort = cocomo.get("effort_schedule") or cocomo.get("estimation") or {}
+
+    return (
+        sizing.get("sloc", "N/A"),
+        cocomo.get("reuse", {}).get("esloc", "N/A"),
+        revl.get("sloc_after_revl", "N/A"),
+        effort.get("person_months", "N/A"),
+        effort.get("development_time_months", "N/A"),
+        effort.get("avg_team_size", "N/A"),
+    )
+
+
 def build_proposal_spec_prompt(data: ProposalTemplateInput) -> str:
     """
     Generate a comprehensive prompt for LLM to create a project specification document.
@@ -37,64 +63,95 @@ def build_proposal_spec_prompt(data: ProposalTemplateInput) -> str:
     cocomo = data["cocomo_results"]
 
     # Extract COCOMO estimation details safely with defaults
-    sloc = cocomo.get("function_points", {}).get("sloc", "N/A")
-    esloc = cocomo.get("reuse", {}).get("esloc", "N/A")
-    total_sloc = cocomo.get("revl", {}).get("sloc_after_revl", "N/A")
-
-    effort = cocomo.get("effort_schedule", {})
-    person_months = effort.get("person_months", "N/A")
-    dev_time = effort.get("development_time_months", "N/A")
-    avg_team_size = effort.get("avg_team_size", "N/A")
+    sloc, esloc, total_sloc, person_months, dev_time, avg_team_size = _extract_cocomo_summary(cocomo)
 
     # Format features
     formatted_features = "\n".join(f"- {f}" for f in features)
 
     # Compose LLM prompt
     prompt = f"""
-                You are a senior technical project manager.
+You are a senior technical project manager.
+
+Create a comprehensive **project specification document** in **Markdown** format
+for a software project of description : {project_description} with a **{level}** complexity level.
+
+---
+
+### 🧩 Project Features
+{formatted_features}
+
+---
+
+### 🛠️ Technology Stack
+- **Tech Stack**: {compact_list(tech_stack)}
+
+---
 
-                Create a comprehensive **project specification document** in **Markdown** format
-                for a software project of description : {project_description} with a **{level}** complexity level.
+### 📊 COCOMO-II Estimation Summary
+- Estimated SLOC: {sloc}
+- Equivalent SLOC (with reuse): {esloc}
+- Total SLOC (after REVL): {total_sloc}
+- Estimated Effort: {person_months} person-months
+- Development Time: {dev_time} months
+- Average Team Size: {avg_team_size} members
 
-                ---
+---
 
-                ### 🧩 Project Features
-                {formatted_features}
+### 📝 Specification Document Requirements
 
-                ---
+Structure the document with the following sections:
 
-                ### 🛠️ Technology Stack
-                - **Tech Stack**: {tech_stack}
+1. **Executive Summary** – Overview and key insights
+2. **Project Overview** – Purpose, background, and goals
+3. **Functional Requirements** – Feature-level breakdown
+4. **Non-Functional Requirements** – Performance, scalability, reliability
+5. **Technical Architecture** – System diagrams, services, tech stack
+6. **Development Estimation** – Breakdown using COCOMO-II data
+7. **Risk Assessment** – Project risks and mitigation strategies
+8. **Deliverables & Milestones** – Timelines and phases
+9. **Acceptance Criteria** – Completion definition and quality benchmarks
+10. **Resource Requirements** – Roles, team structure, external dependencies
 
-                ---
+Use a professional and formal tone suitable for stakeholders and clients.
+Format the Markdown cleanly for readability and clarity.
+"""
 
-                ### 📊 COCOMO-II Estimation Summary
-                - Estimated SLOC: {sloc}
-                - Equivalent SLOC (with reuse): {esloc}
-                - Total SLOC (after REVL): {total_sloc}
-                - Estimated Effort: {person_months} person-months
-                - Development Time: {dev_time} months
-                - Average Team Size: {avg_team_size} members
+    return finalize_prompt("proposal", prompt)
 
-                ---
 
-                ### 📝 Specification Document Requirements
 
-                Structure the document with the following sections:
+def build_proposal_from_analysis_prompt(data: Dict) -> str:
+    """
+    Generate a proposal prompt from a shared project analysis instead of the
+    raw project input. Used by onboarding bundles.
 
-                1. **Executive Summary** – Overview and key insights  
-                2. **Project Overview** – Purpose, background, and goals  
-                3. **Functional Requirements** – Feature-level breakdown  
-                4. **Non-Functional Requirements** – Performance, scalability, reliability  
-                5. **Technical Architecture** – System diagrams, services, tech stack  
-                6. **Development Estimation** – Breakdown using COCOMO-II data  
-                7. **Risk Assessment** – Project risks and mitigation strategies  
-                8. **Deliverables & Milestones** – Timelines and phases  
-                9. **Acceptance Criteria** – Completion definition and quality benchmarks  
-                10. **Resource Requirements** – Roles, team structure, external dependencies  
+    Args:
+        data (dict): Onboarding input with an additional "analysis" entry
+            produced by `derive_project_analysis`.
 
-                Use a professional and formal tone suitable for stakeholders and clients.
-                Format the Markdown cleanly for readability and clarity.
-            """
+    Returns:
+        str: Formatted LLM prompt string in Markdown format.
+    """
+    sloc, esloc, total_sloc, person_months, dev_time, avg_team_size = _extract_cocomo_summary(
+        data["cocomo_results"]
+    )
 
-    return prompt.strip()
+    prompt = f"""
+You are a senior technical project manager.
+
+Create a comprehensive **project specification document** in **Markdown** format
+for a **{data["complexity_level"]}** complexity project based on this analysis:
+
+{format_project_analysis(data["analysis"])}
+
+Tech Stack: {", ".join(data["tech_stack"])}
+COCOMO-II: SLOC {sloc}; ESLOC {esloc}; SLOC after REVL {total_sloc};
+effort {person_months} PM; time {dev_time} months; team size {avg_team_size}
+
+Sections: 1. Executive Summary 2. Project Overview 3. Functional Requirements
+4. Non-Functional Requirements 5. Technical Architecture 6. Development Estimation
+7. Risk Assessment 8. Deliverables & Milestones 9. Acceptance Criteria 10. Resource Requirements
+
+Use a professional and formal tone suitable for stakeholders and clients.
+"""
+    return finalize_prompt("proposal_from_analysis", prompt)
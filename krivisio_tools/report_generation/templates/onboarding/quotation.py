@@ -0,0 +1,126 @@
+"""
+Template builder for the Quotation document used in the Onboarding Phase.
+
+The quotation body is rendered locally from pre-computed pricing data, so no LLM
+call is needed. Only the optional cover letter is generated through a prompt.
+"""
+
+from typing import Dict
+
+from krivisio_tools.report_generation.app.services.agent_integration.prompt_engineering import finalize_prompt
+
+
+def _money(amount: float, currency: str) -> str:
+    return f"{currency} {amount:,.2f}"
+
+
+def build_quotation_document(quote: Dict) -> str:
+    """
+    Render the quotation document from a computed quote.
+
+    Args:
+        quote (dict): Output of `calculate_quotation`, containing the role
+            breakdown, phase split, payment schedule and totals.
+
+    Returns:
+        str: Quotation document in Markdown format.
+    """
+    currency = quote["currency"]
+    lines = [
+        f"# Project Quotation: {quote['project_description']}",
+        "",
+    ]
+    if quote.get("client_name"):
+        lines.append(f"**Prepared for:** {quote['client_name']}  ")
+    lines += [
+        f"**Complexity Level:** {quote['complexity_level'].title()}  ",
+        f"**Technology Stack:** {', '.join(quote['tech_stack'])}",
+        "",
+        "---",
+        "",
+        "## 1. Scope of Work",
+        "",
+    ]
+    lines += [f"- {feature}" for feature in quote["features"]]
+    lines += [
+        "",
+        "## 2. Estimation Basis (COCOMO-II)",
+        "",
+        f"- Estimated Effort: {quote['person_months']:.2f} person-months",
+        f"- Development Time: {quote['development_time_months']:.2f} months",
+        f"- Average Team Size: {quote['avg_team_size']:.2f} members",
+        "",
+        "## 3. Resource Rate Card",
+        "",
+        "| Role | Effort (PM) | Monthly Rate | Cost |",
+        "|------|------------:|-------------:|-----:|",
+    ]
+    for role in quote["roles"]:
+        lines.append(
+            f"| {role['role']} | {role['person_months']:.2f} | "
+            f"{_money(role['monthly_rate'], currency)} | {_money(role['cost'], currency)} |"
+        )
+    lines += [
+        "",
+        f"- Labour Subtotal: {_money(quote['subtotal'], currency)}",
+        f"- Contingency ({quote['contingency_percent']:g}%): {_money(quote['contingency'], currency)}",
+        f"- **Total Project Cost: {_money(quote['total'], currency)}**",
+        "",
+        "## 4. Phase Breakdown",
+        "",
+        "| Phase | Duration (months) | Cost |",
+        "|-------|------------------:|-----:|",
+    ]
+    for phase in quote["phases"]:
+        lines.append(
+            f"| {phase['phase']} | {phase['duration_months']:.2f} | {_money(phase['cost'], currency)} |"
+        )
+    lines += [
+        "",
+        "## 5. Payment Schedule",
+        "",
+        "| # | Milestone | Share | Amount |",
+        "|---|-----------|------:|-------:|",
+    ]
+    for index, payment in enumerate(quote["payment_schedule"], start=1):
+        lines.append(
+            f"| {index} | {payment['milestone']} | {payment['percent']:g}% | "
+            f"{_money(payment['amount'], currency)} |"
+        )
+    lines += [
+        "",
+        "## 6. Terms",
+        "",
+        "- Prices are valid for 30 days from the date of this quotation.",
+        "- Changes in scope are estimated separately and billed at the rates above.",
+        "- Third-party licences and hosting costs are not included.",
+    ]
+    return "\n".join(lines)
+
+
+def build_quotation_cover_letter_prompt(quote: Dict) -> str:
+    """
+    Generate a short prompt asking the LLM for a quotation cover letter.
+
+    Args:
+        quote (dict): Output of `calculate_quotation`.
+
+    Returns:
+        str: Prompt string for the cover letter.
+    """
+    recipient = quote.get("client_name") or "the client"
+    prompt = f"""
+You are a senior account manager at a software development company.
+
+Write a concise, professional cover letter (under 200 words, Markdown, no headings)
+addressed to {recipient} that accompanies a quotation for the following project:
+
+- Project: {quote['project_description']}
+- Complexity: {quote['complexity_level']}
+- Tech Stack: {', '.join(quote['tech_stack'])}
+- Total Cost: {_money(quote['total'], quote['currency'])}
+- Timeline: {quote['development_time_months']:.1f} months
+
+Do not restate the full price breakdown; it follows the letter.
+"""
+    return finalize_prompt("quotation_cover_letter", prompt)
@@ -0,0 +1,63 @@
+"""Content-addressed document storage and UTF-8-aligned paging."""
+
+import hashlib
+import os
+from unittest import mock
+
+import pytest
+
+from krivisio_tools.report_generation.app.services import document_service
+from krivisio_tools.report_generation.app.services.storage_service import DocumentStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = DocumentStore(str(tmp_path / "documents"))
+    with mock.patch.object(document_service, "get_document_store", return_value=store):
+        yield store
+
+
+def _objects(store):
+    return sorted(name for _, _, files in os.walk(store.objects_dir) for name in files)
+
+
+def test_same_content_is_stored_once(store):
+    first = document_service.save_document("acme", "Onboarding", "Proposal", "# Proposal\n")
+    again = document_service.save_document("acme", "onboarding", "proposal", "# Proposal\n")
+    assert again["id"] == first["id"] and again["version"] == 1
+
+    changed = document_service.save_document("acme", "onboarding", "proposal", "# Proposal v2\n")
+    reverted = document_service.save_document("acme", "onboarding", "proposal", "# Proposal\n")
+    assert (changed["version"], reverted["version"]) == (2, 3)
+
+    digest = hashlib.sha256("# Proposal\n".encode("utf-8")).hexdigest()
+    assert reverted["content_hash"] == digest
+    assert os.path.isfile(os.path.join(store.objects_dir, digest[:2], digest))
+    assert len(_objects(store)) == 2
+
+
+@pytest.mark.parametrize("page_size", [1, 2, 3, 5, 7, 64])
+def test_multibyte_text_reassembles_from_pages(store, page_size):
+    text = "Café 中文 😀 naïve – résumé 🚀\n" * 5
+    record = document_service.save_document("acme", "onboarding", "contract", text)
+
+    first = document_service.get_document(record["id"], page=0, page_size=page_size)
+    pages = [first["content"]] + [
+        document_service.get_document(record["id"], page=p, page_size=page_size)["content"]
+        for p in range(1, first["total_pages"])
+    ]
+    assert "".join(pages) == text
+    assert document_service.get_document(record["id"])["content"] == text
+
+    with pytest.raises(ValueError):
+        document_service.get_document(record["id"], page=first["total_pages"], page_size=page_size)
+
+
+def test_unknown_document_raises_key_error(store):
+    with pytest.raises(KeyError):
+        document_service.get_document("missing")
+
+
+def test_empty_document_reads_back(store):
+    record = document_service.save_document("acme", "onboarding", "notes", "")
+    assert document_service.get_document(record["id"], page=0)["content"] == ""
@@ -0,0 +1,104 @@
+"""Markdown parsing for export, and the content-hash export cache."""
+
+import asyncio
+import io
+from unittest import mock
+
+import pytest
+
+from krivisio_tools.report_generation.app.services import export_service
+from krivisio_tools.report_generation.app.utils.doc_formatter import markdown_to_docx, parse_inline, parse_markdown
+
+
+MARKDOWN = """# Project Proposal
+
+Intro with **bold**, *italic* and `code`
+continued on a second line.
+
+## Scope
+- Authentication
+  - OAuth login
+1. Discovery
+2) Delivery
+
+| Role | Cost |
+|------|-----:|
+| Developer | **USD 1,000** |
+
+```json
+{"a": 1}
+```
+
+---
+"""
+
+
+def test_parse_markdown_blocks():
+    assert parse_markdown(MARKDOWN) == [
+        ("heading", (1, "Project Proposal")),
+        ("paragraph", "Intro with **bold**, *italic* and `code` continued on a second line."),
+        ("heading", (2, "Scope")),
+        ("bullet", (0, "Authentication")),
+        ("bullet", (1, "OAuth login")),
+        ("numbered", (1, "Discovery")),
+        ("numbered", (2, "Delivery")),
+        ("table", [["Role", "Cost"], ["Developer", "**USD 1,000**"]]),
+        ("code", '{"a": 1}'),
+        ("rule", None),
+    ]
+
+
+def test_parse_inline_runs():
+    assert parse_inline("Use **bold**, __strong__, *italic* and `x = 1`.") == [
+        ("Use ", ""), ("bold", "bold"), (", ", ""), ("strong", "bold"), (", ", ""),
+        ("italic", "italic"), (" and ", ""), ("x = 1", "code"), (".", ""),
+    ]
+    # Arithmetic is not emphasis
+    assert parse_inline("2 * 3 * 4") == [("2 * 3 * 4", "")]
+
+
+def test_docx_round_trip():
+    docx = pytest.importorskip("docx")
+    document = docx.Document(io.BytesIO(markdown_to_docx(MARKDOWN)))
+    paragraphs = [(p.style.name, p.text) for p in document.paragraphs if p.text]
+    assert paragraphs[:3] == [
+        ("Heading 1", "Project Proposal"),
+        ("Normal", "Intro with bold, italic and code continued on a second line."),
+        ("Heading 2", "Scope"),
+    ]
+    assert ("List Bullet 2", "OAuth login") in paragraphs
+    bold = [r.text for p in document.paragraphs for r in p.runs if r.bold]
+    assert "bold" in bold
+    assert document.tables[0].cell(1, 1).text == "USD 1,000"
+
+
+@pytest.fixture
+def export_cache(tmp_path):
+    with mock.patch.object(export_service, "EXPORT_CACHE_DIR", str(tmp_path)):
+        yield tmp_path
+    with export_service._executor_lock:
+        if export_service._executor is not None:
+            export_service._executor.shutdown()
+            export_service._executor = None
+
+
+def test_second_export_is_served_from_cache(export_cache):
+    pytest.importorskip("docx")
+    first = asyncio.run(export_service.export_document_async(MARKDOWN, "docx"))
+    assert first["cached"] is False and first["path"].startswith(str(export_cache))
+
+    # A cache hit must not touch the conversion pool
+    with mock.patch.object(export_service, "_get_executor", side_effect=AssertionError("converted again")):
+        again = asyncio.run(export_service.export_document_async(MARKDOWN, "DOCX"))
+        blocking = export_service.export_document(MARKDOWN, "docx")
+
+    assert again["cached"] is True and blocking["cached"] is True
+    assert again["content"] == first["content"] and again["content_hash"] == first["content_hash"]
+
+    other = asyncio.run(export_service.export_document_async(MARKDOWN + "\nMore.\n", "docx"))
+    assert other["cached"] is False and other["content_hash"] != first["content_hash"]
+
+
+def test_unsupported_format_is_rejected():
+    with pytest.raises(ValueError, match="Unsupported export format"):
+        asyncio.run(export_service.export_document_async(MARKDOWN, "html"))
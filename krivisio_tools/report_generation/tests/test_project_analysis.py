@@ -0,0 +1,38 @@
+"""Shared project analysis: tolerant parsing and rendering of model output."""
+
+import json
+from unittest import mock
+
+import pytest
+
+from krivisio_tools.report_generation.app.routes.onboarding import analysis as analysis_route
+from krivisio_tools.report_generation.templates.onboarding.analysis import format_project_analysis
+
+
+INPUT = {
+    "project_description": "Food delivery app",
+    "tech_stack": ["React", "Django"],
+    "complexity_level": "medium",
+    "features": ["Ordering", "Payments"],
+}
+ANALYSIS = {"summary": "Delivery app.", "modules": [{"name": "Orders", "scope": "Cart"}], "risks": []}
+
+
+@pytest.mark.parametrize("response", [
+    "```json\n" + json.dumps(ANALYSIS) + "\n```",
+    "```json\n" + json.dumps(ANALYSIS),
+    "Here is the analysis:\n" + json.dumps(ANALYSIS) + "\nLet me know!",
+])
+def test_fenced_or_prefixed_analysis_is_parsed(response):
+    with mock.patch.object(analysis_route, "chat_with_llm", return_value=response):
+        assert analysis_route.derive_project_analysis(INPUT, use_cache=False) == ANALYSIS
+
+
+def test_non_object_modules_and_risks_are_rendered_as_text():
+    text = format_project_analysis({
+        "summary": "s",
+        "modules": ["Auth", {"name": "Payments", "scope": "Stripe"}],
+        "risks": ["Scope creep", {"risk": "Latency", "mitigation": "Caching"}],
+    })
+    assert "- Auth\n- Payments: Stripe" in text
+    assert "- Scope creep\n- Latency (mitigation: Caching)" in text
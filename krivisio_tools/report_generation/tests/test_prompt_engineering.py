@@ -0,0 +1,223 @@
+"""
+Prompt size regression tests.
+
+Each template is rendered with a fixed input and must stay within its token
+budget. If a template grows on purpose, raise its budget in TOKEN_BUDGETS.
+
+Budgets are measured with the character estimate (four characters per
+token), pinned below, so the result does not depend on whether tiktoken can
+load its encoding in the environment running the tests.
+"""
+
+from unittest import mock
+
+import pytest
+
+from krivisio_tools.report_generation.app.services.agent_integration import prompt_engineering
+from krivisio_tools.report_generation.app.services.agent_integration.prompt_engineering import (
+    compact_json,
+    compact_list,
+    compact_text,
+    count_tokens,
+    finalize_prompt,
+    get_prompt_token_stats,
+    reset_prompt_token_stats,
+)
+from krivisio_tools.report_generation.app.routes.onboarding.quotation import calculate_quotation
+from krivisio_tools.report_generation.templates.onboarding.analysis import build_project_analysis_prompt
+from krivisio_tools.report_generation.templates.onboarding.contract import build_contract_prompt
+from krivisio_tools.report_generation.templates.onboarding.proposal import (
+    build_proposal_from_analysis_prompt,
+    build_proposal_spec_prompt,
+)
+from krivisio_tools.report_generation.templates.onboarding.quotation import build_quotation_cover_letter_prompt
+from krivisio_tools.talent_matcher.core.candidate_selector import (
+    create_team_selection_prompt,
+    create_tie_break_prompt,
+    prefilter_candidates,
+)
+from krivisio_tools.project_structure_generator.models.preferences import ProjectPreferences
+from krivisio_tools.project_structure_generator.utils.prompt_builder import (
+    build_prompt,
+    build_skeleton_prompt,
+    build_subtree_prompt,
+    build_extension_prompt,
+    build_patch_prompt,
+)
+from krivisio_tools.github.utils import classify_repo_features
+
+
+TOKEN_BUDGETS = {
+    "proposal": 450,
+    "proposal_from_analysis": 240,
+    "project_analysis": 250,
+    "contract": 280,
+    "quotation_cover_letter": 140,
+    "team_selection": 250,
+    "team_tie_break": 160,
+    "project_structure": 260,
+    "project_skeleton": 320,
+    "project_subtree": 330,
+    "project_extension": 350,
+    "project_patch": 280,
+    "classify_repo_features": 260,
+}
+
+PROJECT = {
+    "project_description": "E-commerce platform with vendor dashboards",
+    "tech_stack": ["Python", "Django", "React", "PostgreSQL"],
+    "complexity_level": "intermediate",
+    "features": ["User authentication", "Product catalogue", "Shopping cart", "Order tracking"],
+    "cocomo_results": {"estimation": {"person_months": 24.0, "development_time_months": 8.0, "avg_team_size": 3.0}},
+}
+
+SKELETON = {
+    "name": "marketplace",
+    "type": "folder",
+    "children": [
+        {"name": "backend", "type": "folder", "children": []},
+        {"name": "frontend", "type": "folder", "children": []},
+        {"name": "README.md", "type": "file"},
+    ],
+}
+
+ANALYSIS = {
+    "summary": "Multi-vendor marketplace.",
+    "objectives": ["Sell online"],
+    "modules": [{"name": "Cart", "scope": "Checkout"}],
+    "risks": [{"risk": "Traffic spikes", "mitigation": "Caching"}],
+    "deliverables": ["Web app"],
+}
+
+
+def _classify_prompt() -> str:
+    response = '{"Basic": {}, "Intermediate": {}, "Advanced": {}}'
+    with mock.patch.object(classify_repo_features, "chat_with_llm", return_value=response) as llm:
+        classify_repo_features.classify_features_and_tech_stack(
+            {"octo/shop": {"features": ["Login", "Cart"], "tech_stack": ["Flask", "Redis"]}}
+        )
+    return llm.call_args[0][0]
+
+
+def _render_prompts() -> dict:
+    quote = calculate_quotation(PROJECT)
+    return {
+        "proposal": build_proposal_spec_prompt(PROJECT),
+        "proposal_from_analysis": build_proposal_from_analysis_prompt({**PROJECT, "analysis": ANALYSIS}),
+        "project_analysis": build_project_analysis_prompt(PROJECT),
+        "contract": build_contract_prompt({**PROJECT, "analysis": ANALYSIS, "quote": quote}),
+        "quotation_cover_letter": build_quotation_cover_letter_prompt(quote),
+        "team_selection": create_team_selection_prompt(
+            {"frontend": ["React"], "backend": ["Django"]},
+            3.0,
+            4.0,
+            {
+                "frontend": [{"name": "Asha", "skills": ["React", "CSS"], "manager_score": 4.5}],
+                "backend": [{"name": "Ravi", "skills": ["Django"], "manager_score": 4.2}],
+            },
+            {"frontend": "frontend", "backend": "backend"},
+        ),
+        "team_tie_break": create_tie_break_prompt(
+            {"frontend": ["React"], "backend": ["Django"]},
+            [
+                {"name": "Asha", "domain": "frontend", "selection_reason": "Domain: frontend | Manager Score: 4.5 >= 4.0 | Tech Match: React"},
+                {"name": "Ravi", "domain": "backend", "selection_reason": "Domain: backend | Manager Score: 4.2 >= 4.0 | Tech Match: Django"},
+            ],
+            [{"selected": "Ravi", "tied_with": ["Meera"]}],
+            {"Meera": {"domain": "backend", "skills": ["Django", "Redis"], "manager_score": 4.2}},
+        ),
+        "project_structure": build_prompt(
+            PROJECT["project_description"], PROJECT["features"], PROJECT["tech_stack"], ProjectPreferences()
+        ),
+        "project_skeleton": build_skeleton_prompt(
+            PROJECT["project_description"], PROJECT["features"], PROJECT["tech_stack"], ProjectPreferences()
+        ),
+        "project_subtree": build_subtree_prompt(
+            PROJECT["project_description"], PROJECT["features"], PROJECT["tech_stack"], ProjectPreferences(),
+            SKELETON, "backend"
+        ),
+        "project_extension": build_extension_prompt(
+            PROJECT["project_description"], PROJECT["features"], PROJECT["tech_stack"], ProjectPreferences(),
+            SKELETON, ["Kubernetes"]
+        ),
+        "project_patch": build_patch_prompt(
+            PROJECT["project_description"], PROJECT["features"], PROJECT["tech_stack"], ProjectPreferences(),
+            SKELETON, ["Wishlist"], ["Order tracking"]
+        ),
+        "classify_repo_features": _classify_prompt(),
+    }
+
+
+PROMPTS = _render_prompts()
+
+
+@pytest.fixture
+def estimated_tokens(monkeypatch):
+    """Count with the character estimate regardless of tiktoken availability."""
+    monkeypatch.setattr(prompt_engineering, "_get_encoding", lambda model: None)
+
+
+@pytest.mark.parametrize("template", sorted(TOKEN_BUDGETS))
+def test_prompt_within_token_budget(template, estimated_tokens):
+    tokens = count_tokens(PROMPTS[template])
+    assert tokens <= TOKEN_BUDGETS[template], f"{template} grew to {tokens} tokens"
+
+
+@pytest.mark.parametrize("template", sorted(TOKEN_BUDGETS))
+def test_prompt_has_no_wasted_whitespace_or_reprs(template):
+    prompt = PROMPTS[template]
+    assert prompt == compact_text(prompt)
+    # Template indentation leaks show up in the lead paragraph; indented-path
+    # examples further down are intentional.
+    assert "\n    " not in prompt.split("{", 1)[0].split("\n\n", 1)[0]
+    assert "['" not in prompt and "{'" not in prompt
+
+
+def test_team_selection_prompt_is_bounded_for_large_pools(estimated_tokens):
+    pool = {
+        domain: [
+            {"name": f"{domain}{i}", "skills": [skill, f"tool{i}"], "manager_score": 3.0 + (i % 20) / 10}
+            for i in range(2000)
+        ]
+        for domain, skill in (("frontend", "React"), ("backend", "Django"))
+    }
+    pool["backend"][1234]["skills"].append("Docker")
+    tech_stack = {"frontend": ["React"], "backend": ["Django", "Docker"]}
+    mapping = {"frontend": "frontend", "backend": "backend"}
+
+    kept = prefilter_candidates(pool, tech_stack, 4.0, mapping, top_k=15, token_budget=400)
+    prompt = create_team_selection_prompt(tech_stack, 3.0, 4.0, kept, mapping)
+
+    assert count_tokens(prompt) <= TOKEN_BUDGETS["team_selection"] + 400
+    assert kept["backend"][0]["name"] == "backend1234"
+    assert all(len(candidates) <= 15 for candidates in kept.values())
+
+
+def test_compact_helpers():
+    assert compact_text("\n        a  \n\n\n\n        b\n") == "a\n\nb"
+    assert compact_text("x\n  nested\ny") == "x\n  nested\ny"
+    assert compact_json({"name": "café", "items": [1, 2]}) == '{"name":"café","items":[1,2]}'
+    assert compact_list(["React", 3]) == "React, 3"
+
+
+def test_finalize_prompt_records_stats():
+    reset_prompt_token_stats()
+    finalize_prompt("sample", "    hello world    ")
+    finalize_prompt("sample", "hello world, again")
+    stats = get_prompt_token_stats()["sample"]
+    assert stats["calls"] == 2
+    assert stats["last_tokens"] == count_tokens("hello world, again")
+    assert stats["max_tokens"] >= stats["last_tokens"]
+
+
+def test_unknown_model_falls_back_to_estimate_when_encoding_cannot_load():
+    offline = mock.Mock(
+        encoding_for_model=mock.Mock(side_effect=KeyError("unknown-model")),
+        get_encoding=mock.Mock(side_effect=ConnectionError("no network")),
+    )
+    prompt_engineering._get_encoding.cache_clear()
+    try:
+        with mock.patch.object(prompt_engineering, "tiktoken", offline):
+            assert count_tokens("abcdefgh", model="unknown-model") == 2
+    finally:
+        prompt_engineering._get_encoding.cache_clear()
@@ -0,0 +1,53 @@
+"""Quotation pricing: totals, phase split and payment schedule add up."""
+
+import pytest
+
+from krivisio_tools.report_generation.app.core.constants import PAYMENT_SCHEDULE, PHASE_SPLIT, ROLE_RATE_CARD
+from krivisio_tools.report_generation.app.routes.onboarding.quotation import calculate_quotation
+from krivisio_tools.report_generation.templates.onboarding.quotation import build_quotation_document
+
+
+PROJECT = {
+    "project_description": "Clinic booking app",
+    "tech_stack": ["React", "FastAPI"],
+    "complexity_level": "Advanced",
+    "features": ["Appointments", "Reminders"],
+    "cocomo_results": {"estimation": {"person_months": 17.3, "development_time_months": 6.4}},
+    "contingency_percent": 12.5,
+}
+
+
+def test_totals_add_up():
+    quote = calculate_quotation(PROJECT)
+
+    assert sum(r["person_months"] for r in quote["roles"]) == pytest.approx(17.3, abs=0.01 * len(quote["roles"]))
+    assert quote["subtotal"] == pytest.approx(sum(r["cost"] for r in quote["roles"]), abs=0.01)
+    assert quote["contingency"] == pytest.approx(quote["subtotal"] * 0.125, abs=0.01)
+    assert quote["total"] == pytest.approx(quote["subtotal"] + quote["contingency"], abs=0.01)
+
+    cents = 0.01 * len(quote["phases"])
+    assert sum(p["cost"] for p in quote["phases"]) == pytest.approx(quote["total"], abs=cents)
+    assert sum(p["duration_months"] for p in quote["phases"]) == pytest.approx(6.4, abs=cents)
+    assert sum(p["amount"] for p in quote["payment_schedule"]) == pytest.approx(quote["total"], abs=0.03)
+
+
+def test_shares_and_percentages_sum_to_100():
+    assert sum(PHASE_SPLIT.values()) * 100 == pytest.approx(100)
+    assert sum(p["percent"] for p in PAYMENT_SCHEDULE) == pytest.approx(100)
+    assert sum(card["effort_share"] for card in ROLE_RATE_CARD.values()) * 100 == pytest.approx(100)
+
+
+def test_missing_schedule_uses_nominal_cocomo_time():
+    quote = calculate_quotation({**PROJECT, "cocomo_results": {"effort_schedule": {"person_months": 17.3}}})
+    assert quote["development_time_months"] > 0
+    assert quote["avg_team_size"] == pytest.approx(17.3 / quote["development_time_months"])
+
+
+def test_missing_effort_is_rejected():
+    with pytest.raises(ValueError, match="person_months"):
+        calculate_quotation({**PROJECT, "cocomo_results": {"estimation": {}}})
+
+
+def test_document_shows_the_total():
+    quote = calculate_quotation(PROJECT)
+    assert f"{quote['total']:,.2f}" in build_quotation_document(quote)
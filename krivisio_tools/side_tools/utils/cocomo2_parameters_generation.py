@@ -1,5 +1,6 @@
 import json
 from krivisio_tools.side_tools.utils.llm_client import chat_with_llm, strip_code_fences
+from krivisio_tools.report_generation.app.services.agent_integration.prompt_engineering import finalize_prompt
 
 def generate_cocomo2_parameters(level: str, features: list[str], tech_stacks: list[str]) -> dict:
     """
@@ -13,7 +14,7 @@ def generate_cocomo2_parameters(level: str, features: list[str], tech_stacks: li
     Returns:
         dict: Generated COCOMO-II parameters.
     """
-    
+
     features_text = "\n".join(f"- {f}" for f in features)
     tech_text = ", ".join(tech_stacks)
 
@@ -86,6 +87,7 @@ Respond ONLY with valid JSON in this format:
   }}
 }}
 """
+    prompt = finalize_prompt("cocomo2_parameters", prompt)
 
     raw = chat_with_llm(prompt)
     cleaned = strip_code_fences(raw)
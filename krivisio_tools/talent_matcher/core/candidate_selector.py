@@ -7,7 +7,19 @@ import json
 from typing import List, Dict, Set
 from krivisio_tools.talent_matcher.config import OPENAI_API_KEY, DEFAULT_MODEL, TEMPERATURE, MAX_TOKENS
 from krivisio_tools.talent_matcher.models.schema import CandidateOutput
+from krivisio_tools.talent_matcher.core.team_scorer import select_team, rank_candidates
+from krivisio_tools.report_generation.app.core.config import (
+    TALENT_SELECTION_MODE,
+    TALENT_EXPLAIN_TIES,
+    TALENT_PROMPT_TOP_K,
+    TALENT_PROMPT_CANDIDATE_TOKENS,
+)
 from krivisio_tools.talent_matcher.utils.llm_client import chat_with_llm
+from krivisio_tools.report_generation.app.services.agent_integration.prompt_engineering import (
+    compact_list,
+    count_tokens,
+    finalize_prompt,
+)
 
 
 def extract_available_candidates_by_domain(candidates: List[Dict], requested_domains: Set[str]) -> Dict[str, List[Dict]]:
@@ -19,6 +31,53 @@ def extract_available_candidates_by_domain(candidates: List[Dict], requested_dom
     return available
 
 
+def _candidate_line(c: Dict) -> str:
+    return f"- {c['name']}: Skills={compact_list(c['skills'])}, Manager Score={c['manager_score']}"
+
+
+def prefilter_candidates(
+    available_by_domain: Dict[str, List[Dict]],
+    tech_stack: Dict[str, List[str]],
+    manager_score_threshold: float,
+    domain_mapping: Dict[str, str],
+    top_k: int = TALENT_PROMPT_TOP_K,
+    token_budget: int = TALENT_PROMPT_CANDIDATE_TOKENS
+) -> Dict[str, List[Dict]]:
+    """
+    Keep the best candidates per domain within a prompt token budget.
+
+    Each domain is ranked by skill overlap and manager score (see
+    core.team_scorer) and cut to `top_k`; candidates are then admitted
+    round-robin across domains (best of every domain first) until their
+    prompt lines would exceed `token_budget`.
+    """
+    ranked = {
+        domain: rank_candidates(candidates, tech_stack, manager_score_threshold, domain_mapping, top_k)
+        for domain, candidates in available_by_domain.items()
+    }
+    kept = {domain: [] for domain in ranked}
+    used = sum(count_tokens(f"{domain.upper()} DOMAIN:") for domain in ranked)
+
+    for rank in range(top_k):
+        added = False
+        for domain, candidates in ranked.items():
+            if rank >= len(candidates):
+                continue
+            tokens = count_tokens(_candidate_line(candidates[rank]))
+            if used + tokens > token_budget:
+                continue
+            kept[domain].append(candidates[rank])
+            used += tokens
+            added = True
+        if not added:
+            break
+
+    total = sum(len(candidates) for candidates in available_by_domain.values())
+    shown = sum(len(candidates) for candidates in kept.values())
+    print(f"[Candidate Prefilter] {shown} of {total} candidates in prompt (~{used} tokens)")
+    return {domain: candidates for domain, candidates in kept.items() if candidates}
+
+
 def create_team_selection_prompt(
     tech_stack: Dict[str, List[str]],
     avg_team_size: float,
@@ -27,16 +86,16 @@ def create_team_selection_prompt(
     domain_mapping: Dict[str, str]
 ) -> str:
     """Constructs a system/user prompt for OpenAI to generate the team"""
-    candidates_context = ""
+    candidate_lines = []
     for domain, candidates in available_by_domain.items():
-        candidates_context += f"\n{domain.upper()} DOMAIN:\n"
-        for c in candidates:
-            candidates_context += f"  - {c['name']}: Skills={c['skills']}, Manager Score={c['manager_score']}\n"
+        candidate_lines.append(f"{domain.upper()} DOMAIN:")
+        candidate_lines.extend(_candidate_line(c) for c in candidates)
+    candidates_context = "\n".join(candidate_lines)
 
-    tech_requirements = ""
-    for tech_domain, techs in tech_stack.items():
-        mapped = domain_mapping.get(tech_domain, "UNMAPPED")
-        tech_requirements += f"  - {tech_domain} (maps to: {mapped}): {techs}\n"
+    tech_requirements = "\n".join(
+        f"- {tech_domain} (maps to: {domain_mapping.get(tech_domain, 'UNMAPPED')}): {compact_list(techs)}"
+        for tech_domain, techs in tech_stack.items()
+    )
 
     prompt = f"""
 You are a STRICT domain-first candidate selector.
@@ -54,21 +113,75 @@ RULES:
 - Max team size: {math.ceil(avg_team_size)}
 
 OUTPUT (raw JSON only):
-{{
-  "team_selection": [
-    {{
-            "name": "candidate_name",
-            "domain": "candidate_domain",
-            "skills": ["skill1", "skill2"],
-            "manager_score": 4.5,
-            "selection_reason": "Domain: [domain] | Manager Score: [score] >= {manager_score_threshold} | Tech Match: [matched_techs]",
-            "tech_stack_match": ["matched_tech1", "matched_tech2"],
-            "requested_for_domain": "original_tech_stack_domain"
-        }}
-  ]
-}}
+{{"team_selection": [{{
+  "name": "candidate_name",
+  "domain": "candidate_domain",
+  "skills": ["skill1", "skill2"],
+  "manager_score": 4.5,
+  "selection_reason": "Domain: [domain] | Manager Score: [score] >= {manager_score_threshold} | Tech Match: [matched_techs]",
+  "tech_stack_match": ["matched_tech1", "matched_tech2"],
+  "requested_for_domain": "original_tech_stack_domain"
+}}]}}
+"""
+    return finalize_prompt("team_selection", prompt)
+
+
+def create_tie_break_prompt(
+    tech_stack: Dict[str, List[str]],
+    team: List[Dict],
+    ties: List[Dict],
+    candidates_by_name: Dict[str, Dict]
+) -> str:
+    """Constructs a prompt asking the LLM to justify picks that tied on score"""
+    requirements = "\n".join(f"- {domain}: {compact_list(techs)}" for domain, techs in tech_stack.items())
+    team_lines = "\n".join(f"- {m['name']} ({m['domain']}): {m['selection_reason']}" for m in team)
+    tie_lines = []
+    for tie in ties:
+        tie_lines.append(f"{tie['selected']} was chosen over:")
+        for name in tie["tied_with"]:
+            c = candidates_by_name[name]
+            tie_lines.append(f"- {name} ({c['domain']}): Skills={compact_list(c['skills'])}, Manager Score={c['manager_score']}")
+    tie_context = "\n".join(tie_lines)
+
+    prompt = f"""
+The team below was selected by score. Some picks tied with other candidates.
+
+PROJECT REQUIREMENTS:
+{requirements}
+
+SELECTED TEAM:
+{team_lines}
+
+TIES:
+{tie_context}
+
+For each tied pick, give one short sentence on why it is a sound choice for this project.
+
+OUTPUT (raw JSON only):
+{{"candidate_name": "reason"}}
 """
-    return prompt
+    return finalize_prompt("team_tie_break", prompt)
+
+
+def explain_tie_breaks(
+    tech_stack: Dict[str, List[str]],
+    team: List[Dict],
+    ties: List[Dict],
+    candidates: List[Dict]
+) -> Dict[str, str]:
+    """Ask the LLM for tie-break explanations; empty if the call fails"""
+    candidates_by_name = {c["name"]: c for c in candidates}
+    prompt = create_tie_break_prompt(tech_stack, team, ties, candidates_by_name)
+    try:
+        raw = chat_with_llm(prompt, temperature=TEMPERATURE, max_tokens=300)
+        cleaned = re.sub(r"```(?:json)?", "", raw).strip("`\n ")
+        parsed = json.loads(cleaned)
+        if not isinstance(parsed, dict):
+            return {}
+        return {name: str(reason) for name, reason in parsed.items()}
+    except Exception as e:
+        print(f"[Tie-break explanation skipped]: {e}")
+        return {}
 
 
 def generate_team_selection(
@@ -77,11 +190,48 @@ def generate_team_selection(
     avg_team_size: float,
     manager_score_threshold: float,
     domain_mapping: Dict[str, str],
-    requested_domains: Set[str]
+    requested_domains: Set[str],
+    selection_mode: str = TALENT_SELECTION_MODE,
+    explain_ties: bool = TALENT_EXPLAIN_TIES
 ) -> List[CandidateOutput]:
-    """Main function to generate a team selection"""
+    """
+    Main function to generate a team selection.
+
+    `selection_mode` "scored" ranks the pool locally (see core.team_scorer)
+    and only calls the LLM to explain tie-breaks when `explain_ties` is set;
+    "llm" delegates the whole selection to the model.
+    """
+    if selection_mode not in ("scored", "llm"):
+        raise ValueError(f"Unknown selection mode: '{selection_mode}'. Choose 'scored' or 'llm'.")
+
+    if selection_mode == "scored":
+        team, ties = select_team(
+            candidates, tech_stack, avg_team_size, manager_score_threshold, domain_mapping, requested_domains
+        )
+        print(f"[Team Scorer] Selected {len(team)} of {len(candidates)} candidates ({len(ties)} ties)")
+        if ties and explain_ties:
+            explanations = explain_tie_breaks(tech_stack, team, ties, candidates)
+            for member in team:
+                if member["name"] in explanations:
+                    member["selection_reason"] += f" | Tie-break: {explanations[member['name']]}"
+        return [
+            CandidateOutput(
+                name=m["name"],
+                domain=m["domain"],
+                skills=m["skills"],
+                manager_score=m["manager_score"],
+                selection_reason=m["selection_reason"],
+                tech_stack_match=m["tech_stack_match"]
+            )
+            for m in team
+        ]
+
     max_team_size = math.ceil(avg_team_size)
     available_by_domain = extract_available_candidates_by_domain(candidates, requested_domains)
+    # Bound the prompt (and the call's latency) regardless of pool size
+    available_by_domain = prefilter_candidates(
+        available_by_domain, tech_stack, manager_score_threshold, domain_mapping
+    )
     prompt = create_team_selection_prompt(tech_stack, avg_team_size, manager_score_threshold, available_by_domain, domain_mapping)
 
     try:
@@ -97,27 +247,27 @@ def generate_team_selection(
 
     final_team = []
     used = set()
+    # Index eligible candidates once instead of rescanning the pool per selection
+    eligible = {
+        (c["name"], c["domain"]): c
+        for c in candidates
+        if c["availability"] and c["domain"] in requested_domains
+    }
 
     # Validate and limit selection
     for selection in team:
         name = selection.get("name")
-        domain = selection.get("domain")
-        for c in candidates:
-            if (
-                c["name"] == name and
-                c["domain"] == domain and
-                c["availability"] and
-                name not in used and
-                domain in requested_domains
-            ):
-                final_team.append(CandidateOutput(
-                    name=c["name"],
-                    domain=c["domain"],
-                    skills=c["skills"],
-                    manager_score=c["manager_score"]
-                ))
-                used.add(name)
-                break
+        c = eligible.get((name, selection.get("domain")))
+        if c is not None and name not in used:
+            final_team.append(CandidateOutput(
+                name=c["name"],
+                domain=c["domain"],
+                skills=c["skills"],
+                manager_score=c["manager_score"],
+                selection_reason=str(selection.get("selection_reason") or "") or None,
+                tech_stack_match=[str(t) for t in selection.get("tech_stack_match") or []] or None
+            ))
+            used.add(name)
 
         if len(final_team) >= max_team_size:
             break
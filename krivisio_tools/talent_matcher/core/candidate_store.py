@@ -0,0 +1,249 @@
+# core/candidate_store.py
+"""
+Persistent candidate pools.
+
+Pools live in one SQLite file, keyed by (pool_id, name). Candidates are
+indexed by availability, domain and manager score, and an inverted skill
+table maps normalized skills to candidates, so a query only touches the
+rows it returns instead of rescanning the pool. Candidates are upserted
+incrementally: re-sending a changed candidate rewrites just that row.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+
+from krivisio_tools.report_generation.app.core.config import TALENT_STORE_PATH
+from krivisio_tools.talent_matcher.core.team_scorer import normalize_skill
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS candidates (
+    pool_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    domain TEXT NOT NULL,
+    manager_score REAL NOT NULL,
+    availability INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (pool_id, name)
+);
+CREATE INDEX IF NOT EXISTS idx_candidates_domain
+    ON candidates (pool_id, availability, domain, manager_score DESC);
+CREATE TABLE IF NOT EXISTS candidate_skills (
+    pool_id TEXT NOT NULL,
+    skill TEXT NOT NULL,
+    name TEXT NOT NULL,
+    PRIMARY KEY (pool_id, skill, name)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_candidate_skills_name ON candidate_skills (pool_id, name);
+"""
+
+_REQUIRED_FIELDS = ("name", "domain", "skills", "manager_score", "availability")
+# Refresh planner statistics after bulk changes so selective skill filters drive the query
+_ANALYZE_AFTER = 1000
+
+
+class CandidateStore:
+    """
+    SQLite-backed candidate pools.
+
+    Args:
+        path (str): Database file.
+    """
+
+    def __init__(self, path: str = TALENT_STORE_PATH):
+        self.path = path
+        self._local = threading.local()
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._connect().executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        """One connection per thread; WAL lets readers run alongside a writer."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def upsert(self, pool_id: str, candidates: Iterable[Dict]) -> Dict[str, int]:
+        """
+        Insert or update candidates in a pool (matched by name).
+
+        Args:
+            pool_id (str): Pool identifier.
+            candidates (iterable): Candidate dicts with name, domain, skills,
+                manager_score and availability; extra keys are kept.
+
+        Returns:
+            dict: Counts of inserted, updated and unchanged candidates.
+
+        Raises:
+            ValueError: If a candidate misses a required field.
+        """
+        counts = {"inserted": 0, "updated": 0, "unchanged": 0}
+        now = time.time()
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for c in candidates:
+                missing = [f for f in _REQUIRED_FIELDS if f not in c]
+                if missing:
+                    raise ValueError(f"Candidate {c.get('name', '?')!r} is missing: {', '.join(missing)}")
+                data = json.dumps(c, sort_keys=True, separators=(",", ":"))
+                row = conn.execute(
+                    "SELECT data FROM candidates WHERE pool_id = ? AND name = ?", (pool_id, c["name"])
+                ).fetchone()
+                if row is not None and row[0] == data:
+                    counts["unchanged"] += 1
+                    continue
+
+                conn.execute(
+                    "INSERT INTO candidates (pool_id, name, domain, manager_score, availability, data, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT (pool_id, name) DO UPDATE SET domain = excluded.domain, "
+                    "manager_score = excluded.manager_score, availability = excluded.availability, "
+                    "data = excluded.data, updated_at = excluded.updated_at",
+                    (pool_id, c["name"], c["domain"], float(c["manager_score"]), int(bool(c["availability"])), data, now)
+                )
+                if row is not None:
+                    conn.execute("DELETE FROM candidate_skills WHERE pool_id = ? AND name = ?", (pool_id, c["name"]))
+                conn.executemany(
+                    "INSERT OR IGNORE INTO candidate_skills (pool_id, skill, name) VALUES (?, ?, ?)",
+                    [(pool_id, normalize_skill(skill), c["name"]) for skill in c["skills"]]
+                )
+                counts["updated" if row is not None else "inserted"] += 1
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        if counts["inserted"] + counts["updated"] >= _ANALYZE_AFTER:
+            conn.execute("ANALYZE")
+        return counts
+
+    def remove(self, pool_id: str, names: Iterable[str]) -> int:
+        """Delete candidates by name; returns how many were removed."""
+        names = list(names)
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            removed = 0
+            for name in names:
+                removed += conn.execute(
+                    "DELETE FROM candidates WHERE pool_id = ? AND name = ?", (pool_id, name)
+                ).rowcount
+                conn.execute("DELETE FROM candidate_skills WHERE pool_id = ? AND name = ?", (pool_id, name))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return removed
+
+    def query(
+        self,
+        pool_id: str,
+        domains: Optional[Iterable[str]] = None,
+        skills: Optional[Iterable[str]] = None,
+        available_only: bool = True,
+        min_manager_score: Optional[float] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Candidates matching every given filter, best manager score first.
+
+        Args:
+            pool_id (str): Pool identifier.
+            domains (iterable, optional): Keep candidates in any of these domains.
+            skills (iterable, optional): Keep candidates with any of these skills.
+            available_only (bool): Skip unavailable candidates.
+            min_manager_score (float, optional): Minimum manager score.
+            limit (int, optional): Maximum number of candidates.
+
+        Returns:
+            list: Candidate dicts as upserted.
+        """
+        clauses, params = ["c.pool_id = ?"], [pool_id]
+        if available_only:
+            clauses.append("c.availability = 1")
+        if domains is not None:
+            domains = sorted(set(domains))
+            if not domains:
+                return []
+            clauses.append(f"c.domain IN ({', '.join('?' * len(domains))})")
+            params.extend(domains)
+        if min_manager_score is not None:
+            clauses.append("c.manager_score >= ?")
+            params.append(float(min_manager_score))
+        if skills is not None:
+            keys = sorted({normalize_skill(s) for s in skills})
+            if not keys:
+                return []
+            # The skill index drives the lookup when skills are the most selective filter
+            clauses.append(
+                "c.name IN (SELECT s.name FROM candidate_skills s WHERE s.pool_id = ? "
+                f"AND s.skill IN ({', '.join('?' * len(keys))}))"
+            )
+            params.extend([pool_id] + keys)
+
+        sql = f"SELECT c.data FROM candidates c WHERE {' AND '.join(clauses)} ORDER BY c.manager_score DESC, c.name"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        return [json.loads(row[0]) for row in self._connect().execute(sql, params)]
+
+    def pool_stats(self, pool_id: str) -> Dict[str, int]:
+        """Total and available candidate counts for a pool."""
+        total, available = self._connect().execute(
+            "SELECT COUNT(*), COALESCE(SUM(availability), 0) FROM candidates WHERE pool_id = ?", (pool_id,)
+        ).fetchone()
+        return {"total": total, "available": available}
+
+
+_store: Optional[CandidateStore] = None
+_store_lock = threading.Lock()
+
+
+def get_candidate_store() -> CandidateStore:
+    """Return the process-wide candidate store, creating it on first use."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = CandidateStore(TALENT_STORE_PATH)
+        return _store
+
+
+if __name__ == "__main__":
+    import random
+    import tempfile
+
+    random.seed(7)
+    domains = ["frontend", "backend", "devops", "ai/ml", "qa", "ux/ui", "data engineering", "ci/cd"]
+    skills = [f"skill{i}" for i in range(2000)] + ["React", "Django", "Docker"]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = CandidateStore(os.path.join(tmp, "candidates.sqlite3"))
+        for size in (1_000, 10_000, 100_000):
+            pool = [
+                {
+                    "name": f"candidate{i}",
+                    "domain": random.choice(domains),
+                    "skills": random.sample(skills, 8),
+                    "manager_score": round(random.uniform(2.0, 5.0), 1),
+                    "availability": random.random() < 0.5,
+                }
+                for i in range(size)
+            ]
+            start = time.perf_counter()
+            store.upsert(f"pool{size}", pool)
+            load = time.perf_counter() - start
+
+            start = time.perf_counter()
+            found = store.query(f"pool{size}", domains={"frontend"}, skills=["React"], min_manager_score=4.0)
+            elapsed = time.perf_counter() - start
+            print(f"{size:>7} candidates: upsert {load:.1f} s, filtered query {elapsed * 1000:.1f} ms ({len(found)} matches)")
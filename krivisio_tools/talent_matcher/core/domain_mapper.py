@@ -2,12 +2,20 @@
 
 from typing import Dict, Set, Tuple
 from krivisio_tools.talent_matcher.core.constants import DOMAIN_MAPPING, ALLOWED_DOMAINS
+from krivisio_tools.talent_matcher.core.tech_catalog import as_tech_list, resolve_domains
 
 
 def map_tech_stack_to_candidate_domains(tech_stack: Dict[str, list]) -> Tuple[Dict[str, str], Set[str]]:
     """
     Map incoming tech stack domains to internal candidate domains.
-    
+
+    Keys are looked up in DOMAIN_MAPPING first, then resolved through the
+    technology catalog (so "React" or "Kubernetes" keys work too). A key
+    that still matches nothing takes the most common domain of its
+    technologies. Keys and technologies are resolved in one catalog pass.
+    Values may be lists or comma/semicolon-separated strings; other values
+    count as no technologies.
+
     Returns:
         valid_domain_mapping: Mapping of tech domain → internal candidate domain
         requested_domains: Set of valid, deduplicated candidate domains requested
@@ -15,9 +23,20 @@ def map_tech_stack_to_candidate_domains(tech_stack: Dict[str, list]) -> Tuple[Di
     valid_domain_mapping = {}
     requested_candidate_domains = set()
 
-    for tech_domain in tech_stack.keys():
+    keys = list(tech_stack.keys())
+    # "React, Redux" is two technologies, not a string to iterate character by character
+    technologies = [as_tech_list(tech_stack[k]) for k in keys]
+    resolved = resolve_domains(keys + [t for techs in technologies for t in techs])
+    resolved_keys, resolved_techs = resolved[:len(keys)], iter(resolved[len(keys):])
+
+    for tech_domain, techs, key_domain in zip(keys, technologies, resolved_keys):
+        tech_domains = [next(resolved_techs) for _ in techs]
         normalized = tech_domain.lower().replace(" ", "_").replace("-", "_")
-        mapped_domain = DOMAIN_MAPPING.get(normalized)
+        mapped_domain = DOMAIN_MAPPING.get(normalized) or key_domain
+        if not mapped_domain:
+            found = [d for d in tech_domains if d]
+            # Most common, first seen on ties
+            mapped_domain = max(found, key=found.count) if found else None
 
         if mapped_domain and mapped_domain in ALLOWED_DOMAINS:
             valid_domain_mapping[tech_domain] = mapped_domain
@@ -1,28 +1,200 @@
+import hashlib
 import json
-from typing import Dict
+import re
+from typing import Any, Dict, List, Optional
 
 from krivisio_tools.talent_matcher.config import (
     DEFAULT_MODEL,
     TEMPERATURE,
-    MAX_TOKENS
+    MAX_TOKENS,
+    MANAGER_SCORE_THRESHOLD
 )
 
 from krivisio_tools.talent_matcher.utils.llm_client import chat_with_llm
+from krivisio_tools.talent_matcher.core.tech_catalog import as_tech_list, group_technologies
+from krivisio_tools.project_structure_generator.services.cache_service import get_cache_backend
+from krivisio_tools.report_generation.app.services.agent_integration.prompt_engineering import (
+    compact_json,
+    finalize_prompt,
+)
+
+
+# Spec keys (normalized: lowercase, no separators) read by the local extractor
+_TECH_STACK_KEYS = {"techstack", "technologystack", "technologies", "techstacks"}
+_TEAM_SIZE_KEYS = {"avgteamsize", "averageteamsize", "teamsize"}
+_THRESHOLD_KEYS = {"managerscorethreshold", "minmanagerscore"}
+_DOMAIN_KEYS = ("domain", "category", "area", "layer")
+_TECH_LIST_KEYS = ("technologies", "tools", "items", "stack")
+_MAX_SPEC_DEPTH = 6
+_NUMBER_RE = re.compile(r"\d+(?:\.\d+)?")
+_RANGE_RE = re.compile(r"^\D*?(\d+(?:\.\d+)?)\s*(?:-|–|to)\s*(\d+(?:\.\d+)?)\D*$")
+# One "role: count" or "count role" item of a breakdown such as "5 developers, 2 QA"
+_ROLE_COUNT_RE = re.compile(r"^(?:(\d+)\s*[A-Za-z][\w\s/.&-]*|[A-Za-z][\w\s/.&-]*?:?\s*(\d+))$")
+_MIN_KEYS = {"min", "minimum"}
+_MAX_KEYS = {"max", "maximum"}
+
+
+def _normalize_key(key: Any) -> str:
+    return re.sub(r"[\s_\-]+", "", str(key).lower())
+
+
+def _find_field(spec: Dict, keys: set) -> Any:
+    """First value under any of `keys`, searching nested sections breadth-first."""
+    queue = [(spec, 0)]
+    while queue:
+        node, depth = queue.pop(0)
+        children = node.items() if isinstance(node, dict) else enumerate(node)
+        for key, value in children:
+            if isinstance(node, dict) and _normalize_key(key) in keys:
+                return value
+            if isinstance(value, (dict, list)) and depth < _MAX_SPEC_DEPTH:
+                queue.append((value, depth + 1))
+    return None
+
+
+def _parse_tech_stack(value: Any) -> Optional[Dict[str, List[str]]]:
+    """
+    Tech stack grouped by domain, from {"domain": [...]}, [{"domain": ..., "technologies": [...]}]
+    or a flat technology list (grouped through the technology catalog).
+    """
+    tech_stack = {}
+    if isinstance(value, str) or (isinstance(value, list) and not any(isinstance(v, dict) for v in value)):
+        return group_technologies(as_tech_list(value)) or None
+    if isinstance(value, dict):
+        for domain, techs in value.items():
+            techs = as_tech_list(techs)
+            if techs:
+                tech_stack[str(domain)] = techs
+    elif isinstance(value, list):
+        for entry in value:
+            if not isinstance(entry, dict):
+                continue
+            domain = next((entry[k] for k in _DOMAIN_KEYS if k in entry), None)
+            techs = next((as_tech_list(entry[k]) for k in _TECH_LIST_KEYS if k in entry), [])
+            if domain and techs:
+                tech_stack.setdefault(str(domain), []).extend(techs)
+    return tech_stack or None
+
+
+def _positive_number(value: Any) -> Optional[float]:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return float(value) if value > 0 else None
+
+
+def _parse_team_size(value: Any) -> Optional[float]:
+    """
+    Team size from a number, a range ("4-6", {"min": 4, "max": 6}; averaged)
+    or a role breakdown ({"frontend": 2, "backend": 3}, "5 developers, 2 QA";
+    summed). Anything else returns None so the spec goes to the LLM.
+    """
+    if isinstance(value, dict):
+        keys = {_normalize_key(k): v for k, v in value.items()}
+        bounds = [
+            _positive_number(v) for k, v in keys.items() if k in _MIN_KEYS or k in _MAX_KEYS
+        ]
+        if bounds:
+            return round(sum(bounds) / len(bounds), 2) if all(bounds) else None
+        counts = [_positive_number(v) for v in value.values()]
+        return sum(counts) if counts and all(counts) else None
+    if isinstance(value, str):
+        text = value.strip()
+        match = _RANGE_RE.match(text)
+        if match:
+            low, high = float(match.group(1)), float(match.group(2))
+            return round((low + high) / 2, 2) if 0 < low <= high else None
+        numbers = _NUMBER_RE.findall(text)
+        if len(numbers) == 1:
+            return _positive_number(float(numbers[0]))
+        items = [item.strip() for item in re.split(r"[,;+]|\band\b", text) if item.strip()]
+        counts = []
+        for item in items:
+            role = _ROLE_COUNT_RE.match(item)
+            if not role or len(_NUMBER_RE.findall(item)) != 1:
+                return None
+            counts.append(float(role.group(1) or role.group(2)))
+        return sum(counts) if counts and all(counts) else None
+    return _positive_number(value)
+
 
+def extract_requirements_locally(spec_data: dict) -> Optional[Dict]:
+    """
+    Read requirements straight from a structured specsheet, without the LLM.
+
+    Works when the spec carries a tech stack (grouped by domain, or a flat
+    list of known technologies) and a team size, at any nesting level
+    (e.g. under "technical_architecture").
+
+    Args:
+        spec_data (dict): The input spec document.
+
+    Returns:
+        Dict or None: Requirements in the LLM extractor's format, or None
+        for free-form specs.
+    """
+    if not isinstance(spec_data, dict):
+        return None
+    tech_stack = _parse_tech_stack(_find_field(spec_data, _TECH_STACK_KEYS))
+    avg_team_size = _parse_team_size(_find_field(spec_data, _TEAM_SIZE_KEYS))
+    if not tech_stack or avg_team_size is None:
+        return None
+
+    threshold = _find_field(spec_data, _THRESHOLD_KEYS)
+    if not isinstance(threshold, (int, float)) or isinstance(threshold, bool):
+        threshold = MANAGER_SCORE_THRESHOLD
+
+    return {
+        "tech_stack": tech_stack,
+        "avg_team_size": avg_team_size,
+        "manager_score_threshold": float(threshold)
+    }
 
-def extract_requirements_from_spec(spec_data: dict) -> Dict:
+
+def _is_valid_requirements(requirements: Any) -> bool:
+    return (
+        isinstance(requirements, dict)
+        and isinstance(requirements.get("tech_stack"), dict)
+        and all(isinstance(v, list) for v in requirements["tech_stack"].values())
+        and isinstance(requirements.get("avg_team_size", 0), (int, float))
+    )
+
+
+def _spec_cache_key(spec_data: dict) -> str:
+    """Hash of the canonical spec and extraction model."""
+    raw = json.dumps({"spec": spec_data, "model": DEFAULT_MODEL}, sort_keys=True, separators=(",", ":"), default=str)
+    return "requirements:" + hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def extract_requirements_from_spec(spec_data: dict, use_cache: bool = True) -> Dict:
     """
-    Uses the OpenAI API (via llm_client) to extract tech stack and team requirements.
-    
+    Extract tech stack and team requirements from a spec.
+
+    Structured specs are read locally (see extract_requirements_locally).
+    Free-form specs go to the LLM once; the result is cached by spec hash
+    in the shared cache backend, so repeated matching skips the model.
+
     Args:
         spec_data (dict): The input spec document as a dictionary.
+        use_cache (bool): Read and write the spec-hash cache.
 
     Returns:
         Dict: Extracted tech stack, avg team size, and manager score threshold.
     """
+    requirements = extract_requirements_locally(spec_data)
+    if requirements is not None:
+        print("[Requirements] Read from structured spec (no LLM call)")
+        return requirements
+
+    key = _spec_cache_key(spec_data)
+    if use_cache:
+        cached = get_cache_backend().get(key)
+        if cached is not None:
+            print("[Requirements] Cache hit for spec")
+            return cached
+
     prompt = f"""
 PROJECT SPECIFICATION DOCUMENT (JSON):
-{json.dumps(spec_data, indent=2)}
+{compact_json(spec_data)}
 
 INSTRUCTIONS:
 1. Analyze the technical architecture and technology stack sections
@@ -31,17 +203,9 @@ INSTRUCTIONS:
 4. Return JSON with tech stack and team requirements
 
 OUTPUT FORMAT (raw JSON only, no markdown):
-{{
-    "tech_stack": {{
-        "frontend": ["React", "TypeScript"],
-        "backend": ["Node.js", "Express"],
-        "database": ["PostgreSQL"],
-        "devops": ["Docker", "Kubernetes"]
-    }},
-    "avg_team_size": 4.5,
-    "manager_score_threshold": 4.0
-}}
+{{"tech_stack": {{"frontend": ["React", "TypeScript"], "backend": ["Node.js", "Express"], "database": ["PostgreSQL"], "devops": ["Docker", "Kubernetes"]}}, "avg_team_size": 4.5, "manager_score_threshold": 4.0}}
 """
+    prompt = finalize_prompt("requirements_extraction", prompt)
 
     try:
         response = chat_with_llm(
@@ -51,7 +215,12 @@ OUTPUT FORMAT (raw JSON only, no markdown):
             max_tokens=MAX_TOKENS
         )
 
-        return json.loads(response)
+        requirements = json.loads(response)
+        if not _is_valid_requirements(requirements):
+            raise ValueError("unexpected requirements format")
+        if use_cache:
+            get_cache_backend().set(key, requirements)
+        return requirements
 
     except Exception as e:
         print(f"[LLM ERROR] Failed to extract requirements: {e}")
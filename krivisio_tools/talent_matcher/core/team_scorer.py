@@ -0,0 +1,269 @@
+# core/team_scorer.py
+"""
+Deterministic team scoring and selection.
+
+Candidates are packed into a sparse candidate x skill matrix stored as CSR
+arrays (`indptr`, `skill_ids`), so scoring the whole pool against a tech
+stack is a handful of NumPy operations instead of a loop per candidate.
+
+The team is picked greedily by marginal gain: an uncovered requested domain
+is worth most, then requested skills nobody on the team has yet, then
+skills requested for the candidate's own domain, meeting the manager-score
+threshold and the candidate's overall skill match.
+Greedy selection is the standard approximation for this kind of coverage
+problem and is exact for the small teams the tool builds.
+"""
+
+import math
+import re
+from typing import Dict, List, Set, Tuple
+
+import numpy as np
+
+
+# Marginal-gain weights, largest first: domains > new skills > own-domain skills > threshold > overlap
+DOMAIN_WEIGHT = 100.0
+NEW_SKILL_WEIGHT = 10.0
+DOMAIN_SKILL_WEIGHT = 6.0
+THRESHOLD_WEIGHT = 5.0
+MATCH_WEIGHT = 1.0
+MANAGER_WEIGHT = 0.1
+
+_TIE_EPSILON = 1e-9
+_SKILL_NORMALIZE_RE = re.compile(r"[\s._\-]+")
+
+
+def normalize_skill(skill: str) -> str:
+    """Case- and punctuation-insensitive skill key ("Node.js" -> "nodejs")."""
+    return _SKILL_NORMALIZE_RE.sub("", str(skill).lower())
+
+
+class CandidateMatrix:
+    """
+    Column-oriented view of a candidate pool.
+
+    Attributes:
+        candidates (list): The original candidate dicts, row order.
+        skills (list): Skill vocabulary (normalized), column order.
+        indptr (np.ndarray): Row i's skills are skill_ids[indptr[i]:indptr[i + 1]].
+        skill_ids (np.ndarray): Column index of every (candidate, skill) pair.
+        rows (np.ndarray): Row index of every (candidate, skill) pair.
+        manager_scores (np.ndarray): Manager score per candidate.
+        available (np.ndarray): Availability flag per candidate.
+        domains (list): Domain per candidate.
+    """
+
+    def __init__(self, candidates: List[Dict]):
+        self.candidates = candidates
+        self.skills: List[str] = []
+        skill_index: Dict[str, int] = {}
+        indptr = [0]
+        skill_ids: List[int] = []
+
+        for c in candidates:
+            row = set()
+            for skill in c.get("skills", []):
+                key = normalize_skill(skill)
+                if key not in skill_index:
+                    skill_index[key] = len(self.skills)
+                    self.skills.append(key)
+                row.add(skill_index[key])
+            skill_ids.extend(sorted(row))
+            indptr.append(len(skill_ids))
+
+        self.skill_index = skill_index
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.skill_ids = np.asarray(skill_ids, dtype=np.int64)
+        self.rows = np.repeat(np.arange(len(candidates), dtype=np.int64), np.diff(self.indptr))
+        self.manager_scores = np.asarray([float(c.get("manager_score", 0.0)) for c in candidates], dtype=np.float64)
+        self.available = np.asarray([bool(c.get("availability")) for c in candidates], dtype=bool)
+        self.domains = [c.get("domain") for c in candidates]
+
+    def __len__(self) -> int:
+        return len(self.candidates)
+
+    def skill_mask(self, skills: List[str]) -> np.ndarray:
+        """Boolean column mask for `skills` (unknown skills are ignored)."""
+        mask = np.zeros(len(self.skills), dtype=bool)
+        for skill in skills:
+            column = self.skill_index.get(normalize_skill(skill))
+            if column is not None:
+                mask[column] = True
+        return mask
+
+    def row_counts(self, column_mask: np.ndarray) -> np.ndarray:
+        """Per-candidate number of skills inside `column_mask` (a sparse mat-vec)."""
+        return np.bincount(self.rows, weights=column_mask[self.skill_ids], minlength=len(self)).astype(np.int64)
+
+    def row_skills(self, i: int) -> List[str]:
+        return [self.skills[j] for j in self.skill_ids[self.indptr[i]:self.indptr[i + 1]]]
+
+
+def _static_gain(
+    matrix: CandidateMatrix,
+    tech_stack: Dict[str, List[str]],
+    manager_score_threshold: float,
+    domain_mapping: Dict[str, str],
+    requested_domains: Set[str]
+) -> Tuple:
+    """Score parts that do not depend on the team picked so far, for the whole pool at once."""
+    requested = [tech for techs in tech_stack.values() for tech in techs]
+    requested_mask = matrix.skill_mask(requested)
+    # Requested technologies keyed by normalized name, for readable matches
+    display = {normalize_skill(tech): tech for tech in requested}
+
+    domain_names = sorted(requested_domains)
+    domain_ids = np.asarray(
+        [domain_names.index(d) if d in requested_domains else -1 for d in matrix.domains],
+        dtype=np.int64
+    )
+
+    match_counts = matrix.row_counts(requested_mask)
+    match_fraction = match_counts / max(int(requested_mask.sum()), 1)
+    meets_threshold = matrix.manager_scores >= manager_score_threshold
+
+    # Skills requested for each candidate's own domain (one sparse mat-vec per domain)
+    domain_match = np.zeros(len(matrix), dtype=np.int64)
+    for domain_id, domain in enumerate(domain_names):
+        techs = [t for tech_domain, ts in tech_stack.items() if domain_mapping.get(tech_domain) == domain for t in ts]
+        rows = domain_ids == domain_id
+        domain_match[rows] = matrix.row_counts(matrix.skill_mask(techs))[rows]
+
+    static_gain = (
+        DOMAIN_SKILL_WEIGHT * domain_match
+        + THRESHOLD_WEIGHT * meets_threshold
+        + MATCH_WEIGHT * match_fraction
+        + MANAGER_WEIGHT * matrix.manager_scores
+    )
+    return requested_mask, display, domain_ids, domain_names, meets_threshold, static_gain
+
+
+def rank_candidates(
+    candidates: List[Dict],
+    tech_stack: Dict[str, List[str]],
+    manager_score_threshold: float,
+    domain_mapping: Dict[str, str],
+    top_k: int
+) -> List[Dict]:
+    """
+    The `top_k` best candidates by skill overlap and manager score, best first.
+
+    Uses the team-independent part of the selection score, so candidates
+    are ranked in one vectorized pass and only the top K are sorted.
+    """
+    if top_k <= 0 or not candidates:
+        return []
+    matrix = CandidateMatrix(candidates)
+    domains = {c.get("domain") for c in candidates}
+    scores = _static_gain(matrix, tech_stack, manager_score_threshold, domain_mapping, domains)[-1]
+    if top_k < len(candidates):
+        top = np.argpartition(-scores, top_k - 1)[:top_k]
+    else:
+        top = np.arange(len(candidates))
+    # Stable on ties: pool order decides, as in select_team
+    top = top[np.lexsort((top, -scores[top]))]
+    return [candidates[i] for i in top]
+
+
+def select_team(
+    candidates: List[Dict],
+    tech_stack: Dict[str, List[str]],
+    avg_team_size: float,
+    manager_score_threshold: float,
+    domain_mapping: Dict[str, str],
+    requested_domains: Set[str]
+) -> Tuple[List[Dict], List[Dict]]:
+    """
+    Pick a team without an LLM call.
+
+    Only available candidates from requested domains are eligible, as in
+    the LLM selector; the team size is ceil(avg_team_size).
+
+    Args:
+        candidates (list): Candidate dicts (name, domain, skills, manager_score, availability).
+        tech_stack (dict): Tech domain -> technologies.
+        avg_team_size (float): Average team size.
+        manager_score_threshold (float): Preferred minimum manager score.
+        domain_mapping (dict): Tech domain -> candidate domain.
+        requested_domains (set): Candidate domains to staff.
+
+    Returns:
+        tuple: (team, ties). Each team entry holds the candidate plus
+        `score`, `tech_stack_match` and `selection_reason`; `ties` lists
+        picks whose gain equalled a runner-up's, with the runners-up.
+    """
+    max_team_size = math.ceil(avg_team_size)
+    matrix = CandidateMatrix(candidates)
+    if not len(matrix) or max_team_size <= 0:
+        return [], []
+
+    requested_mask, display, domain_ids, domain_names, meets_threshold, static_gain = _static_gain(
+        matrix, tech_stack, manager_score_threshold, domain_mapping, requested_domains
+    )
+    eligible = matrix.available & (domain_ids >= 0)
+
+    covered_skills = np.zeros(len(matrix.skills), dtype=bool)
+    covered_domains = np.zeros(len(domain_names), dtype=bool)
+    team, ties = [], []
+
+    while len(team) < max_team_size and eligible.any():
+        new_skills = matrix.row_counts(requested_mask & ~covered_skills)
+        new_domain = ~covered_domains[np.maximum(domain_ids, 0)]
+        gain = static_gain + NEW_SKILL_WEIGHT * new_skills + DOMAIN_WEIGHT * new_domain
+        gain = np.where(eligible, gain, -np.inf)
+
+        best = int(np.argmax(gain))  # first index wins ties: pool order is the tie-break
+        runners_up = np.flatnonzero(np.abs(gain - gain[best]) <= _TIE_EPSILON)
+        runners_up = [int(i) for i in runners_up if i != best]
+
+        candidate = candidates[best]
+        matched = [display[s] for s in matrix.row_skills(best) if s in display]
+        reason = (
+            f"Domain: {candidate['domain']}"
+            f" | Manager Score: {candidate['manager_score']}"
+            f" {'>=' if meets_threshold[best] else '<'} {manager_score_threshold}"
+            f" | Tech Match: {', '.join(matched) or 'none'}"
+        )
+        team.append({
+            **candidate,
+            "score": round(float(gain[best]), 4),
+            "tech_stack_match": matched,
+            "selection_reason": reason
+        })
+        if runners_up:
+            ties.append({"selected": candidate["name"], "tied_with": [candidates[i]["name"] for i in runners_up]})
+
+        eligible[best] = False
+        covered_skills |= np.bincount(
+            matrix.skill_ids[matrix.indptr[best]:matrix.indptr[best + 1]], minlength=len(matrix.skills)
+        ).astype(bool)
+        covered_domains[domain_ids[best]] = True
+
+    return team, ties
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    random.seed(7)
+    domains = ["frontend", "backend", "devops", "ai/ml", "qa"]
+    skills = [f"skill{i}" for i in range(400)] + ["React", "Django", "Docker", "PyTorch", "Selenium"]
+    pool = [
+        {
+            "name": f"candidate{i}",
+            "domain": random.choice(domains),
+            "skills": random.sample(skills, 8),
+            "manager_score": round(random.uniform(2.0, 5.0), 1),
+            "availability": random.random() < 0.8,
+        }
+        for i in range(50_000)
+    ]
+    stack = {"frontend": ["React"], "backend": ["Django"], "devops": ["Docker"]}
+
+    start = time.perf_counter()
+    team, ties = select_team(pool, stack, 5.0, 4.0, {d: d for d in stack}, set(stack))
+    elapsed = time.perf_counter() - start
+    print(f"Selected {len(team)} of {len(pool)} candidates in {elapsed * 1000:.0f} ms ({len(ties)} tie-breaks)")
+    for member in team:
+        print(f"  {member['name']:<16} {member['selection_reason']}")
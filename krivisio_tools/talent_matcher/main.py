@@ -3,13 +3,64 @@
 from krivisio_tools.talent_matcher.core.requirements_extractor import extract_requirements_from_spec
 from krivisio_tools.talent_matcher.core.domain_mapper import map_tech_stack_to_candidate_domains
 from krivisio_tools.talent_matcher.core.candidate_selector import generate_team_selection
+from krivisio_tools.talent_matcher.core.candidate_store import get_candidate_store
+from krivisio_tools.talent_matcher.core.tech_catalog import as_tech_list
 from krivisio_tools.talent_matcher.models.schema import SpecInput, CandidateOutput
-from typing import List
+from krivisio_tools.report_generation.app.core.config import TALENT_SELECTION_MODE, TALENT_STORE_QUERY_LIMIT
+from typing import Dict, List, Optional, Set
 import sys
 import json
 
 
-def run_team_generation(spec_data: dict, candidate_pool: List[dict]) -> List[CandidateOutput]:
+def _stack_technologies(tech_stack: Dict[str, List[str]]) -> List[str]:
+    return list(dict.fromkeys(t for techs in tech_stack.values() for t in as_tech_list(techs)))
+
+
+def _load_pool_candidates(
+    pool_id: str,
+    domains: Set[str],
+    skills: List[str],
+    min_manager_score: Optional[float]
+) -> List[dict]:
+    """
+    Best candidates per requested domain with any of `skills`. A domain
+    where nobody lists one of the skills is filled by manager score alone.
+    """
+    store = get_candidate_store()
+    candidates = []
+    for domain in sorted(domains):
+        found = store.query(
+            pool_id, domains=[domain], skills=skills or None,
+            min_manager_score=min_manager_score, limit=TALENT_STORE_QUERY_LIMIT
+        )
+        if not found and skills:
+            found = store.query(
+                pool_id, domains=[domain], min_manager_score=min_manager_score, limit=TALENT_STORE_QUERY_LIMIT
+            )
+        candidates.extend(found)
+    return candidates
+
+
+def run_team_generation(
+    spec_data: dict,
+    candidate_pool: Optional[List[dict]] = None,
+    selection_mode: str = TALENT_SELECTION_MODE,
+    pool_id: Optional[str] = None,
+    skills: Optional[List[str]] = None,
+    min_manager_score: Optional[float] = None
+) -> List[CandidateOutput]:
+    """
+    Select a team for a spec from an inline candidate list or a stored pool.
+
+    With `pool_id`, only available candidates in the requested domains are
+    loaded from the candidate store, narrowed to `skills` (by default the
+    spec's technologies) and `min_manager_score`, and capped at
+    TALENT_STORE_QUERY_LIMIT per domain, so the cost of a call does not
+    grow with the pool.
+    """
+    if (candidate_pool is None) == (pool_id is None):
+        raise ValueError("Pass either candidate_pool or pool_id.")
+
     # Step 1: Extract requirements from the spec
     requirements = extract_requirements_from_spec(spec_data)
     tech_stack = requirements.get("tech_stack", {})
@@ -23,6 +74,12 @@ def run_team_generation(spec_data: dict, candidate_pool: List[dict]) -> List[Can
         print("[ERROR] No valid domains were found in the tech stack.")
         return []
 
+    if pool_id is not None:
+        candidate_pool = _load_pool_candidates(
+            pool_id, requested_domains, skills or _stack_technologies(tech_stack), min_manager_score
+        )
+        print(f"[Candidate Store] {len(candidate_pool)} candidates from pool '{pool_id}'")
+
     # Step 3: Generate team
     final_team = generate_team_selection(
         candidates=candidate_pool,
@@ -30,7 +87,8 @@ def run_team_generation(spec_data: dict, candidate_pool: List[dict]) -> List[Can
         avg_team_size=avg_team_size,
         manager_score_threshold=manager_score_threshold,
         domain_mapping=domain_mapping,
-        requested_domains=requested_domains
+        requested_domains=requested_domains,
+        selection_mode=selection_mode
     )
 
     return final_team
@@ -17,6 +17,8 @@ class CandidateOutput(BaseModel):
     domain: str
     skills: List[str]
     manager_score: float
+    selection_reason: Optional[str] = None
+    tech_stack_match: Optional[List[str]] = None
 
 
 class TeamSelection(BaseModel):
@@ -0,0 +1,51 @@
+"""Team generation from a stored pool loads a bounded, skill-filtered slice."""
+
+from unittest import mock
+
+from krivisio_tools.talent_matcher import main
+from krivisio_tools.talent_matcher.core.candidate_store import CandidateStore
+
+
+REQUIREMENTS = {
+    "tech_stack": {"frontend": ["React"], "backend": ["Django"]},
+    "avg_team_size": 2.0,
+    "manager_score_threshold": 4.0,
+}
+
+
+def _candidate(i, domain, skills):
+    return {"name": f"c{i}", "domain": domain, "skills": skills, "manager_score": i % 50 / 10, "availability": True}
+
+
+def _run(store, **kwargs):
+    with mock.patch.object(main, "get_candidate_store", return_value=store), \
+            mock.patch.object(main, "extract_requirements_from_spec", return_value=REQUIREMENTS), \
+            mock.patch.object(main, "generate_team_selection", return_value=[]) as select, \
+            mock.patch.object(main, "TALENT_STORE_QUERY_LIMIT", 20), \
+            mock.patch.object(store, "query", wraps=store.query) as query:
+        main.run_team_generation({}, pool_id="acme", **kwargs)
+    return select.call_args.kwargs["candidates"], query
+
+
+def test_pool_query_defaults_to_spec_technologies_and_is_capped(tmp_path):
+    store = CandidateStore(str(tmp_path / "candidates.sqlite3"))
+    store.upsert("acme", [_candidate(i, "frontend", ["React"] if i % 10 == 0 else ["Vue"]) for i in range(300)])
+    store.upsert("acme", [_candidate(i, "backend", ["Django"]) for i in range(300, 600)])
+
+    loaded, query = _run(store)
+
+    assert all(call.kwargs["skills"] == ["React", "Django"] for call in query.call_args_list)
+    assert all(call.kwargs["limit"] == 20 for call in query.call_args_list)
+    frontend = [c for c in loaded if c["domain"] == "frontend"]
+    assert len(frontend) == 20 and all(c["skills"] == ["React"] for c in frontend)
+    assert len(loaded) == 40
+
+
+def test_domain_without_skill_matches_falls_back_to_manager_score(tmp_path):
+    store = CandidateStore(str(tmp_path / "candidates.sqlite3"))
+    store.upsert("acme", [_candidate(i, "frontend", ["Vue"]) for i in range(30)])
+
+    loaded, _ = _run(store, skills=["Django"])
+
+    assert len(loaded) == 20
+    assert [c["manager_score"] for c in loaded] == sorted((c["manager_score"] for c in loaded), reverse=True)
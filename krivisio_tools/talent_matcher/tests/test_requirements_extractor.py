@@ -0,0 +1,61 @@
+"""Local requirement extraction from structured specs, and the spec-hash cache."""
+
+import json
+from unittest import mock
+
+import pytest
+
+from krivisio_tools.project_structure_generator.services.cache_service import LRUCache
+from krivisio_tools.talent_matcher.core import requirements_extractor as extractor
+
+
+@pytest.mark.parametrize("value, expected", [
+    (4, 4.0),
+    ({"frontend": 2, "backend": 3}, 5.0),
+    ({"min": 4, "max": 6}, 5.0),
+    ("5 developers, 2 QA", 7.0),
+    ("4-6", 5.0),
+    ("4 to 6 engineers", 5.0),
+    ("about 5 people", 5.0),
+    ("team of 5 for 6 months", None),
+    ({"size": 5, "note": "flexible"}, None),
+    (True, None),
+    (0, None),
+])
+def test_parse_team_size(value, expected):
+    assert extractor._parse_team_size(value) == expected
+
+
+def test_flat_technology_list_is_grouped_by_domain():
+    requirements = extractor.extract_requirements_locally({
+        "technical_architecture": {"tech_stack": ["React", "Django", "PostgreSQL"], "team_size": "3-5"}
+    })
+    assert requirements["avg_team_size"] == 4.0
+    assert "React" in requirements["tech_stack"]["frontend"]
+    assert "Django" in requirements["tech_stack"]["backend"]
+
+
+def test_domain_technology_entries_are_read():
+    requirements = extractor.extract_requirements_locally({
+        "technology_stack": [
+            {"domain": "frontend", "technologies": ["React", "TypeScript"]},
+            {"layer": "devops", "tools": "Docker; Kubernetes"},
+        ],
+        "team size": {"frontend": 2, "devops": 1},
+        "manager_score_threshold": 3.5,
+    })
+    assert requirements == {
+        "tech_stack": {"frontend": ["React", "TypeScript"], "devops": ["Docker", "Kubernetes"]},
+        "avg_team_size": 3.0,
+        "manager_score_threshold": 3.5,
+    }
+
+
+def test_free_form_spec_is_extracted_once_then_served_from_cache():
+    spec = {"overview": "A marketplace for handmade goods, built by a small team."}
+    reply = {"tech_stack": {"frontend": ["Vue"]}, "avg_team_size": 3, "manager_score_threshold": 4.0}
+    with mock.patch.object(extractor, "get_cache_backend", return_value=LRUCache()), \
+            mock.patch.object(extractor, "chat_with_llm", return_value=json.dumps(reply)) as llm:
+        assert extractor.extract_requirements_from_spec(spec) == reply
+        assert extractor.extract_requirements_from_spec(spec) == reply
+    llm.assert_called_once()
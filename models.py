@@ -1,4 +1,4 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from pydantic import BaseModel, Field, root_validator
 
 
@@ -36,12 +36,17 @@ class DocumentGenerationInput(BaseModel):
 
     Attributes:
         module (str): The module type (e.g., 'onboarding').
-        doc_type (str): The specific document type (e.g., 'proposal').
+        doc_type (str): The specific document type (e.g., 'proposal', 'quotation').
         input_data (dict): The input data to render the template.
+        project (str, optional): Project ID; when set the document is stored and
+            can be fetched later through the `documents://{id}` resource.
+        inline (bool): Whether to return the document content in the response.
     """
     module: str = Field(..., description="Document module (e.g., 'onboarding')")
-    doc_type: str = Field(..., description="Document type to generate (e.g., 'proposal')")
+    doc_type: str = Field(..., description="Document type to generate (e.g., 'proposal', 'quotation')")
     input_data: Dict[str, Any] = Field(..., description="Input data for the selected document template")
+    project: Optional[str] = Field(None, description="Project ID used to store the generated document")
+    inline: bool = Field(True, description="Return the document content inline (set False to fetch it by ID)")
 
 
 class DocumentGenerationOutput(BaseModel):
@@ -49,9 +54,13 @@ class DocumentGenerationOutput(BaseModel):
     Response model for the document generation tool.
 
     Attributes:
-        document (str): The rendered document content.
+        document (str): The rendered document content (empty when not inline).
+        document_id (str, optional): ID of the stored document.
+        resource_uri (str, optional): MCP resource URI of the stored document.
     """
     document: str
+    document_id: Optional[str] = None
+    resource_uri: Optional[str] = None
 
 # ----------------------------- Talent Matcher Tool -----------------------------
 
@@ -61,10 +70,16 @@ class TalentMatchInput(BaseModel):
 
     Attributes:
         specsheet (dict): Project specification input.
-        candidates (list): List of available candidate profiles.
+        candidates (list, optional): List of available candidate profiles.
+        pool_id (str, optional): Stored candidate pool to match against instead of `candidates`.
+        skills (list, optional): Only consider pool candidates with any of these skills.
+        min_manager_score (float, optional): Only consider pool candidates at or above this score.
     """
     specsheet: Dict[str, Any] = Field(..., description="Project spec with requirements, e.g. tech stack, etc.")
-    candidates: List[Dict[str, Any]] = Field(..., description="List of candidate dictionaries")
+    candidates: Optional[List[Dict[str, Any]]] = Field(None, description="List of candidate dictionaries")
+    pool_id: Optional[str] = Field(None, description="Candidate pool stored with candidate_pool_upsert.")
+    skills: Optional[List[str]] = Field(None, description="Pool filter: candidates with any of these skills.")
+    min_manager_score: Optional[float] = Field(None, description="Pool filter: minimum manager score.")
 
 
 class TalentMatchOutput(BaseModel):
@@ -86,11 +101,19 @@ class StructureGenerationInput(BaseModel):
         description (str): Short project description.
         tech_stack (list): List of technologies used.
         preferences (dict): Structure preferences.
+        previous_structure (dict, optional): Earlier result to update instead of regenerating.
+        added_features (list): Features added since `previous_structure`.
+        removed_features (list): Features removed since `previous_structure`.
     """
     description: str = Field(..., description="Brief project description.")
     features: List[str] = Field(..., description="List of project features.")
     tech_stack: List[str] = Field(..., description="List of technologies, e.g., ['react', 'node']")
     preferences: Dict[str, Any] = Field(..., description="Folder structure preferences")
+    previous_structure: Optional[Dict[str, Any]] = Field(
+        None, description="Previously generated structure; with added/removed features, only a patch is generated."
+    )
+    added_features: List[str] = Field(default_factory=list, description="Features added since previous_structure.")
+    removed_features: List[str] = Field(default_factory=list, description="Features removed since previous_structure.")
 
 
 class StructureGenerationOutput(BaseModel):
@@ -13,16 +13,22 @@ Each tool follows a structured contract and can be extended independently.
 Author: Aayush Gid
 """
 
-from typing import Dict, Any, List
+import base64
+from typing import Dict, Any, List, Optional
 
 from mcp.server.fastmcp import FastMCP
 from pydantic import BaseModel, Field
 
 from krivisio_tools.project_evaluation.main import run_estimation
-from krivisio_tools.report_generation.app.main import run_generation
+from krivisio_tools.report_generation.app.main import run_generation, run_bundle_generation
+from krivisio_tools.report_generation.app.services.export_service import export_document_async
+from krivisio_tools.report_generation.app.services.document_service import save_document, get_document
 from krivisio_tools.talent_matcher.main import run_team_generation  # ✅ Import your core logic
+from krivisio_tools.talent_matcher.core.candidate_store import get_candidate_store
 from krivisio_tools.project_structure_generator.models.preferences import ProjectPreferences
-from krivisio_tools.project_structure_generator.core.agent import run_structure_generation_agent
+from krivisio_tools.project_structure_generator.core.agent import run_structure_generation_agent, run_structure_update_agent
+from krivisio_tools.project_structure_generator.utils.archive_export import export_archive
+from krivisio_tools.project_structure_generator.services.validation_service import is_valid_structure
 from krivisio_tools.github.main import handle_github_action
 from krivisio_tools.side_tools.main import run_tool  
 
@@ -91,12 +97,17 @@ class DocumentGenerationInput(BaseModel):
 
     Attributes:
         module (str): The module type (e.g., 'onboarding').
-        doc_type (str): The specific document type (e.g., 'proposal').
+        doc_type (str): The specific document type (e.g., 'proposal', 'quotation').
         input_data (dict): The input data to render the template.
+        project (str, optional): Project ID; when set the document is stored and
+            can be fetched later through the `documents://{id}` resource.
+        inline (bool): Whether to return the document content in the response.
     """
     module: str = Field(..., description="Document module (e.g., 'onboarding')")
-    doc_type: str = Field(..., description="Document type to generate (e.g., 'proposal')")
+    doc_type: str = Field(..., description="Document type to generate (e.g., 'proposal', 'quotation')")
     input_data: Dict[str, Any] = Field(..., description="Input data for the selected document template")
+    project: Optional[str] = Field(None, description="Project ID used to store the generated document")
+    inline: bool = Field(True, description="Return the document content inline (set False to fetch it by ID)")
 
 
 class DocumentGenerationOutput(BaseModel):
@@ -104,9 +115,13 @@ class DocumentGenerationOutput(BaseModel):
     Response model for the document generation tool.
 
     Attributes:
-        document (str): The rendered document content.
+        document (str): The rendered document content (empty when not inline).
+        document_id (str, optional): ID of the stored document.
+        resource_uri (str, optional): MCP resource URI of the stored document.
     """
     document: str
+    document_id: Optional[str] = None
+    resource_uri: Optional[str] = None
 
 
 @mcp.tool(description="Generate documents such as proposals using LLMs and pre-defined templates.")
@@ -130,13 +145,161 @@ def document_generation(input_data: DocumentGenerationInput) -> DocumentGenerati
             doc_type=input_data.doc_type,
             input_data=input_data.input_data
         )
-        return DocumentGenerationOutput(document=result)
+        if not input_data.project:
+            return DocumentGenerationOutput(document=result)
+
+        record = save_document(input_data.project, input_data.module, input_data.doc_type, result)
+        return DocumentGenerationOutput(
+            document=result if input_data.inline else "",
+            document_id=record["id"],
+            resource_uri=record["uri"]
+        )
     except ValueError as ve:
         raise ValueError(f"Invalid input: {ve}")
     except Exception as e:
         raise RuntimeError(f"Document generation failed: {e}")
 
 
+class DocumentBundleInput(BaseModel):
+    """
+    Request model for multi-document bundle generation.
+
+    Attributes:
+        module (str): The module type (e.g., 'onboarding').
+        doc_types (list): Document types to generate; all supported types if omitted.
+        input_data (dict): Project input shared by every document.
+        project (str, optional): Project ID; when set every document is stored.
+        inline (bool): Whether to return document contents in the response.
+    """
+    module: str = Field("onboarding", description="Document module (e.g., 'onboarding')")
+    doc_types: Optional[List[str]] = Field(None, description="Document types, e.g. ['proposal', 'quotation', 'contract']")
+    input_data: Dict[str, Any] = Field(..., description="Project input shared by all documents")
+    project: Optional[str] = Field(None, description="Project ID used to store the generated documents")
+    inline: bool = Field(True, description="Return document contents inline (set False to fetch them by ID)")
+
+
+class DocumentBundleOutput(BaseModel):
+    """
+    Response model for bundle generation.
+
+    Attributes:
+        documents (dict): Generated documents keyed by document type (empty when not inline).
+        document_ids (dict): Stored document IDs keyed by document type.
+    """
+    documents: Dict[str, str]
+    document_ids: Dict[str, str] = {}
+
+
+@mcp.tool(description="Generate several onboarding documents (proposal, quotation, contract) from one shared project analysis.")
+def document_bundle_generation(input_data: DocumentBundleInput) -> DocumentBundleOutput:
+    """
+    Generate a bundle of documents for one project in a single call.
+
+    Args:
+        input_data (DocumentBundleInput): Module, document types and project input.
+
+    Returns:
+        DocumentBundleOutput: Generated documents keyed by type.
+
+    Raises:
+        ValueError: If the module or a doc_type is unsupported.
+        RuntimeError: If generation fails internally.
+    """
+    try:
+        documents = run_bundle_generation(
+            module=input_data.module,
+            input_data=input_data.input_data,
+            doc_types=input_data.doc_types
+        )
+        if not input_data.project:
+            return DocumentBundleOutput(documents=documents)
+
+        document_ids = {
+            doc_type: save_document(input_data.project, input_data.module, doc_type, content)["id"]
+            for doc_type, content in documents.items()
+        }
+        return DocumentBundleOutput(
+            documents=documents if input_data.inline else {},
+            document_ids=document_ids
+        )
+    except ValueError as ve:
+        raise ValueError(f"Invalid input: {ve}")
+    except Exception as e:
+        raise RuntimeError(f"Bundle generation failed: {e}")
+
+
+class DocumentExportInput(BaseModel):
+    """
+    Request model for exporting a generated document.
+
+    Attributes:
+        document (str): Markdown content returned by a generation tool.
+        format (str): Target format, 'pdf' or 'docx'.
+    """
+    document: str = Field(..., description="Markdown document to export")
+    format: str = Field("pdf", description="Export format: 'pdf' or 'docx'")
+
+
+class DocumentExportOutput(BaseModel):
+    """
+    Response model for document export.
+
+    Attributes:
+        format (str): Export format.
+        content_hash (str): Hash identifying the exported file.
+        content_base64 (str): Exported file, base64-encoded.
+        pages (int | None): Page count for PDF exports.
+        cached (bool): Whether the file was served from the export cache.
+    """
+    format: str
+    content_hash: str
+    content_base64: str
+    pages: Optional[int] = None
+    cached: bool
+
+
+@mcp.tool(description="Export a generated Markdown document to PDF or DOCX.")
+async def document_export(input_data: DocumentExportInput) -> DocumentExportOutput:
+    """
+    Convert a document off the event loop, reusing cached exports.
+
+    Args:
+        input_data (DocumentExportInput): Markdown content and target format.
+
+    Returns:
+        DocumentExportOutput: The exported file and its metadata.
+
+    Raises:
+        ValueError: If the format is unsupported.
+        RuntimeError: If conversion fails.
+    """
+    try:
+        result = await export_document_async(input_data.document, input_data.format)
+        return DocumentExportOutput(
+            format=result["format"],
+            content_hash=result["content_hash"],
+            content_base64=base64.b64encode(result["content"]).decode("ascii"),
+            pages=result["pages"],
+            cached=result["cached"]
+        )
+    except ValueError as ve:
+        raise ValueError(f"Invalid input: {ve}")
+    except Exception as e:
+        raise RuntimeError(f"Document export failed: {e}")
+
+
+@mcp.resource("documents://{doc_id}", mime_type="text/markdown")
+def document_resource(doc_id: str) -> str:
+    """Full content of a stored document."""
+    return get_document(doc_id)["content"]
+
+
+@mcp.resource("documents://{doc_id}/pages/{page}", mime_type="text/markdown")
+def document_page_resource(doc_id: str, page: str) -> str:
+    """One page of a stored document; pages are zero-based."""
+    return get_document(doc_id, page=int(page))["content"]
+
+
 # ----------------------------- Talent Matcher Tool -----------------------------
 
 class TalentMatchInput(BaseModel):
@@ -145,10 +308,16 @@ class TalentMatchInput(BaseModel):
 
     Attributes:
         specsheet (dict): Project specification input.
-        candidates (list): List of available candidate profiles.
+        candidates (list, optional): List of available candidate profiles.
+        pool_id (str, optional): Stored candidate pool to match against instead of `candidates`.
+        skills (list, optional): Only consider pool candidates with any of these skills.
+        min_manager_score (float, optional): Only consider pool candidates at or above this score.
     """
     specsheet: Dict[str, Any] = Field(..., description="Project spec with requirements, e.g. tech stack, etc.")
-    candidates: List[Dict[str, Any]] = Field(..., description="List of candidate dictionaries")
+    candidates: Optional[List[Dict[str, Any]]] = Field(None, description="List of candidate dictionaries")
+    pool_id: Optional[str] = Field(None, description="Candidate pool stored with candidate_pool_upsert.")
+    skills: Optional[List[str]] = Field(None, description="Pool filter: candidates with any of these skills.")
+    min_manager_score: Optional[float] = Field(None, description="Pool filter: minimum manager score.")
 
 
 class TalentMatchOutput(BaseModel):
@@ -173,7 +342,13 @@ def match_talent(input_data: TalentMatchInput) -> TalentMatchOutput:
         TalentMatchOutput: List of selected candidate dicts.
     """
     try:
-        team = run_team_generation(spec_data=input_data.specsheet, candidate_pool=input_data.candidates)
+        team = run_team_generation(
+            spec_data=input_data.specsheet,
+            candidate_pool=input_data.candidates,
+            pool_id=input_data.pool_id,
+            skills=input_data.skills,
+            min_manager_score=input_data.min_manager_score
+        )
         return TalentMatchOutput(
             selected_team=[member.dict() for member in team]
         )
@@ -181,6 +356,76 @@ def match_talent(input_data: TalentMatchInput) -> TalentMatchOutput:
         raise RuntimeError(f"Talent matching failed: {e}")
 
 
+class CandidatePoolUpsertInput(BaseModel):
+    """
+    Input model for updating a stored candidate pool.
+
+    Attributes:
+        pool_id (str): Pool identifier.
+        candidates (list): Candidates to insert or update, matched by name.
+        remove (list): Names of candidates to delete.
+    """
+    pool_id: str = Field(..., description="Pool identifier, e.g. 'acme-engineering'.")
+    candidates: List[Dict[str, Any]] = Field(
+        default_factory=list,
+        description="Candidates with name, domain, skills, manager_score and availability."
+    )
+    remove: List[str] = Field(default_factory=list, description="Names of candidates to delete.")
+
+
+class CandidatePoolUpsertOutput(BaseModel):
+    """
+    Output model for candidate pool updates.
+
+    Attributes:
+        pool_id (str): Pool identifier.
+        inserted (int): New candidates.
+        updated (int): Changed candidates.
+        unchanged (int): Candidates sent again without changes.
+        removed (int): Deleted candidates.
+        total (int): Candidates in the pool.
+        available (int): Available candidates in the pool.
+    """
+    pool_id: str
+    inserted: int
+    updated: int
+    unchanged: int
+    removed: int
+    total: int
+    available: int
+
+
+@mcp.tool(description="Add, update or remove candidates in a stored pool used by match_talent.")
+def candidate_pool_upsert(input_data: CandidatePoolUpsertInput) -> CandidatePoolUpsertOutput:
+    """
+    Incrementally update a candidate pool; only changed candidates are rewritten.
+
+    Args:
+        input_data (CandidatePoolUpsertInput): Pool ID, candidates and removals.
+
+    Returns:
+        CandidatePoolUpsertOutput: Change counts and pool size.
+
+    Raises:
+        ValueError: If a candidate misses a required field.
+        RuntimeError: If the update fails.
+    """
+    try:
+        store = get_candidate_store()
+        counts = store.upsert(input_data.pool_id, input_data.candidates)
+        removed = store.remove(input_data.pool_id, input_data.remove)
+        return CandidatePoolUpsertOutput(
+            pool_id=input_data.pool_id,
+            removed=removed,
+            **counts,
+            **store.pool_stats(input_data.pool_id)
+        )
+    except ValueError as ve:
+        raise ValueError(f"Invalid input: {ve}")
+    except Exception as e:
+        raise RuntimeError(f"Candidate pool update failed: {e}")
+
+
 class StructureGenerationInput(BaseModel):
     """
     Input model for folder structure generation tool.
@@ -189,11 +434,19 @@ class StructureGenerationInput(BaseModel):
         description (str): Short project description.
         tech_stack (list): List of technologies used.
         preferences (dict): Structure preferences.
+        previous_structure (dict, optional): Earlier result to update instead of regenerating.
+        added_features (list): Features added since `previous_structure`.
+        removed_features (list): Features removed since `previous_structure`.
     """
     description: str = Field(..., description="Brief project description.")
     features: List[str] = Field(..., description="List of project features.")
     tech_stack: List[str] = Field(..., description="List of technologies, e.g., ['react', 'node']")
     preferences: Dict[str, Any] = Field(..., description="Folder structure preferences")
+    previous_structure: Optional[Dict[str, Any]] = Field(
+        None, description="Previously generated structure; with added/removed features, only a patch is generated."
+    )
+    added_features: List[str] = Field(default_factory=list, description="Features added since previous_structure.")
+    removed_features: List[str] = Field(default_factory=list, description="Features removed since previous_structure.")
 
 
 class StructureGenerationOutput(BaseModel):
@@ -220,12 +473,24 @@ def folder_structure_generation(input_data: StructureGenerationInput) -> Structu
         # Convert dict to ProjectPreferences dataclass
         preferences = ProjectPreferences(**input_data.preferences)
 
-        structure = run_structure_generation_agent(
-            input_data.description,
-            input_data.features,
-            input_data.tech_stack,
-            preferences
-        )
+        if input_data.previous_structure:
+            # Feature change on an existing project: patch instead of regenerating
+            structure = run_structure_update_agent(
+                input_data.description,
+                input_data.features,
+                input_data.tech_stack,
+                preferences,
+                input_data.previous_structure,
+                input_data.added_features,
+                input_data.removed_features
+            )
+        else:
+            structure = run_structure_generation_agent(
+                input_data.description,
+                input_data.features,
+                input_data.tech_stack,
+                preferences
+            )
 
         return StructureGenerationOutput(structure=structure)
 
@@ -233,6 +498,67 @@ def folder_structure_generation(input_data: StructureGenerationInput) -> Structu
         raise RuntimeError(f"Folder structure generation failed: {e}")
 
 
+class StructureArchiveInput(BaseModel):
+    """
+    Input model for exporting a folder structure as an archive.
+
+    Attributes:
+        structure (dict): Folder structure tree (name/type/children).
+        format (str): Archive format, 'zip', 'tar' or 'tar.gz'.
+        include_placeholders (bool): Fill known file types with placeholder content.
+    """
+    structure: Dict[str, Any] = Field(..., description="Folder structure returned by folder_structure_generation.")
+    format: str = Field("zip", description="Archive format: 'zip', 'tar' or 'tar.gz'")
+    include_placeholders: bool = Field(True, description="Fill README, .gitignore, source files etc. with placeholders.")
+
+
+class StructureArchiveOutput(BaseModel):
+    """
+    Output model for folder structure archive export.
+
+    Attributes:
+        format (str): Archive format.
+        filename (str): Suggested file name.
+        content_base64 (str): Archive, base64-encoded.
+        size_bytes (int): Archive size.
+    """
+    format: str
+    filename: str
+    content_base64: str
+    size_bytes: int
+
+
+@mcp.tool(description="Export a folder structure as a downloadable zip or tar archive.")
+def structure_archive_export(input_data: StructureArchiveInput) -> StructureArchiveOutput:
+    """
+    Build the archive in memory, without creating the structure on disk.
+
+    Args:
+        input_data (StructureArchiveInput): Structure and archive options.
+
+    Returns:
+        StructureArchiveOutput: The archive and its metadata.
+
+    Raises:
+        ValueError: If the structure is invalid or the format is unsupported.
+        RuntimeError: If the export fails.
+    """
+    try:
+        if not is_valid_structure(input_data.structure) or input_data.structure["type"] != "folder":
+            raise ValueError("structure must be a folder tree of name/type/children nodes")
+        content = export_archive(input_data.structure, input_data.format, input_data.include_placeholders)
+        return StructureArchiveOutput(
+            format=input_data.format,
+            filename=f"{input_data.structure['name']}.{input_data.format}",
+            content_base64=base64.b64encode(content).decode("ascii"),
+            size_bytes=len(content)
+        )
+    except ValueError as ve:
+        raise ValueError(f"Invalid input: {ve}")
+    except Exception as e:
+        raise RuntimeError(f"Structure archive export failed: {e}")
+
+
 
 class GitHubToolInput(BaseModel):
     """